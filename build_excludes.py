@@ -0,0 +1,40 @@
+"""
+Modules left out of every FluoroSpot bundle, shared by the build scripts
+and pyinstaller.spec so the lists can't drift apart.
+"""
+
+# Modules PyInstaller would otherwise drag into the bundle even though the
+# app never imports them. unittest and pandas.io.sql/html/xml/plotting are
+# imported by numpy/pandas at import time, so they have to stay.
+EXCLUDED_MODULES = [
+  "matplotlib",
+  "PIL",
+  "IPython",
+  "jupyter",
+  "notebook",
+  "sphinx",
+  "pytest",
+  "_pytest",
+  "setuptools",
+  "pip",
+  "wheel",
+  "pydoc_data",
+  "sqlite3",
+  "xmlrpc",
+  "tkinter.test",
+  "numpy.tests",
+  "pandas.tests",
+  "scipy.tests",
+  "scipy.io.matlab.tests",
+  "scipy.sparse.linalg._eigen.arpack.tests",
+  "scipy.spatial.tests",
+  "scipy.stats.tests",
+  # SciPy subpackages that scipy.stats does not import
+  "scipy.cluster",
+  "scipy.datasets",
+  "scipy.fftpack",
+  "scipy.io",
+  "scipy.misc",
+  "scipy.odr",
+  "scipy.signal",
+]
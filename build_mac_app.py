@@ -4,12 +4,26 @@ Build script for creating a Mac app bundle for FluoroSpot Analysis Tool.
 This script uses PyInstaller to create a standalone .app bundle.
 """
 
+import hashlib
 import subprocess
 import sys
 import os
 import shutil
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from build_excludes import EXCLUDED_MODULES
+
+# Absolute paths are needed because --specpath moves PyInstaller's notion of
+# the working directory for relative --icon/--add-data arguments.
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Live outside build/ so clean_build() doesn't throw them away
+REQUIREMENTS_MARKER = Path(".build_cache/requirements.sha256")
+WHEEL_CACHE = Path(".build_cache/wheels")
+
 def check_dependencies():
   """Check if required build dependencies are installed."""
   try:
@@ -17,16 +31,46 @@ def check_dependencies():
     print(f"✅ PyInstaller found: {PyInstaller.__version__}")
   except ImportError:
     print("❌ PyInstaller not found. Installing...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller>=6.6"])
+  
+  # Ensure project dependencies are installed, skipping pip entirely when
+  # requirements.txt hasn't changed since the last successful install
+  requirements_hash = hashlib.sha256(
+    Path("requirements.txt").read_bytes() + sys.executable.encode()
+  ).hexdigest()
+  if REQUIREMENTS_MARKER.exists() and REQUIREMENTS_MARKER.read_text().strip() == requirements_hash:
+    print("✅ Project dependencies up to date")
+    return
   
-  # Ensure project dependencies are installed
   print("📦 Installing project dependencies...")
-  subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+  offline_install = [
+    sys.executable, "-m", "pip", "install",
+    "--no-index", "--find-links", str(WHEEL_CACHE),
+    "--prefer-binary", "-r", "requirements.txt"
+  ]
+  # Install from the local wheel cache when it already has everything;
+  # otherwise download the missing wheels once and install from the cache
+  if subprocess.run(offline_install, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode != 0:
+    print("  Populating local wheel cache...")
+    subprocess.check_call([
+      sys.executable, "-m", "pip", "download",
+      "--prefer-binary", "-d", str(WHEEL_CACHE), "-r", "requirements.txt"
+    ])
+    subprocess.check_call(offline_install)
+  REQUIREMENTS_MARKER.parent.mkdir(exist_ok=True)
+  REQUIREMENTS_MARKER.write_text(requirements_hash)
 
-def clean_build():
-  """Clean previous build artifacts."""
+def clean_build(full=False):
+  """Clean previous build artifacts.
+  
+  PyInstaller's per-architecture work directories under build/ are kept
+  unless ``full`` is set, so unchanged analysis stages are reused by the
+  next build.
+  """
   print("🧹 Cleaning previous build artifacts...")
-  paths_to_clean = ["build", "dist", "*.spec"]
+  paths_to_clean = ["dist", "*.spec"]
+  if full:
+    paths_to_clean.insert(0, "build")
   for path in paths_to_clean:
     if os.path.exists(path):
       if os.path.isdir(path):
@@ -35,12 +79,41 @@ def clean_build():
         os.remove(path)
       print(f"  Removed: {path}")
 
-def create_app_bundle(target_arch="arm64"):
-  """Create the Mac app bundle using PyInstaller."""
-  arch_name = "Apple-Silicon" if target_arch == "arm64" else "Intel"
+def run_pyinstaller(cmd, log_path, target_arch):
+  """Run a PyInstaller command, streaming its output to ``log_path``.
+  
+  Each architecture gets its own PyInstaller cache directory so concurrent
+  builds don't race on the shared cache of processed binaries.
+  """
+  log_path.parent.mkdir(parents=True, exist_ok=True)
+  env = dict(os.environ, PYINSTALLER_CONFIG_DIR=str(Path(f".build_cache/pyinstaller-{target_arch}").resolve()))
+  with open(log_path, "w") as log_file:
+    subprocess.run(cmd, check=True, stdout=log_file, stderr=subprocess.STDOUT, env=env)
+
+def print_log_tail(log_path, lines=40):
+  """Print the last ``lines`` lines of a build log."""
+  try:
+    with open(log_path, errors="replace") as log_file:
+      tail = deque(log_file, maxlen=lines)
+  except OSError:
+    return
+  print(f"--- last {len(tail)} lines of {log_path} ---")
+  print("".join(tail), end="")
+
+def create_app_bundle(target_arch="arm64", arch_display=None):
+  """Create the Mac app bundle using PyInstaller.
+
+  Each architecture gets its own work/spec directory so that several builds
+  can run side by side without clobbering each other's intermediate files.
+  """
+  arch_name = {"arm64": "Apple-Silicon", "universal2": "Universal"}.get(target_arch, "Intel")
   print(f"🔨 Building Mac app bundle for {arch_name} ({target_arch})...")
   
-  app_name = f"FluoroSpot Analysis {arch_name}"
+  # A universal2 bundle runs everywhere, so it gets the plain product name
+  if target_arch == "universal2":
+    app_name = "FluoroSpot Analysis"
+  else:
+    app_name = f"FluoroSpot Analysis {arch_name}"
   
   # Check PyInstaller version and system architecture
   import platform
@@ -53,21 +126,27 @@ def create_app_bundle(target_arch="arm64"):
     sys.executable, "-m", "PyInstaller",
     "--onedir",  # Create a directory instead of a single file for better performance
     "--windowed",  # No console window
+    "--strip",  # Strip debug symbols from collected binaries
+    "--noupx",  # UPX breaks macOS binaries; never compress them
+    "--optimize=2",  # Byte-compile with -OO (no docstrings/asserts)
+    "--noconfirm",  # Reuse build/{arch} without prompting
     "--name", app_name,
-    "--icon=build_resources/app_icon.icns",  # We'll create this
-    "--add-data=gui/resources:fluorospot/gui/resources",
-    "--add-data=config.yaml:fluorospot",
+    "--distpath", "dist",
+    "--workpath", f"build/{target_arch}",
+    "--specpath", f"build/{target_arch}",
+    f"--icon={PROJECT_ROOT / 'build_resources' / 'app_icon.icns'}",  # We'll create this
+    f"--add-data={PROJECT_ROOT / 'gui' / 'resources'}:fluorospot/gui/resources",
+    f"--add-data={PROJECT_ROOT / 'config.yaml'}:fluorospot",
     "--hidden-import=tkinter",
     "--hidden-import=tkinter.ttk",
     "--hidden-import=tkinter.filedialog",
     "--hidden-import=tkinter.messagebox",
     "--hidden-import=pandas",
     "--hidden-import=numpy",
-    "--hidden-import=scipy",
+    "--hidden-import=scipy.stats",
     "--hidden-import=openpyxl",
     "--hidden-import=yaml",
-    "--exclude-module=matplotlib",  # Exclude if not needed to reduce size
-    "--exclude-module=PIL",
+    *(f"--exclude-module={module}" for module in EXCLUDED_MODULES),
     "--osx-bundle-identifier=org.iedb.fluorospot",
     "launch_gui.py"
   ]
@@ -81,30 +160,31 @@ def create_app_bundle(target_arch="arm64"):
   else:
     print(f"  Native compilation for {current_arch}")
   
+  log_path = Path(f"build/{target_arch}/pyinstaller.log")
+  
   try:
-    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    run_pyinstaller(cmd, log_path, target_arch)
     print(f"✅ {arch_name} app bundle created successfully!")
-    return True, app_name
+    return True, app_name, arch_display
   except subprocess.CalledProcessError as e:
     print(f"❌ {arch_name} build failed: {e}")
-    print(f"stdout: {e.stdout}")
-    print(f"stderr: {e.stderr}")
+    print_log_tail(log_path)
     
-    # If cross-compilation failed, try without target-arch flag
-    if target_arch != current_arch and "--target-arch" in cmd:
+    # If cross-compilation failed, try without target-arch flag (a native
+    # fallback is not a substitute for a universal2 bundle)
+    if target_arch not in (current_arch, "universal2") and "--target-arch" in cmd:
       print(f"  Retrying {arch_name} build without cross-compilation...")
       cmd_fallback = [arg for arg in cmd if arg not in ["--target-arch", target_arch]]
       
       try:
-        result = subprocess.run(cmd_fallback, check=True, capture_output=True, text=True)
+        run_pyinstaller(cmd_fallback, log_path, target_arch)
         print(f"✅ {arch_name} app bundle created successfully (fallback)!")
-        return True, app_name
+        return True, app_name, arch_display
       except subprocess.CalledProcessError as e2:
         print(f"❌ {arch_name} fallback build also failed: {e2}")
-        print(f"stdout: {e2.stdout}")
-        print(f"stderr: {e2.stderr}")
+        print_log_tail(log_path)
     
-    return False, None
+    return False, None, arch_display
 
 def create_dmg(app_name):
   """Create a DMG file for distribution."""
@@ -113,9 +193,7 @@ def create_dmg(app_name):
   dmg_name = f"{app_name.replace(' ', '_')}.dmg"
   
   # Check if create-dmg is available (install with: brew install create-dmg)
-  try:
-    subprocess.check_output(["which", "create-dmg"])
-  except subprocess.CalledProcessError:
+  if shutil.which("create-dmg") is None:
     print("⚠️  create-dmg not found. Install with: brew install create-dmg")
     print("   Creating basic DMG instead...")
     return create_basic_dmg(app_name, dmg_name)
@@ -147,23 +225,40 @@ def create_basic_dmg(app_name, dmg_name):
   """Create a basic DMG file using hdiutil."""
   print(f"📀 Creating basic DMG for {app_name}...")
   
-  # Create temporary directory for DMG contents
-  temp_dir = "temp_dmg"
+  # Create temporary directory for DMG contents (one per app so that
+  # architectures can be packaged concurrently)
+  temp_dir = f"temp_dmg_{app_name.replace(' ', '_')}"
   os.makedirs(temp_dir, exist_ok=True)
   
   try:
-    # Copy app to temp directory
-    shutil.copytree(f"dist/{app_name}.app", f"{temp_dir}/{app_name}.app")
+    # Stage the app without copying its bytes; hdiutil stores symlinks as
+    # links, so a symlinked .app would not work here. On APFS, cp -c clones
+    # every file (clonefile); elsewhere fall back to hard links. Symlinks
+    # inside the bundle (framework layout) are kept as symlinks either way.
+    staged_app = f"{temp_dir}/{app_name}.app"
+    clone = subprocess.run(
+      ["cp", "-cR", f"dist/{app_name}.app", staged_app],
+      stderr=subprocess.DEVNULL
+    )
+    if clone.returncode != 0:
+      if os.path.exists(staged_app):
+        shutil.rmtree(staged_app)
+      shutil.copytree(
+        f"dist/{app_name}.app", staged_app,
+        symlinks=True, copy_function=os.link
+      )
     
     # Create alias to Applications folder
-    subprocess.run([
-      "ln", "-sf", "/Applications", f"{temp_dir}/Applications"
-    ], check=True)
+    applications_link = f"{temp_dir}/Applications"
+    if os.path.lexists(applications_link):
+      os.remove(applications_link)
+    os.symlink("/Applications", applications_link)
     
     # Create DMG
     subprocess.run([
       "hdiutil", "create", "-volname", app_name,
-      "-srcfolder", temp_dir, "-ov", "-format", "UDZO",
+      "-srcfolder", temp_dir, "-ov",
+      "-fs", "APFS", "-format", "ULFO",  # LZFSE compression, macOS 10.13+
       dmg_name
     ], check=True)
     
@@ -173,7 +268,7 @@ def create_basic_dmg(app_name, dmg_name):
     print(f"✅ Basic DMG created: {dmg_name}")
     return True, dmg_name
     
-  except subprocess.CalledProcessError as e:
+  except (subprocess.CalledProcessError, OSError) as e:
     print(f"❌ Basic DMG creation failed: {e}")
     # Clean up on failure
     if os.path.exists(temp_dir):
@@ -187,22 +282,45 @@ def create_zip_distribution(app_name):
   zip_name = f"{app_name.replace(' ', '_')}_Mac.zip"
   
   try:
-    # Create zip file
-    subprocess.run([
-      "zip", "-r", zip_name, f"dist/{app_name}.app"
-    ], check=True)
+    # Deflate at the fastest level: the bundle is mostly already-compressed
+    # binaries, so higher levels cost a lot of CPU for little size gain, but
+    # the .pyc archive and text resources still shrink noticeably for
+    # release downloads
+    dist_dir = Path("dist")
+    with zipfile.ZipFile(zip_name, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+      for root, _, files in os.walk(dist_dir / f"{app_name}.app", followlinks=True):
+        for file in files:
+          file_path = Path(root) / file
+          zipf.write(file_path, file_path.relative_to(dist_dir))
     
     print(f"✅ ZIP distribution created: {zip_name}")
     return True, zip_name
     
-  except subprocess.CalledProcessError as e:
+  except OSError as e:
     print(f"❌ ZIP creation failed: {e}")
     return False, None
 
+def get_directory_size(path):
+  """Return the total size in bytes of all files below ``path``."""
+  total = 0
+  stack = [path]
+  while stack:
+    with os.scandir(stack.pop()) as entries:
+      for entry in entries:
+        # DirEntry reuses the stat data from readdir where the OS provides it
+        if entry.is_dir(follow_symlinks=False):
+          stack.append(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+          total += entry.stat(follow_symlinks=False).st_size
+  return total
+
 def main():
   """Main build process."""
   print("🚀 Starting Mac app build process for both Intel and Apple Silicon...")
   
+  # Options: --clean (drop cached PyInstaller work dirs), --universal2
+  # (try a single fat bundle before falling back to per-architecture builds)
+  
   # Check we're on macOS
   if sys.platform != "darwin":
     print("❌ This script must be run on macOS to create Mac app bundles.")
@@ -212,7 +330,7 @@ def main():
   check_dependencies()
   
   # Clean previous builds
-  clean_build()
+  clean_build(full="--clean" in sys.argv[1:])
   
   # Build for both architectures
   architectures = [
@@ -223,33 +341,58 @@ def main():
   built_apps = []
   distribution_files = []
   
-  for arch, arch_display in architectures:
+  # With --universal2, try one fat bundle first. This needs a universal2
+  # Python and universal2 wheels for every dependency, which numpy/scipy/
+  # pandas don't always publish, so fall back to separate builds on failure.
+  if "--universal2" in sys.argv[1:]:
     print(f"\n{'='*60}")
-    print(f"Building for {arch_display} ({arch})")
+    print("Building Universal (universal2)")
+    print(f"{'='*60}")
+    success, app_name, arch_display = create_app_bundle("universal2", "Universal")
+    if success:
+      built_apps.append((app_name, arch_display))
+    else:
+      print("⚠️  universal2 build failed, falling back to separate Intel and Apple Silicon builds...")
+  
+  if not built_apps:
+    print(f"\n{'='*60}")
+    print("Building for " + " and ".join(f"{d} ({a})" for a, d in architectures) + " in parallel")
     print(f"{'='*60}")
     
-    # Create app bundle for this architecture
-    success, app_name = create_app_bundle(target_arch=arch)
-    if not success:
-      print(f"❌ {arch_display} build failed! Continuing with other architectures...")
-      continue
-    
-    built_apps.append((app_name, arch_display))
-    
-    # Show app bundle info
+    # PyInstaller runs in a subprocess, so threads are enough to overlap builds
+    with ThreadPoolExecutor(max_workers=len(architectures)) as executor:
+      futures = [
+        executor.submit(create_app_bundle, arch, arch_display)
+        for arch, arch_display in architectures
+      ]
+      for future in as_completed(futures):
+        success, app_name, arch_display = future.result()
+        if not success:
+          print(f"❌ {arch_display} build failed! Continuing with other architectures...")
+          continue
+        
+        built_apps.append((app_name, arch_display))
+  
+  # Show app bundle info
+  for app_name, arch_display in built_apps:
     app_path = Path(f"dist/{app_name}.app")
     if app_path.exists():
-      size_mb = sum(f.stat().st_size for f in app_path.rglob('*') if f.is_file()) / (1024 * 1024)
+      size_mb = get_directory_size(app_path) / (1024 * 1024)
       print(f"✅ {arch_display} app bundle: {app_path} ({size_mb:.1f} MB)")
+  
+  # Create distribution files for every built architecture; hdiutil and zip
+  # are mostly I/O bound so they overlap well
+  with ThreadPoolExecutor() as executor:
+    packaging = []
+    for app_name, _ in built_apps:
+      packaging.append(executor.submit(create_dmg, app_name))
+      packaging.append(executor.submit(create_zip_distribution, app_name))
     
-    # Create distribution files for this architecture
-    dmg_success, dmg_name = create_dmg(app_name)
-    zip_success, zip_name = create_zip_distribution(app_name)
-    
-    if dmg_success:
-      distribution_files.append(f"📀 {dmg_name}")
-    if zip_success:
-      distribution_files.append(f"📦 {zip_name}")
+    for future in packaging:
+      success, file_name = future.result()
+      if success:
+        icon = "📀" if file_name.endswith(".dmg") else "📦"
+        distribution_files.append(f"{icon} {file_name}")
   
   # Final summary
   print(f"\n{'='*60}")
@@ -4,7 +4,9 @@ Create app icon for FluoroSpot Analysis Tool.
 This script generates a simple icon and converts it to .icns format for Mac apps.
 """
 
+import hashlib
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -13,9 +15,7 @@ def create_simple_icon():
   print("🎨 Creating app icon...")
   
   # Check if ImageMagick is available
-  try:
-    subprocess.check_output(["which", "convert"])
-  except subprocess.CalledProcessError:
+  if shutil.which("convert") is None:
     print("❌ ImageMagick not found. Install with: brew install imagemagick")
     print("   Creating placeholder instead...")
     return create_placeholder_icon()
@@ -70,26 +70,34 @@ def convert_to_icns(png_file):
   ]
   
   try:
-    # Generate all icon sizes
+    # Generate all icon sizes from a single ImageMagick process using a
+    # clone/resize/write chain instead of starting convert once per size.
+    # Several iconset entries share a pixel size (e.g. 32x32 and 16x16@2x),
+    # so each distinct size is resized once and written under every name.
+    filenames_by_size = {}
     for size, filename in sizes:
-      cmd = [
-        "convert", png_file,
-        "-resize", f"{size}x{size}",
-        f"{iconset_dir}/{filename}"
-      ]
-      subprocess.run(cmd, check=True)
+      filenames_by_size.setdefault(size, []).append(filename)
+    
+    cmd = ["convert", png_file]
+    for size, filenames in filenames_by_size.items():
+      cmd += ["(", "+clone", "-resize", f"{size}x{size}"]
+      for filename in filenames:
+        cmd += ["-write", f"{iconset_dir}/{filename}"]
+      cmd += ["+delete", ")"]
+    cmd.append("null:")
+    subprocess.run(cmd, check=True)
     
     # Convert iconset to icns
     subprocess.run(["iconutil", "-c", "icns", iconset_dir], check=True)
     
     # Clean up
-    subprocess.run(["rm", "-rf", iconset_dir], check=True)
-    subprocess.run(["rm", png_file], check=True)
+    shutil.rmtree(iconset_dir)
+    os.remove(png_file)
     
     print(f"✅ ICNS icon created: {icns_file}")
     return True
     
-  except subprocess.CalledProcessError as e:
+  except (subprocess.CalledProcessError, OSError) as e:
     print(f"❌ ICNS conversion failed: {e}")
     return False
 
@@ -117,10 +125,24 @@ def main():
   print("🚀 Starting icon creation...")
   
   # We're already in the build_resources directory when called from fluorospot/
+  # Skip regeneration when neither this script nor the available tools
+  # have changed since the icon was last built
+  icns_path = Path("app_icon.icns")
+  marker = Path(".app_icon.icns.sha256")
+  icon_hash = hashlib.sha256(
+    Path(__file__).read_bytes()
+    + str(shutil.which("convert")).encode()
+    + str(shutil.which("iconutil")).encode()
+  ).hexdigest()
+  if icns_path.exists() and marker.exists() and marker.read_text().strip() == icon_hash:
+    print("✅ App icon up to date, skipping generation")
+    return
+  
   # Create icon
   success = create_simple_icon()
   
   if success:
+    marker.write_text(icon_hash)
     print("✅ App icon created successfully!")
   else:
     print("❌ Failed to create app icon")
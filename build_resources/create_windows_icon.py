@@ -4,11 +4,15 @@ Create Windows icon for FluoroSpot Analysis Tool.
 This script generates a simple icon and converts it to .ico format for Windows apps.
 """
 
-import os
+import hashlib
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+# Sizes embedded in the ICO file, largest first
+ICO_SIZES = [256, 128, 64, 48, 32, 16]
+
 def create_simple_icon():
     """Create a simple icon using ImageMagick or Pillow."""
     print("Creating Windows app icon...")
@@ -31,21 +35,20 @@ def create_simple_icon():
 
 def check_imagemagick():
     """Check if ImageMagick is available."""
-    try:
-        if sys.platform == "win32":
-            # On Windows, try both 'magick' and 'convert'
-            try:
-                subprocess.check_output(["magick", "-version"], stderr=subprocess.DEVNULL)
-                return "magick"
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                subprocess.check_output(["convert", "-version"], stderr=subprocess.DEVNULL)
-                return "convert"
-        else:
-            # On Unix-like systems
+    if shutil.which("magick"):
+        return "magick"
+    
+    if sys.platform == "win32":
+        # Windows ships an unrelated convert.exe (FAT -> NTFS), so a PATH
+        # hit alone isn't enough; make sure it is really ImageMagick
+        try:
             subprocess.check_output(["convert", "-version"], stderr=subprocess.DEVNULL)
             return "convert"
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return None
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+    
+    # On Unix-like systems
+    return "convert" if shutil.which("convert") else None
 
 def create_icon_imagemagick():
     """Create icon using ImageMagick."""
@@ -53,50 +56,27 @@ def create_icon_imagemagick():
     if not magick_cmd:
         return False
     
-    icon_png = "app_icon_256.png"
     ico_file = "app_icon.ico"
     
-    # Create base icon (smaller than Mac version for Windows)
-    if magick_cmd == "magick":
-        # Windows ImageMagick syntax
-        cmd = [
-            "magick", "-size", "256x256",
-            "gradient:#4A90E2-#357ABD",  # Blue gradient
-            "-gravity", "center",
-            "-pointsize", "36",
-            "-fill", "white",
-            "-font", "Arial-Bold",
-            "-annotate", "+0-12", "FS",  # FluoroSpot initials
-            "-pointsize", "16",
-            "-annotate", "+0+12", "Analysis",
-            icon_png
-        ]
-    else:
-        # Unix ImageMagick syntax
-        cmd = [
-            "convert", "-size", "256x256",
-            "gradient:#4A90E2-#357ABD",
-            "-gravity", "center",
-            "-pointsize", "36",
-            "-fill", "white",
-            "-font", "Arial-Bold",
-            "-annotate", "+0-12", "FS",
-            "-pointsize", "16",
-            "-annotate", "+0+12", "Analysis",
-            icon_png
-        ]
+    # Render the icon and write the multi-size ICO in a single ImageMagick
+    # invocation (same syntax for 'magick' and 'convert'), skipping the
+    # intermediate PNG file
+    cmd = [
+        magick_cmd, "-size", "256x256",
+        "gradient:#4A90E2-#357ABD",  # Blue gradient
+        "-gravity", "center",
+        "-pointsize", "36",
+        "-fill", "white",
+        "-font", "Arial-Bold",
+        "-annotate", "+0-12", "FS",  # FluoroSpot initials
+        "-pointsize", "16",
+        "-annotate", "+0+12", "Analysis",
+        "-define", "icon:auto-resize=256,128,64,48,32,16",
+        ico_file
+    ]
     
     try:
         subprocess.run(cmd, check=True)
-        print(f"Base icon created: {icon_png}")
-        
-        # Convert to ICO format with multiple sizes
-        ico_cmd = [magick_cmd, icon_png, "-define", "icon:auto-resize=256,128,64,48,32,16", ico_file]
-        subprocess.run(ico_cmd, check=True)
-        
-        # Clean up PNG
-        os.remove(icon_png)
-        
         print(f"ICO icon created: {ico_file}")
         return True
         
@@ -116,19 +96,20 @@ def create_icon_pillow():
         subprocess.check_call([sys.executable, "-m", "pip", "install", "Pillow"])
         from PIL import Image, ImageDraw, ImageFont
     
-    # Create a 256x256 image with gradient-like effect
+    import numpy as np
+    
+    # Create a 256x256 image with a vertical blue gradient from #4A90E2 to
+    # #357ABD, built as one array instead of drawing it row by row
     icon_size = 256
-    image = Image.new('RGBA', (icon_size, icon_size), (0, 0, 0, 0))
+    t = (np.arange(icon_size) / icon_size)[:, None]
+    start = np.array([74, 144, 226])
+    end = np.array([53, 122, 189])
+    rgb = (start + (end - start) * t).astype(np.uint8)
+    rgba = np.concatenate([rgb, np.full((icon_size, 1), 255, dtype=np.uint8)], axis=1)
+    gradient = np.ascontiguousarray(np.broadcast_to(rgba[:, None, :], (icon_size, icon_size, 4)))
+    image = Image.fromarray(gradient, 'RGBA')
     draw = ImageDraw.Draw(image)
     
-    # Create a simple gradient background
-    for y in range(icon_size):
-        # Blue gradient from #4A90E2 to #357ABD
-        r = int(74 + (53 - 74) * y / icon_size)
-        g = int(144 + (122 - 144) * y / icon_size)
-        b = int(226 + (189 - 226) * y / icon_size)
-        draw.rectangle([(0, y), (icon_size, y + 1)], fill=(r, g, b, 255))
-    
     # Add text
     try:
         # Try to use a system font with better fallbacks
@@ -189,20 +170,29 @@ def create_icon_pillow():
     # Save as ICO with multiple sizes
     ico_file = "app_icon.ico"
     
-    # Create different sizes for the ICO
-    sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
-    images = []
-    
-    for size in sizes:
-        resized = image.resize(size, Image.Resampling.LANCZOS)
-        images.append(resized)
-    
-    # Save as ICO
-    images[0].save(ico_file, format='ICO', sizes=[img.size for img in images])
+    save_ico(image, ico_file)
     
     print(f"ICO icon created with Pillow: {ico_file}")
     return True
 
+def save_ico(image, ico_file):
+    """Save a 256x256 image as a multi-size ICO file."""
+    from PIL import Image
+    
+    # Build the sub-images as a pyramid, each resized from the previous
+    # level rather than from the full 256px original
+    pyramid = [image]
+    for size in ICO_SIZES[1:]:
+        pyramid.append(pyramid[-1].resize((size, size), Image.Resampling.LANCZOS))
+    
+    # Pass the prepared levels via append_images so Pillow uses them as-is
+    # instead of resizing the base image again for every size
+    pyramid[0].save(
+        ico_file, format='ICO',
+        sizes=[img.size for img in pyramid],
+        append_images=pyramid[1:]
+    )
+
 def create_placeholder_icon():
     """Create a placeholder icon."""
     print("Creating placeholder Windows icon...")
@@ -218,10 +208,7 @@ def create_placeholder_icon():
     image = Image.new('RGBA', (icon_size, icon_size), (74, 144, 226, 255))  # Blue color
     
     ico_file = "app_icon.ico"
-    sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
-    images = [image.resize(size, Image.Resampling.LANCZOS) for size in sizes]
-    
-    images[0].save(ico_file, format='ICO', sizes=[img.size for img in images])
+    save_ico(image, ico_file)
     
     print(f"Placeholder icon created: {ico_file}")
     return True
@@ -230,12 +217,25 @@ def main():
     """Main icon creation process."""
     print("Starting Windows icon creation...")
     
+    # Skip regeneration when neither this script nor the available tools
+    # have changed since the icon was last built
+    ico_path = Path("app_icon.ico")
+    marker = Path(".app_icon.ico.sha256")
+    icon_hash = hashlib.sha256(
+        Path(__file__).read_bytes()
+        + str(shutil.which("magick")).encode()
+        + str(shutil.which("convert")).encode()
+    ).hexdigest()
+    if ico_path.exists() and marker.exists() and marker.read_text().strip() == icon_hash:
+        print("Windows app icon up to date, skipping generation")
+        return
+    
     # Create icon
     success = create_simple_icon()
     
     if success:
-        ico_path = Path("app_icon.ico")
         if ico_path.exists():
+            marker.write_text(icon_hash)
             size_kb = ico_path.stat().st_size / 1024
             print(f"Windows app icon created successfully! ({size_kb:.1f} KB)")
         else:
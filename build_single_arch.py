@@ -4,12 +4,24 @@ Build script for creating a Mac app bundle for a specific architecture.
 This script is used by GitHub Actions to build each architecture separately.
 """
 
+import hashlib
 import subprocess
 import sys
 import os
 import shutil
+import zipfile
 from pathlib import Path
 
+from build_excludes import EXCLUDED_MODULES
+
+# Absolute paths are needed because --specpath moves PyInstaller's notion of
+# the working directory for relative --icon/--add-data arguments.
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Live outside build/ so clean_build() doesn't throw them away
+REQUIREMENTS_MARKER = Path(".build_cache/requirements.sha256")
+WHEEL_CACHE = Path(".build_cache/wheels")
+
 def check_dependencies():
   """Check if required build dependencies are installed."""
   try:
@@ -17,16 +29,49 @@ def check_dependencies():
     print(f"✅ PyInstaller found: {PyInstaller.__version__}")
   except ImportError:
     print("❌ PyInstaller not found. Installing...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller>=6.6"])
+  
+  # Ensure project dependencies are installed, skipping pip entirely when
+  # requirements.txt hasn't changed since the last successful install
+  requirements_hash = hashlib.sha256(
+    Path("requirements.txt").read_bytes() + sys.executable.encode()
+  ).hexdigest()
+  if REQUIREMENTS_MARKER.exists() and REQUIREMENTS_MARKER.read_text().strip() == requirements_hash:
+    print("✅ Project dependencies up to date")
+    return
   
-  # Ensure project dependencies are installed
   print("📦 Installing project dependencies...")
-  subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+  offline_install = [
+    sys.executable, "-m", "pip", "install",
+    "--no-index", "--find-links", str(WHEEL_CACHE),
+    "--prefer-binary", "-r", "requirements.txt"
+  ]
+  # Install from the local wheel cache when it already has everything;
+  # otherwise download the missing wheels once and install from the cache
+  if subprocess.run(offline_install, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode != 0:
+    print("  Populating local wheel cache...")
+    subprocess.check_call([
+      sys.executable, "-m", "pip", "download",
+      "--prefer-binary", "-d", str(WHEEL_CACHE), "-r", "requirements.txt"
+    ])
+    subprocess.check_call(offline_install)
+  REQUIREMENTS_MARKER.parent.mkdir(exist_ok=True)
+  REQUIREMENTS_MARKER.write_text(requirements_hash)
 
-def clean_build():
-  """Clean previous build artifacts."""
+def clean_build(target_arch, full=False):
+  """Clean previous build artifacts for one architecture.
+  
+  Only this architecture's outputs are removed, so builds for the two
+  architectures can run side by side from the same checkout. Its
+  PyInstaller work directory under build/ is kept unless ``full`` is set,
+  so unchanged analysis stages are reused by the next build.
+  """
   print("🧹 Cleaning previous build artifacts...")
-  paths_to_clean = ["build", "dist", "*.spec"]
+  arch_name = "Apple-Silicon" if target_arch == "arm64" else "Intel"
+  app_name = f"FluoroSpot Analysis {arch_name}"
+  paths_to_clean = [f"dist/{app_name}", f"dist/{app_name}.app"]
+  if full:
+    paths_to_clean.insert(0, f"build/{target_arch}")
   for path in paths_to_clean:
     if os.path.exists(path):
       if os.path.isdir(path):
@@ -48,26 +93,31 @@ def create_app_bundle(target_arch):
   print(f"  Current system architecture: {current_arch}")
   print(f"  Target architecture: {target_arch}")
   
-  # PyInstaller command
+  # PyInstaller arguments
   cmd = [
-    sys.executable, "-m", "PyInstaller",
     "--onedir",  # Create a directory instead of a single file for better performance
     "--windowed",  # No console window
+    "--strip",  # Strip debug symbols from collected binaries
+    "--noupx",  # UPX breaks macOS binaries; never compress them
+    "--optimize=2",  # Byte-compile with -OO (no docstrings/asserts)
+    "--noconfirm",  # Reuse build/{arch} without prompting
     "--name", app_name,
-    "--icon=build_resources/app_icon.icns",  # We'll create this
-    "--add-data=gui/resources:fluorospot/gui/resources",
-    "--add-data=config.yaml:fluorospot",
+    "--distpath", "dist",
+    "--workpath", f"build/{target_arch}",
+    "--specpath", f"build/{target_arch}",
+    f"--icon={PROJECT_ROOT / 'build_resources' / 'app_icon.icns'}",  # We'll create this
+    f"--add-data={PROJECT_ROOT / 'gui' / 'resources'}:fluorospot/gui/resources",
+    f"--add-data={PROJECT_ROOT / 'config.yaml'}:fluorospot",
     "--hidden-import=tkinter",
     "--hidden-import=tkinter.ttk",
     "--hidden-import=tkinter.filedialog",
     "--hidden-import=tkinter.messagebox",
     "--hidden-import=pandas",
     "--hidden-import=numpy",
-    "--hidden-import=scipy",
+    "--hidden-import=scipy.stats",
     "--hidden-import=openpyxl",
     "--hidden-import=yaml",
-    "--exclude-module=matplotlib",  # Exclude if not needed to reduce size
-    "--exclude-module=PIL",
+    *(f"--exclude-module={module}" for module in EXCLUDED_MODULES),
     "--osx-bundle-identifier=org.iedb.fluorospot",
     "launch_gui.py"
   ]
@@ -80,15 +130,28 @@ def create_app_bundle(target_arch):
   else:
     print(f"  Native compilation for {current_arch}")
   
+  # Run PyInstaller in this process rather than spawning a second
+  # interpreter; this script only ever builds one architecture, so
+  # PyInstaller's module-level state is never reused. Its log goes
+  # straight to the console.
+  from PyInstaller.__main__ import run as run_pyinstaller
+  
+  # Keep PyInstaller's cache of processed binaries per architecture so a
+  # concurrent build for the other architecture can't race on it
+  os.environ["PYINSTALLER_CONFIG_DIR"] = str(Path(f".build_cache/pyinstaller-{target_arch}").resolve())
+  
   try:
-    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-    print(f"✅ {arch_name} app bundle created successfully!")
-    return True, app_name
-  except subprocess.CalledProcessError as e:
+    run_pyinstaller(cmd)
+  except SystemExit as e:
+    if e.code not in (None, 0):
+      print(f"❌ {arch_name} build failed: exit code {e.code}")
+      return False, None
+  except Exception as e:
     print(f"❌ {arch_name} build failed: {e}")
-    print(f"stdout: {e.stdout}")
-    print(f"stderr: {e.stderr}")
     return False, None
+  
+  print(f"✅ {arch_name} app bundle created successfully!")
+  return True, app_name
 
 def create_dmg(app_name):
   """Create a DMG file for distribution."""
@@ -97,9 +160,7 @@ def create_dmg(app_name):
   dmg_name = f"{app_name.replace(' ', '_')}.dmg"
   
   # Check if create-dmg is available (install with: brew install create-dmg)
-  try:
-    subprocess.check_output(["which", "create-dmg"])
-  except subprocess.CalledProcessError:
+  if shutil.which("create-dmg") is None:
     print("⚠️  create-dmg not found. Install with: brew install create-dmg")
     print("   Creating basic DMG instead...")
     return create_basic_dmg(app_name, dmg_name)
@@ -136,18 +197,34 @@ def create_basic_dmg(app_name, dmg_name):
   os.makedirs(temp_dir, exist_ok=True)
   
   try:
-    # Copy app to temp directory
-    shutil.copytree(f"dist/{app_name}.app", f"{temp_dir}/{app_name}.app")
+    # Stage the app without copying its bytes; hdiutil stores symlinks as
+    # links, so a symlinked .app would not work here. On APFS, cp -c clones
+    # every file (clonefile); elsewhere fall back to hard links. Symlinks
+    # inside the bundle (framework layout) are kept as symlinks either way.
+    staged_app = f"{temp_dir}/{app_name}.app"
+    clone = subprocess.run(
+      ["cp", "-cR", f"dist/{app_name}.app", staged_app],
+      stderr=subprocess.DEVNULL
+    )
+    if clone.returncode != 0:
+      if os.path.exists(staged_app):
+        shutil.rmtree(staged_app)
+      shutil.copytree(
+        f"dist/{app_name}.app", staged_app,
+        symlinks=True, copy_function=os.link
+      )
     
     # Create alias to Applications folder
-    subprocess.run([
-      "ln", "-sf", "/Applications", f"{temp_dir}/Applications"
-    ], check=True)
+    applications_link = f"{temp_dir}/Applications"
+    if os.path.lexists(applications_link):
+      os.remove(applications_link)
+    os.symlink("/Applications", applications_link)
     
     # Create DMG
     subprocess.run([
       "hdiutil", "create", "-volname", app_name,
-      "-srcfolder", temp_dir, "-ov", "-format", "UDZO",
+      "-srcfolder", temp_dir, "-ov",
+      "-fs", "APFS", "-format", "ULFO",  # LZFSE compression, macOS 10.13+
       dmg_name
     ], check=True)
     
@@ -157,7 +234,7 @@ def create_basic_dmg(app_name, dmg_name):
     print(f"✅ Basic DMG created: {dmg_name}")
     return True, dmg_name
     
-  except subprocess.CalledProcessError as e:
+  except (subprocess.CalledProcessError, OSError) as e:
     print(f"❌ Basic DMG creation failed: {e}")
     # Clean up on failure
     if os.path.exists(temp_dir):
@@ -171,26 +248,47 @@ def create_zip_distribution(app_name):
   zip_name = f"{app_name.replace(' ', '_')}_Mac.zip"
   
   try:
-    # Create zip file
-    subprocess.run([
-      "zip", "-r", zip_name, f"dist/{app_name}.app"
-    ], check=True)
+    # Deflate at the fastest level: the bundle is mostly already-compressed
+    # binaries, so higher levels cost a lot of CPU for little size gain, but
+    # the .pyc archive and text resources still shrink noticeably for
+    # release downloads
+    dist_dir = Path("dist")
+    with zipfile.ZipFile(zip_name, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+      for root, _, files in os.walk(dist_dir / f"{app_name}.app", followlinks=True):
+        for file in files:
+          file_path = Path(root) / file
+          zipf.write(file_path, file_path.relative_to(dist_dir))
     
     print(f"✅ ZIP distribution created: {zip_name}")
     return True, zip_name
     
-  except subprocess.CalledProcessError as e:
+  except OSError as e:
     print(f"❌ ZIP creation failed: {e}")
     return False, None
 
+def get_directory_size(path):
+  """Return the total size in bytes of all files below ``path``."""
+  total = 0
+  stack = [path]
+  while stack:
+    with os.scandir(stack.pop()) as entries:
+      for entry in entries:
+        # DirEntry reuses the stat data from readdir where the OS provides it
+        if entry.is_dir(follow_symlinks=False):
+          stack.append(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+          total += entry.stat(follow_symlinks=False).st_size
+  return total
+
 def main():
   """Main build process for single architecture."""
-  if len(sys.argv) != 2:
-    print("Usage: python build_single_arch.py <architecture>")
+  args = [arg for arg in sys.argv[1:] if arg != "--clean"]
+  if len(args) != 1:
+    print("Usage: python build_single_arch.py <architecture> [--clean]")
     print("Architecture should be 'x86_64' or 'arm64'")
     sys.exit(1)
   
-  target_arch = sys.argv[1]
+  target_arch = args[0]
   if target_arch not in ["x86_64", "arm64"]:
     print(f"❌ Invalid architecture: {target_arch}")
     print("Architecture should be 'x86_64' or 'arm64'")
@@ -207,8 +305,8 @@ def main():
   # Check dependencies
   check_dependencies()
   
-  # Clean previous builds
-  clean_build()
+  # Clean previous builds (pass --clean to also drop cached PyInstaller work dirs)
+  clean_build(target_arch, full="--clean" in sys.argv[1:])
   
   # Build for the specific architecture
   success, app_name = create_app_bundle(target_arch)
@@ -219,7 +317,7 @@ def main():
   # Show app bundle info
   app_path = Path(f"dist/{app_name}.app")
   if app_path.exists():
-    size_mb = sum(f.stat().st_size for f in app_path.rglob('*') if f.is_file()) / (1024 * 1024)
+    size_mb = get_directory_size(app_path) / (1024 * 1024)
     print(f"✅ {arch_name} app bundle: {app_path} ({size_mb:.1f} MB)")
   
   # Create distribution files
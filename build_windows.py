@@ -4,13 +4,20 @@ Build script for creating a Windows executable for FluoroSpot Analysis Tool.
 This script uses PyInstaller to create a standalone .exe file.
 """
 
+import hashlib
 import subprocess
 import sys
 import os
 import shutil
 import zipfile
+from collections import deque
 from pathlib import Path
 
+from build_excludes import EXCLUDED_MODULES
+
+# Lives outside build/ so clean_build() doesn't throw it away
+REQUIREMENTS_MARKER = Path(".build_cache/requirements.sha256")
+
 def check_dependencies():
     """Check if required build dependencies are installed."""
     try:
@@ -18,11 +25,23 @@ def check_dependencies():
         print(f"PyInstaller found: {PyInstaller.__version__}")
     except ImportError:
         print("PyInstaller not found. Installing...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller>=6.6"])
+    
+    # Ensure project dependencies are installed, skipping pip entirely when
+    # requirements.txt hasn't changed since the last successful install
+    requirements_hash = hashlib.sha256(
+        Path("requirements.txt").read_bytes() + sys.executable.encode()
+    ).hexdigest()
+    if REQUIREMENTS_MARKER.exists() and REQUIREMENTS_MARKER.read_text().strip() == requirements_hash:
+        print("Project dependencies up to date")
+        return
     
-    # Ensure project dependencies are installed
     print("Installing project dependencies...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+    subprocess.check_call([
+        sys.executable, "-m", "pip", "install", "--prefer-binary", "-r", "requirements.txt"
+    ])
+    REQUIREMENTS_MARKER.parent.mkdir(exist_ok=True)
+    REQUIREMENTS_MARKER.write_text(requirements_hash)
 
 def clean_build():
     """Clean previous build artifacts."""
@@ -36,7 +55,7 @@ def clean_build():
                 os.remove(path)
             print(f"  Removed: {path}")
 
-def create_executable(build_type="onefile"):
+def create_executable(build_type="onedir"):
     """Create the Windows executable using PyInstaller."""
     print(f"Building Windows executable ({build_type})...")
     
@@ -71,6 +90,7 @@ def create_executable(build_type="onefile"):
         sys.executable, "-m", "PyInstaller",
         "--onefile" if build_type == "onefile" else "--onedir",
         "--windowed",  # No console window
+        "--optimize=2",  # Byte-compile with -OO (no docstrings/asserts)
         "--name", app_name,
         "--distpath", "dist/windows",
         "--workpath", "build/windows",
@@ -109,61 +129,148 @@ def create_executable(build_type="onefile"):
         "--hidden-import", "tkinter.messagebox",
         "--hidden-import", "pandas",
         "--hidden-import", "numpy",
-        "--hidden-import", "scipy",
+        "--hidden-import", "scipy.stats",
         "--hidden-import", "openpyxl",
         "--hidden-import", "yaml",
-        "--exclude-module", "matplotlib",  # Exclude if not needed to reduce size
-        "--exclude-module", "PIL",
-        "launch_gui.py"
     ])
+    for module in EXCLUDED_MODULES:
+        cmd.extend(["--exclude-module", module])
+    cmd.append("launch_gui.py")
+    
+    log_path = "build/windows/pyinstaller.log"
     
     print("  Running PyInstaller...")
     print(f"  Command: {' '.join(cmd)}")
     
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # Stream PyInstaller's (large) log to a file instead of buffering it
+        os.makedirs("build/windows", exist_ok=True)
+        # Keep PyInstaller's cache of processed binaries inside the project so
+        # it doesn't collide with other PyInstaller builds on the same machine
+        env = dict(os.environ, PYINSTALLER_CONFIG_DIR=os.path.abspath(".build_cache/pyinstaller-windows"))
+        with open(log_path, "w") as log_file:
+            subprocess.run(cmd, check=True, stdout=log_file, stderr=subprocess.STDOUT, env=env)
         print(f"  Windows executable created successfully!")
         
         # Verify the executable was created
         if build_type == "onefile":
             exe_path = f"dist/windows/{app_name}.exe"
-            if os.path.exists(exe_path):
-                print(f"  Executable verified: {exe_path}")
-            else:
-                print(f"  WARNING: Expected executable not found: {exe_path}")
+        else:
+            exe_path = f"dist/windows/{app_name}/{app_name}.exe"
+        if os.path.exists(exe_path):
+            print(f"  Executable verified: {exe_path}")
+        else:
+            print(f"  WARNING: Expected executable not found: {exe_path}")
         
         return True, app_name
     except subprocess.CalledProcessError as e:
         print(f"ERROR: Windows build failed!")
         print(f"Return code: {e.returncode}")
-        if e.stdout:
-            print(f"STDOUT:\n{e.stdout}")
-        if e.stderr:
-            print(f"STDERR:\n{e.stderr}")
+        try:
+            with open(log_path, errors="replace") as log_file:
+                tail = deque(log_file, maxlen=40)
+            print(f"Last {len(tail)} lines of {log_path}:")
+            print("".join(tail), end="")
+        except OSError:
+            pass
         return False, None
 
-def create_installer():
+# NSIS script for the onedir build. SOLID LZMA compresses the whole
+# directory as one stream, which gets the download close to onefile size.
+NSIS_SCRIPT = r"""Unicode true
+SetCompressor /SOLID lzma
+!include "MUI2.nsh"
+
+!define APP_NAME "FluoroSpot Analysis Tool"
+!define APP_EXE "{app_name}.exe"
+
+Name "${{APP_NAME}}"
+OutFile "{installer_path}"
+InstallDir "$LOCALAPPDATA\Programs\{app_name}"
+RequestExecutionLevel user
+
+!insertmacro MUI_PAGE_DIRECTORY
+!insertmacro MUI_PAGE_INSTFILES
+!insertmacro MUI_UNPAGE_CONFIRM
+!insertmacro MUI_UNPAGE_INSTFILES
+!insertmacro MUI_LANGUAGE "English"
+
+Section "Install"
+  SetOutPath "$INSTDIR"
+  File /r "{dist_dir}\*"
+  WriteUninstaller "$INSTDIR\Uninstall.exe"
+  CreateDirectory "$SMPROGRAMS\${{APP_NAME}}"
+  CreateShortcut "$SMPROGRAMS\${{APP_NAME}}\${{APP_NAME}}.lnk" "$INSTDIR\${{APP_EXE}}"
+  CreateShortcut "$DESKTOP\${{APP_NAME}}.lnk" "$INSTDIR\${{APP_EXE}}"
+SectionEnd
+
+Section "Uninstall"
+  Delete "$DESKTOP\${{APP_NAME}}.lnk"
+  RMDir /r "$SMPROGRAMS\${{APP_NAME}}"
+  RMDir /r "$INSTDIR"
+SectionEnd
+"""
+
+def find_makensis():
+    """Locate makensis on PATH or in the default NSIS install directory."""
+    makensis = shutil.which("makensis")
+    if makensis:
+        return makensis
+    for program_files in (os.environ.get("ProgramFiles(x86)"), os.environ.get("ProgramFiles")):
+        if program_files:
+            candidate = os.path.join(program_files, "NSIS", "makensis.exe")
+            if os.path.exists(candidate):
+                return candidate
+    return None
+
+def create_installer(app_name, build_type="onedir"):
     """Create an NSIS installer (if available)."""
     print("Checking for NSIS installer capability...")
     
+    if build_type != "onedir":
+        print("Installer is only built for onedir builds. Skipping installer creation.")
+        return False, None
+    
     # Check if NSIS is available (would need to be installed separately)
-    try:
-        subprocess.check_output(["makensis", "/VERSION"])
-        print("NSIS found, but installer creation not implemented yet")
-        print("   This could be added in a future enhancement")
-        return True, "installer_placeholder"
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    makensis = find_makensis()
+    if makensis is None:
         print("NSIS not found. Skipping installer creation.")
         return False, None
+    
+    dist_dir = os.path.abspath(f"dist/windows/{app_name}")
+    if not os.path.exists(dist_dir):
+        print(f"Distribution directory not found: {dist_dir}")
+        return False, None
+    
+    installer_name = f"{app_name}_Setup.exe"
+    nsi_path = "build/windows/installer.nsi"
+    
+    try:
+        os.makedirs("build/windows", exist_ok=True)
+        with open(nsi_path, "w", encoding="utf-8") as nsi_file:
+            nsi_file.write(NSIS_SCRIPT.format(
+                app_name=app_name,
+                installer_path=os.path.abspath(installer_name),
+                dist_dir=dist_dir,
+            ))
+        print(f"  Running makensis: {makensis}")
+        subprocess.run([makensis, "/V2", nsi_path], check=True)
+        print(f"Installer created: {installer_name}")
+        return True, installer_name
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"Installer creation failed: {e}")
+        return False, None
 
-def create_zip_distribution(app_name, build_type="onefile"):
+def create_zip_distribution(app_name, build_type="onedir"):
     """Create a ZIP file for distribution."""
     print(f"Creating ZIP distribution for {app_name}...")
     
     zip_name = f"{app_name}_Windows.zip"
     
     try:
-        with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        # Fastest deflate level: the executable is mostly already-compressed
+        # data, so higher levels spend CPU for almost no size gain
+        with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
             if build_type == "onefile":
                 # Single executable
                 exe_path = f"dist/windows/{app_name}.exe"
@@ -201,15 +308,16 @@ def create_zip_distribution(app_name, build_type="onefile"):
 
 def main():
     """Main build process for Windows executable."""
-    build_type = "onefile"  # Can be "onefile" or "onedir"
+    # onedir starts faster: onefile unpacks the whole app to %TEMP% on every launch
+    build_type = "onedir"  # Can be "onefile" or "onedir"
     
     if len(sys.argv) > 1:
         if sys.argv[1] in ["onefile", "onedir"]:
             build_type = sys.argv[1]
         else:
             print("Usage: python build_windows.py [onefile|onedir]")
-            print("  onefile: Create single executable (default)")
-            print("  onedir:  Create directory with executable and dependencies")
+            print("  onefile: Create single executable")
+            print("  onedir:  Create directory with executable and dependencies (default)")
             sys.exit(1)
     
     print(f"Starting Windows build process ({build_type})...")
@@ -251,7 +359,7 @@ def main():
     
     # Create distribution files
     zip_success, zip_name = create_zip_distribution(app_name, build_type)
-    installer_success, installer_name = create_installer()
+    installer_success, installer_name = create_installer(app_name, build_type)
     
     # Summary
     print(f"\n{'='*60}")
@@ -263,7 +371,7 @@ def main():
     distribution_files = []
     if zip_success:
         distribution_files.append(f"{zip_name}")
-    if installer_success and installer_name != "installer_placeholder":
+    if installer_success:
         distribution_files.append(f"{installer_name}")
     
     if distribution_files:
@@ -1,17 +1,63 @@
 import argparse
+import os
+import re
 import yaml
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 from scipy import stats
-from scipy.stats import poisson, levene
+from scipy.stats import poisson
 from typing import List, Dict, Tuple, Optional
 
 import warnings
 warnings.filterwarnings('ignore')
 
-@dataclass
+# python-calamine (Rust) parses workbooks several times faster than openpyxl;
+# fall back to openpyxl when it isn't installed
+try:
+  import python_calamine  # noqa: F401
+  EXCEL_ENGINE = 'calamine'
+except ImportError:
+  EXCEL_ENGINE = 'openpyxl'
+
+# xlsxwriter writes workbooks several times faster than openpyxl; fall back
+# to openpyxl when it isn't installed. Its constant_memory mode must stay off:
+# pandas writes column by column, and that mode only takes rows in order
+try:
+  import xlsxwriter  # noqa: F401
+  EXCEL_WRITER_ENGINE = 'xlsxwriter'
+except ImportError:
+  EXCEL_WRITER_ENGINE = 'openpyxl'
+
+# libyaml's C loader parses several times faster than the pure-Python one;
+# it is only present when PyYAML was built against libyaml
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# The only data sheet columns the analysis reads; exports carry many more
+ANALYSIS_COLUMNS = frozenset([
+  'Layout-Donor',
+  'Plate',
+  'Layout-Stimuli',
+  'Spot Forming Units (SFU)',
+  'Analyte Secreting Population'
+])
+
+# Donor workbooks only go to a process pool when there is this much to parse.
+# openpyxl parses roughly 2 s per MB, while a spawned worker (macOS/Windows
+# bundles) first spends seconds re-importing pandas and scipy, so typical
+# 96-well exports of a few tens of KB are read faster in a plain loop.
+PARALLEL_READ_MIN_BYTES = 8 * 1024 * 1024
+
+# Results column layout around the per-replicate 'Replicate_N' and 'PN' columns
+_ID_COLUMNS = ('Donor ID', 'Plate', 'Experimental Condition', 'Species', 'Cytokine', 'Stimulus')
+_STAT_COLUMNS = ('Average', 'STD', 't-test p-value', 'SI', 'SFCs Normalized Per Million Cells')
+_SUMMARY_COLUMNS = ('Poisson Average', 'Positive Response')
+_P_VALUE_COLUMN_RE = re.compile(r'P(\d+)')
+
+@dataclass(frozen=True, slots=True)
 class AnalysisConfig:
   """Configuration for FluoroSpot analysis."""
   cells_per_well: int
@@ -21,43 +67,81 @@ class AnalysisConfig:
   plates: Dict[str, str]
   experimental_conditions: Optional[Dict] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AnalysisResult:
   """Container for statistical analysis results."""
   t_test_p: float
   si: float
   poisson_p_values: List[float]
   sfc_value: float
+  stim_mean: float = np.nan
+  stim_std: float = np.nan
+  control_mean: float = np.nan
 
 class FluoroSpotAnalyzer:
   """Main class for handling FluoroSpot data analysis."""
   def __init__(self, config: AnalysisConfig):
     self.config = config
+    # Compiled once and matched literally, like the `control_stim in stimulus` check
+    self._control_re = re.compile(re.escape(config.control_stim))
 
   def analyze_donor_data(self, donor_data: List[Tuple[str, pd.DataFrame]]) -> pd.DataFrame:
-    """Analyze data for all donors."""
-    all_results = []
+    """Analyze data for all donors.
+
+    The statistics for every stimulus of every donor are computed in one batch
+    once all donors have been partitioned.
+    """
+    entries = []
     for donor_id, donor_df in donor_data:
       print(f'Analyzing data for donor: {donor_id}')
-      donor_results = self._analyze_single_donor(donor_id, donor_df)
-      all_results.append(donor_results)
-    return pd.concat(all_results, ignore_index=True) if all_results else pd.DataFrame()
+      entries.extend(self._single_donor_entries(donor_id, donor_df))
+    return self._build_results_frame(self._resolve_entries(entries))
 
   def _analyze_single_donor(self, donor_id: str, donor_df: pd.DataFrame) -> pd.DataFrame:
     """Analyze data for a single donor."""
-    results = []
+    return self._build_results_frame(self._analyze_single_donor_rows(donor_id, donor_df))
+
+  def _analyze_single_donor_rows(self, donor_id: str, donor_df: pd.DataFrame) -> List[Dict]:
+    """Analyze a single donor and return its result rows as dicts."""
+    return self._resolve_entries(self._single_donor_entries(donor_id, donor_df))
+
+  def _single_donor_entries(self, donor_id: str, donor_df: pd.DataFrame) -> List:
+    """Collect the plate entries (see `_plate_entries`) for a single donor."""
+    # Partition the donor once by (population, plate) instead of scanning the
+    # whole donor frame again for every cytokine
+    plates_by_population = {}
+    for (population, _), plate_df in donor_df.groupby(['Analyte Secreting Population', 'Plate']):
+      plates_by_population.setdefault(population, []).append(plate_df)
+
+    entries = []
     for cytokine, led in self.config.cytokines.items():
-      led_df = donor_df[donor_df['Analyte Secreting Population'] == f'{led} Total']
-      plate_groups = led_df.groupby('Plate')
-      for _, plate_df in plate_groups:
-        plate_results = self._analyze_plate(donor_id, cytokine, plate_df)
-        results.append(plate_results)
-    return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+      for plate_df in plates_by_population.get(f'{led} Total', []):
+        entries.extend(self._plate_entries(donor_id, cytokine, plate_df))
+    return entries
 
   def _analyze_plate(self, donor_id: str, cytokine: str, plate_df: pd.DataFrame) -> pd.DataFrame:
     """Analyze data for a single plate, supporting both simple and experimental conditions layouts."""
+    return self._build_results_frame(self._analyze_plate_rows(donor_id, cytokine, plate_df))
+
+  def _analyze_plate_rows(self, donor_id: str, cytokine: str, plate_df: pd.DataFrame) -> List[Dict]:
+    """Analyze a single plate and return its result rows as dicts."""
+    return self._resolve_entries(self._plate_entries(donor_id, cytokine, plate_df))
+
+  def _plate_entries(self, donor_id: str, cytokine: str, plate_df: pd.DataFrame) -> List:
+    """Collect the result entries for a single plate.
+
+    Control rows are returned as finished row dicts; stimuli are returned as
+    `(control_values, stim_values, row_args)` tuples whose statistics are
+    computed later by `_resolve_entries`.
+    """
     results = []
     plate_name = plate_df['Plate'].iloc[0]
+    empty_values = np.empty(0)
+    # SFU values per stimulus, grouped in one pass over the plate
+    sfu_by_stimulus = {
+      stimulus: sfu.to_numpy()
+      for stimulus, sfu in plate_df.groupby('Layout-Stimuli', sort=False)['Spot Forming Units (SFU)']
+    }
 
     plate_conditions = None
     if self.config.experimental_conditions:  # check that the plate number is specified in the data first
@@ -71,43 +155,33 @@ class FluoroSpotAnalyzer:
         control_stim_name = group_config['control']
         stimuli_names = group_config['stimuli']
         
-        control_values = plate_df[plate_df['Layout-Stimuli'] == control_stim_name]['Spot Forming Units (SFU)'].values
+        control_values = sfu_by_stimulus.get(control_stim_name, empty_values)
         if len(control_values) == 0:
           print(f"  - WARNING: Control '{control_stim_name}' for group '{group_name}' not found on plate '{plate_name}'. Skipping group.")
           continue
         
-        control_row = pd.DataFrame({
-          'Donor ID': [donor_id], 'Plate': [plate_name], 'Experimental Condition': [group_name],
-          'Species': [self.config.plates.get(plate_name, '')], 'Cytokine': [cytokine],
-          'Stimulus': [control_stim_name], 'SFU Values': [control_values],
-          'Average': control_values.mean(), 'STD': control_values.std()
-        })
-        results.append(control_row)
+        results.append(self._create_control_dict(donor_id, cytokine, control_stim_name, control_values, plate_name, group_name))
 
         for stimulus in stimuli_names:
-          stim_values = plate_df[plate_df['Layout-Stimuli'] == stimulus]['Spot Forming Units (SFU)'].values
+          stim_values = sfu_by_stimulus.get(stimulus, empty_values)
           if len(stim_values) == 0:
             print(f"  - WARNING: Stimulus '{stimulus}' for group '{group_name}' not found on plate '{plate_name}'. Skipping stimulus.")
             continue
           
-          stats_result = self._calculate_statistics(control_values, stim_values)
-          result_row = self._create_result_row(
-              donor_id, cytokine, stimulus, stim_values, stats_result, plate_df, group_name
-          )
-          results.append(result_row)
+          results.append((control_values, stim_values, (donor_id, cytokine, stimulus, plate_name, group_name)))
     else:
       # --- "Simple" Mode (Fallback) ---
-      stimuli = plate_df['Layout-Stimuli'].unique()
+      stimuli = sfu_by_stimulus.keys()
       control_stim = self.config.control_stim
-      control_values = plate_df[plate_df['Layout-Stimuli'].str.contains(control_stim, na=False)]['Spot Forming Units (SFU)'].values
+      # Usually exactly one stimulus name contains the control; its group already
+      # holds the same values in row order, so only rescan the plate otherwise
+      matching = [values for stimulus, values in sfu_by_stimulus.items() if isinstance(stimulus, str) and control_stim in stimulus]
+      if len(matching) == 1:
+        control_values = matching[0]
+      else:
+        control_values = plate_df[plate_df['Layout-Stimuli'].str.contains(self._control_re, na=False)]['Spot Forming Units (SFU)'].values
       
-      control_row = pd.DataFrame({
-        'Donor ID': [donor_id], 'Plate': [plate_name], 'Experimental Condition': ['default'],
-        'Species': [self.config.plates.get(plate_name, '')], 'Cytokine': [cytokine],
-        'Stimulus': [control_stim], 'SFU Values': [control_values],
-        'Average': control_values.mean(), 'STD': control_values.std()
-      })
-      results.append(control_row)
+      results.append(self._create_control_dict(donor_id, cytokine, control_stim, control_values, plate_name, 'default'))
 
       for stimulus in stimuli:
         if pd.isna(stimulus):
@@ -115,72 +189,183 @@ class FluoroSpotAnalyzer:
         stimulus_str = str(stimulus)
         if control_stim in stimulus_str:
           continue
-        stim_values = plate_df[plate_df['Layout-Stimuli'] == stimulus]['Spot Forming Units (SFU)'].values
-        stats_result = self._calculate_statistics(control_values, stim_values)
-        result_row = self._create_result_row(
-          donor_id, cytokine, stimulus_str, stim_values, stats_result, plate_df, 'default'
-        )
-        results.append(result_row)
+        stim_values = sfu_by_stimulus[stimulus]
+        results.append((control_values, stim_values, (donor_id, cytokine, stimulus_str, plate_name, 'default')))
         
-    return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+    return results
+
+  def _resolve_entries(self, entries: List) -> List[Dict]:
+    """Turn collected entries into result rows, computing all pending statistics in one batch."""
+    pending = [entry for entry in entries if not isinstance(entry, dict)]
+    stats_results = iter(self._calculate_statistics_batch([(control, stim) for control, stim, _ in pending]))
+    rows = []
+    for entry in entries:
+      if isinstance(entry, dict):
+        rows.append(entry)
+        continue
+      _, stim_values, (donor_id, cytokine, stimulus, plate_name, group_name) = entry
+      rows.append(self._create_result_dict(
+        donor_id, cytokine, stimulus, stim_values, next(stats_results), plate_name, group_name
+      ))
+    return rows
 
   def _calculate_statistics(self, control_values: np.ndarray, stim_values: np.ndarray) -> AnalysisResult:
     """Calculate statistical measures for stimulus vs control."""
-    if len(control_values) == 0 or len(stim_values) == 0:
-      return AnalysisResult(1.0, 0.0, [1.0] * len(stim_values), 0.0)
-    
-    control_values = control_values[~np.isnan(control_values)]
-    stim_values = stim_values[~np.isnan(stim_values)]
-    control_avg = max(control_values.mean(), 1)
-    
-    sfc_norm = (stim_values.mean() - control_avg) * (1000000 / self.config.cells_per_well)
-    sfc_value = max(sfc_norm, 0)
-    
-    lambda_poisson = max(control_avg, 2)
-    poisson_p_values = [1 - poisson.cdf(value - 1, lambda_poisson) for value in stim_values]
-    
-    t_test_p = 1.0 # Default p-value
-    try:
-      if np.all(control_values == control_values[0]) and np.all(stim_values == stim_values[0]):
-        t_test_p = 1.0 if stim_values[0] <= control_values[0] else 0.0
+    return self._calculate_statistics_batch([(control_values, stim_values)])[0]
+
+  def _calculate_statistics_batch(self, pairs: List[Tuple[np.ndarray, np.ndarray]]) -> List[AnalysisResult]:
+    """Calculate statistical measures for many (control_values, stim_values) pairs.
+
+    The per-pair reductions are cheap NumPy calls on a handful of replicates;
+    SciPy's argument handling is what dominates, so the Poisson tail, the
+    Levene F tail and the t-tests are each evaluated once over the whole batch.
+    """
+    results = [None] * len(pairs)
+    pending = []  # pairs that still need their Poisson p-values (and maybe a t-test)
+    ttests = []  # indices into `pending` that need Levene + t-test
+    for i, (control_values, stim_values) in enumerate(pairs):
+      # Reported as the row's 'Average'/'STD', so NaN replicates propagate here
+      stim_mean, stim_std = stim_values.mean(), stim_values.std()
+      if len(control_values) == 0 or len(stim_values) == 0:
+        results[i] = AnalysisResult(1.0, 0.0, [1.0] * len(stim_values), 0.0, stim_mean, stim_std)
+        continue
+
+      # A NaN mean means there are NaN replicates; only then pay for the filtered copy
+      control_mean = control_values.mean()
+      if np.isnan(control_mean):
+        control_values = control_values[~np.isnan(control_values)]
+        control_mean = control_values.mean()
+      control_avg = max(control_mean, 1)
+      if np.isnan(stim_mean):
+        stim_values = stim_values[~np.isnan(stim_values)]
+        stim_avg = stim_values.mean()
       else:
-        equal_var = levene(control_values, stim_values).pvalue > 0.05
-        _, t_test_p = stats.ttest_ind(
-          control_values, stim_values,
-          equal_var=equal_var,
-          alternative='less',
-          nan_policy='omit'
+        stim_avg = stim_mean
+
+      t_test_p = 1.0 # Default p-value, also used when a group has no usable replicates
+      if len(control_values) and len(stim_values):
+        if np.ptp(control_values) == 0 and np.ptp(stim_values) == 0:
+          t_test_p = 1.0 if stim_values[0] <= control_values[0] else 0.0
+        else:
+          ttests.append(len(pending))
+          t_test_p = None
+      pending.append([i, control_values, stim_values, control_mean, control_avg, stim_mean, stim_std, stim_avg, t_test_p])
+
+    if not pending:
+      return results
+
+    # Poisson tail for every replicate of every pair in one call
+    stim_arrays = [entry[2] for entry in pending]
+    lengths = [len(values) for values in stim_arrays]
+    lambdas = np.repeat([max(entry[4], 2) for entry in pending], lengths)
+    poisson_p_values = poisson.sf(np.concatenate(stim_arrays) - 1, lambdas)
+    poisson_p_values = np.split(poisson_p_values, np.cumsum(lengths)[:-1])
+
+    if ttests:
+      self._batch_ttests([pending[k] for k in ttests])
+
+    for entry, p_values in zip(pending, poisson_p_values):
+      i, _, _, control_mean, control_avg, stim_mean, stim_std, stim_avg, t_test_p = entry
+      sfc_norm = (stim_avg - control_avg) * (1000000 / self.config.cells_per_well)
+      sfc_value = max(sfc_norm, 0)
+      si = stim_avg / control_avg if control_avg > 0 else 0.0
+      results[i] = AnalysisResult(t_test_p, si, p_values.tolist(), sfc_value, stim_mean, stim_std, control_mean)
+    return results
+
+  @classmethod
+  def _batch_ttests(cls, entries: List[list]) -> None:
+    """Fill in the one-sided t-test p-value (last item) of each pending entry."""
+    w, df_within = np.array([cls._levene_statistic(entry[1], entry[2]) for entry in entries]).T
+    # Levene's test decides between Student's and Welch's t-test
+    equal_var = stats.f.sf(w, 1, df_within) > 0.05
+    columns = []
+    for entry, equal in zip(entries, equal_var):
+      control_values, stim_values = entry[1], entry[2]
+      # A single replicate adds nothing to the pooled variance, but leaves
+      # Welch's test undefined
+      single_var = 0.0 if equal else np.nan
+      control_var = control_values.var(ddof=1) if len(control_values) > 1 else single_var
+      stim_var = stim_values.var(ddof=1) if len(stim_values) > 1 else single_var
+      columns.append((entry[3], control_var, len(control_values), entry[7], stim_var, len(stim_values)))
+    control_mean, control_var, n_control, stim_avg, stim_var, n_stim = np.array(columns, dtype=float).T
+
+    t_test_p = np.empty(len(entries))
+    for equal in (True, False):
+      mask = equal_var == equal
+      if mask.any():
+        _, t_test_p[mask] = stats.ttest_ind_from_stats(
+          control_mean[mask], np.sqrt(control_var[mask]), n_control[mask],
+          stim_avg[mask], np.sqrt(stim_var[mask]), n_stim[mask],
+          equal_var=equal,
+          alternative='less'
         )
-        if np.isnan(t_test_p):
-          t_test_p = 1.0
-    except (ValueError, IndexError):
-      t_test_p = 1.0 # Handle cases with insufficient data for t-test
-      
-    si = stim_values.mean() / control_avg if control_avg > 0 else 0.0
-    return AnalysisResult(t_test_p, si, poisson_p_values, sfc_value)
-    
-  def _create_result_row(
+    t_test_p[np.isnan(t_test_p)] = 1.0
+    for entry, p_value in zip(entries, t_test_p):
+      entry[8] = p_value
+
+  @staticmethod
+  def _levene_statistic(control_values: np.ndarray, stim_values: np.ndarray) -> Tuple[float, int]:
+    """Levene's W (median-centred, as scipy.stats.levene) and its within-groups dof for two groups."""
+    control_dev = np.abs(control_values - np.median(control_values))
+    stim_dev = np.abs(stim_values - np.median(stim_values))
+    n_control, n_stim = len(control_dev), len(stim_dev)
+    n_total = n_control + n_stim
+    control_dev_mean, stim_dev_mean = control_dev.mean(), stim_dev.mean()
+    dev_mean = (control_dev.sum() + stim_dev.sum()) / n_total
+    between = n_control * (control_dev_mean - dev_mean) ** 2 + n_stim * (stim_dev_mean - dev_mean) ** 2
+    within = ((control_dev - control_dev_mean) ** 2).sum() + ((stim_dev - stim_dev_mean) ** 2).sum()
+    with np.errstate(divide='ignore', invalid='ignore'):
+      w = (n_total - 2) * between / within
+    return w, n_total - 2
+
+  @staticmethod
+  def _replicate_columns(values: np.ndarray) -> Dict[str, float]:
+    """Spread the SFU replicates over numeric 'Replicate_N' columns."""
+    return {f'Replicate_{i+1}': value for i, value in enumerate(values.tolist())}
+
+  def _create_control_dict(
+    self,
+    donor_id: str,
+    cytokine: str,
+    control_stim: str,
+    control_values: np.ndarray,
+    plate_name: str,
+    group_name: str
+  ) -> Dict:
+    """Create the result row describing a control group."""
+    return {
+      'Donor ID': donor_id,
+      'Plate': plate_name,
+      'Experimental Condition': group_name,
+      'Species': self.config.plates.get(plate_name, ''),
+      'Cytokine': cytokine,
+      'Stimulus': control_stim,
+      **self._replicate_columns(control_values),
+      'Average': control_values.mean(),
+      'STD': control_values.std(),
+    }
+
+  def _create_result_dict(
     self,
     donor_id: str,
     cytokine: str,
     stimulus: str,
     stim_values: np.ndarray,
     stats: AnalysisResult,
-    plate_df: pd.DataFrame,
+    plate_name: str,
     group_name: str
-  ) -> pd.DataFrame:
-    """Create a DataFrame row with analysis results."""
-    plate_name = plate_df['Plate'].iloc[0]
+  ) -> Dict:
+    """Create the result row for a stimulus (without 'Positive Response')."""
     row_data = {
-      'Donor ID': [donor_id],
-      'Plate': [plate_name],
-      'Experimental Condition': [group_name],
-      'Species': [self.config.plates.get(plate_name, '')],
-      'Cytokine': [cytokine],
-      'Stimulus': [stimulus],
-      'SFU Values': [stim_values],
-      'Average': stim_values.mean(),
-      'STD': stim_values.std(),
+      'Donor ID': donor_id,
+      'Plate': plate_name,
+      'Experimental Condition': group_name,
+      'Species': self.config.plates.get(plate_name, ''),
+      'Cytokine': cytokine,
+      'Stimulus': stimulus,
+      **self._replicate_columns(stim_values),
+      'Average': stats.stim_mean,
+      'STD': stats.stim_std,
       't-test p-value': stats.t_test_p,
       'SI': stats.si,
       'SFCs Normalized Per Million Cells': stats.sfc_value,
@@ -188,13 +373,69 @@ class FluoroSpotAnalyzer:
     for i, p_value in enumerate(stats.poisson_p_values):
       row_data[f'P{i+1}'] = p_value
     row_data['Poisson Average'] = np.mean(stats.poisson_p_values) if stats.poisson_p_values else np.nan
-    df = pd.DataFrame(row_data)
-    df['Positive Response'] = (
-      (df['SFCs Normalized Per Million Cells'] >= self.config.sfc_cutoff) &
-      (df['SI'] > 2) &
-      ((df['t-test p-value'] < 0.05) | (df['Poisson Average'] < 0.05))
+    return row_data
+
+  def _create_result_row(
+    self,
+    donor_id: str,
+    cytokine: str,
+    stimulus: str,
+    stim_values: np.ndarray,
+    stats: AnalysisResult,
+    plate_df: pd.DataFrame,
+    group_name: str
+  ) -> pd.DataFrame:
+    """Create a DataFrame row with analysis results."""
+    plate_name = plate_df['Plate'].iloc[0]
+    row_data = self._create_result_dict(donor_id, cytokine, stimulus, stim_values, stats, plate_name, group_name)
+    return self._build_results_frame([row_data])
+
+  def _build_results_frame(self, rows: List[Dict]) -> pd.DataFrame:
+    """Build a results DataFrame from row dicts and flag positive responses.
+
+    Control rows carry no statistics, so their 'Positive Response' is left empty.
+    """
+    if not rows:
+      return pd.DataFrame()
+    df = pd.DataFrame(rows)
+    if 't-test p-value' in df.columns:
+      t_test_p = df['t-test p-value'].to_numpy(dtype=float)
+      positive = (
+        (df['SFCs Normalized Per Million Cells'].to_numpy(dtype=float) >= self.config.sfc_cutoff) &
+        (df['SI'].to_numpy(dtype=float) > 2) &
+        ((t_test_p < 0.05) | (df['Poisson Average'].to_numpy(dtype=float) < 0.05))
+      )
+      has_stats = ~np.isnan(t_test_p)
+      if has_stats.all():
+        df['Positive Response'] = positive
+      else:
+        df['Positive Response'] = pd.Series(positive, index=df.index, dtype=object).where(has_stats)
+    return df[self._results_columns(df.columns)]
+
+  @staticmethod
+  def _results_columns(columns) -> List[str]:
+    """Order the results columns independently of which row introduced them.
+
+    Rows have one 'Replicate_N' and 'PN' column per replicate, so a donor with
+    more replicates than the first row would otherwise append its extra
+    columns after the summary columns.
+    """
+    replicates = sorted(
+      (column for column in columns if column.startswith('Replicate_')),
+      key=lambda column: int(column[len('Replicate_'):])
+    )
+    p_values = sorted(
+      (column for column in columns if _P_VALUE_COLUMN_RE.fullmatch(column)),
+      key=lambda column: int(column[1:])
+    )
+    present = set(columns)
+    return (
+      [column for column in _ID_COLUMNS if column in present]
+      + replicates
+      + [column for column in _STAT_COLUMNS if column in present]
+      + p_values
+      + [column for column in _SUMMARY_COLUMNS if column in present]
     )
-    return df
 
 class DataLoader:
   """Handle loading and preprocessing of FluoroSpot data."""
@@ -202,48 +443,60 @@ class DataLoader:
   def load_config(config_path: Path) -> AnalysisConfig:
     """Load configuration from YAML file."""
     with open(config_path, 'r') as file:
-      config_data = yaml.safe_load(file)
+      config_data = yaml.load(file, Loader=YAML_LOADER)
     return AnalysisConfig(**config_data)
 
   @staticmethod
   def load_donor_data(
     all_raw_data: Optional[Path] = None,
-    donor_dir: Optional[Path] = None
+    donor_dir: Optional[Path] = None,
+    engine: str = EXCEL_ENGINE
   ) -> List[Tuple[str, pd.DataFrame]]:
     """Load donor data from either a single file or directory."""
     if all_raw_data:
-      all_raw_data_df = pd.read_excel(all_raw_data, sheet_name=1, engine='openpyxl')
+      all_raw_data_df = _read_donor_file(all_raw_data, engine)
       return DataLoader._breakout_donor_dfs(all_raw_data_df)
     elif donor_dir:
-      return DataLoader._read_donor_files(donor_dir)
+      return DataLoader._read_donor_files(donor_dir, engine)
     else:
         raise ValueError("Either all_raw_data or donor_dir must be provided")
 
   @staticmethod
   def _breakout_donor_dfs(all_raw_data_df: pd.DataFrame) -> List[Tuple[str, pd.DataFrame]]:
-    """Split combined DataFrame into separate DataFrames per donor."""
-    return [(donor, df) for donor, df in all_raw_data_df.groupby('Layout-Donor')]
+    """Split combined DataFrame into separate DataFrames per donor, in file order."""
+    return list(all_raw_data_df.groupby('Layout-Donor', sort=False))
 
   @staticmethod
-  def _read_donor_files(donor_dir: Path) -> List[Tuple[str, pd.DataFrame]]:
+  def _read_donor_files(donor_dir: Path, engine: str = EXCEL_ENGINE) -> List[Tuple[str, pd.DataFrame]]:
     """Read individual donor files from directory."""
+    files = [
+      file for file in donor_dir.iterdir()
+      if not file.name.startswith('~') and file.suffix in ['.xlsx', '.xls'] # skip temp files
+    ]
+    if len(files) > 1 and sum(file.stat().st_size for file in files) >= PARALLEL_READ_MIN_BYTES:
+      # Parsing large workbooks is CPU bound, so spread the files over processes
+      with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+        dfs = list(executor.map(_read_donor_file, files, repeat(engine)))
+    else:
+      dfs = [_read_donor_file(file, engine) for file in files]
+
     donor_data = []
-    for file in donor_dir.iterdir():
-      if file.name.startswith('~') or not (file.suffix in ['.xlsx', '.xls']): # skip temp files
-        continue
-      df = pd.read_excel(file, sheet_name=1, engine='openpyxl')
-      
+    for file, df in zip(files, dfs):
       unique_donors = df['Layout-Donor'].dropna().unique()
       if len(unique_donors) == 1:
         donor_data.append((unique_donors[0], df))
       else:
         # Multiple donors in one file - split them
         print(f"  - Found {len(unique_donors)} donors in file {file.name}: {list(unique_donors)}")
-        for donor_id in unique_donors:
-          donor_df = df[df['Layout-Donor'] == donor_id]
-          donor_data.append((donor_id, donor_df))
+        donor_data.extend(df.groupby('Layout-Donor', sort=False))
     return donor_data
 
+def _read_donor_file(path: Path, engine: str = EXCEL_ENGINE) -> pd.DataFrame:
+  """Read the data sheet of a single donor workbook (module level so it can be pickled)."""
+  # A callable usecols skips the other columns without failing when one of
+  # ours is missing, so the usual KeyError still points at the real column
+  return pd.read_excel(path, sheet_name=1, engine=engine, usecols=ANALYSIS_COLUMNS.__contains__)
+
 def main():
   parser = argparse.ArgumentParser(description='FluoroSpot Analysis Tool')
   parser.add_argument('-a', '--all_raw_data', type=Path, help='Combined raw donor data file.')
@@ -266,7 +519,9 @@ def main():
   results = analyzer.analyze_donor_data(donor_data)
   
   if not results.empty:
-    results.to_excel(args.results_dir / 'fluorospot-results.xlsx', index=False, engine='openpyxl')
+    results.to_excel(
+      args.results_dir / 'fluorospot-results.xlsx', index=False, engine=EXCEL_WRITER_ENGINE
+    )
     print(f"\nAnalysis complete. Results saved to {args.results_dir / 'fluorospot-results.xlsx'}")
   else:
     print("\nAnalysis finished, but no results were generated. Please check your data and config files.")
@@ -6,7 +6,7 @@ from typing import Dict, Any
 import tempfile
 import os
 
-from fluorospot_analysis import AnalysisConfig
+from fluorospot_analysis import AnalysisConfig, YAML_LOADER
 
 
 class ConfigBuilder:
@@ -105,7 +105,7 @@ class ConfigBuilder:
     """Load configuration from a YAML file."""
     
     with open(file_path, 'r') as file:
-      yaml_config = yaml.safe_load(file)
+      yaml_config = yaml.load(file, Loader=YAML_LOADER)
     
     # Convert to GUI format
     gui_config = {
@@ -1,18 +1,53 @@
 """Main GUI controller for handling analysis operations."""
 
+import os
+import re
 import sys
 import threading
-import queue
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Any, Optional
-import traceback
+import logging
+from collections import deque
 
-from fluorospot_analysis import FluoroSpotAnalyzer, DataLoader
+from fluorospot_analysis import (
+  FluoroSpotAnalyzer, DataLoader, EXCEL_WRITER_ENGINE
+)
 from gui.validation.data_validator import DataValidator
 from gui.validation.config_validator import ConfigValidator
 from gui.core.config_builder import ConfigBuilder
 
 
+logger = logging.getLogger(__name__)
+
+# Validation messages that should prevent analysis, each matched as one
+# alternation instead of a substring check per phrase. "⚠️" is two code
+# points, so results are classified on their first character only.
+_CRITICAL_INPUT_ERRORS_RE = re.compile('|'.join(map(re.escape, [
+  "does not exist",
+  "Cannot read Excel file",
+  "DataFrame is empty",
+  "Missing required columns",
+  "No valid SFU values found"
+])))
+_CRITICAL_CONFIG_ERRORS_RE = re.compile('|'.join(map(re.escape, [
+  "Configuration is empty",
+  "Missing cell count",
+  "Missing SFC cutoff",
+  "Missing control stimulus",
+  "Missing cytokine mappings",
+  "Missing plate mappings",
+  "Cell count must be positive",
+  "SFC cutoff cannot be negative"
+])))
+
+# Donors only go to a process pool when there are at least this many SFU
+# rows in total. A donor's statistics take milliseconds, while a spawned
+# worker (macOS/Windows bundles) spends seconds re-importing pandas and scipy
+# before it can start, so ordinary runs are faster in a plain loop.
+PARALLEL_ANALYSIS_MIN_ROWS = 100_000
+
+
 class GUIController:
   """Main controller for GUI operations and analysis integration."""
   
@@ -22,6 +57,13 @@ class GUIController:
     self.config_builder = ConfigBuilder()
     self.current_analysis_thread = None
     self.cancel_requested = False
+    # Parsed sample sheet and its summary, keyed by (path, mtime)
+    self._sample_cache: dict[tuple[str, float], tuple[Any, Dict[str, Any]]] = {}
+    # (data summary, configuration suggested from it)
+    self._suggestion_cache: Optional[tuple[Dict[str, Any], Dict[str, Any]]] = None
+    # Validation outcomes keyed by the input's path, size and mtime, so
+    # re-validating an unchanged input replays the previous messages
+    self._last_validated: dict[tuple, tuple[bool, bool, list[str]]] = {}
   
   def validate_input_path(self, file_path: str, is_directory: bool) -> tuple[bool, bool, list[str]]:
     """Validate the input file or directory.
@@ -30,6 +72,10 @@ class GUIController:
       tuple: (has_critical_errors, has_warnings, validation_messages)
     """
     
+    key = self._validation_key(file_path, is_directory)
+    if key in self._last_validated:
+      return self._cached_validation(key)
+    
     try:
       path = Path(file_path)
       
@@ -43,20 +89,15 @@ class GUIController:
       has_warnings = False
       
       for result in results:
-        if result.startswith("❌"):
+        prefix = result[:1]
+        if prefix == "❌":
           # Check if this is a critical error that should prevent analysis
-          critical_errors = [
-            "does not exist",
-            "Cannot read Excel file",
-            "DataFrame is empty",
-            "Missing required columns",
-            "No valid SFU values found"
-          ]
-          if any(error in result for error in critical_errors):
+          if _CRITICAL_INPUT_ERRORS_RE.search(result):
             has_critical_errors = True
-        elif result.startswith("⚠️"):
+        elif prefix == "⚠":
           has_warnings = True
       
+      self._store_validation(key, (has_critical_errors, has_warnings, results))
       return has_critical_errors, has_warnings, results
       
     except Exception as e:
@@ -70,6 +111,15 @@ class GUIController:
       tuple: (has_critical_errors, has_warnings, validation_messages)
     """
     
+    # repr() is enough to tell configurations apart: they are plain dicts
+    # built the same way by the config panel each time. The output checks
+    # read the disk too, so the output directory's parent is part of the key
+    key = self._validation_key(file_path, is_directory) if file_path else None
+    if key is not None:
+      key += (repr(config), self._output_parent_state(config))
+      if key in self._last_validated:
+        return self._cached_validation(key)
+    
     try:
       all_results = []
       has_critical_errors = False
@@ -81,20 +131,12 @@ class GUIController:
       
       # Analyze config results
       for result in config_results:
-        if result.startswith("❌"):
+        prefix = result[:1]
+        if prefix == "❌":
           # Only some config errors are critical
-          critical_config_errors = [
-            "Missing cell count",
-            "Missing SFC cutoff", 
-            "Missing control stimulus",
-            "Missing cytokine mappings",
-            "Missing plate mappings",
-            "Cell count must be positive",
-            "SFC cutoff cannot be negative"
-          ]
-          if any(error in result for error in critical_config_errors):
+          if _CRITICAL_CONFIG_ERRORS_RE.search(result):
             has_critical_errors = True
-        elif result.startswith("⚠️"):
+        elif prefix == "⚠":
           has_warnings = True
       
       # Then validate against the data
@@ -103,9 +145,8 @@ class GUIController:
         path = Path(file_path)
         
         if is_directory:
-          # Find first Excel file in directory
-          excel_files = list(path.glob("*.xlsx")) + list(path.glob("*.xls"))
-          excel_files = [f for f in excel_files if not f.name.startswith('~')]
+          # Use the smallest Excel file in the directory as the sample
+          excel_files = self._list_excel_files(path)
           
           if excel_files:
             sample_file = excel_files[0]
@@ -117,12 +158,8 @@ class GUIController:
           sample_file = path
         
         try:
-          # Load sample data
-          import pandas as pd
-          df = pd.read_excel(sample_file, sheet_name=1, engine='openpyxl')
-          
-          # Get data summary
-          data_summary = self.data_validator.get_data_summary(df)
+          # Load sample data and get its summary
+          _, data_summary = self._get_sample(sample_file)
           
           # Validate config against data
           data_compat_valid, data_results = self.config_validator.validate_config_for_data(config, data_summary)
@@ -130,9 +167,10 @@ class GUIController:
           
           # Most data compatibility issues are warnings, not critical errors
           for result in data_results:
-            if result.startswith("⚠️"):
+            prefix = result[:1]
+            if prefix == "⚠":
               has_warnings = True
-            elif result.startswith("❌"):
+            elif prefix == "❌":
               # Only complete mismatches are critical
               if "No matching plates" in result or "Control stimulus" in result and "not found in data" in result:
                 has_critical_errors = True
@@ -142,13 +180,14 @@ class GUIController:
           all_results.append(f"⚠️ {error_msg}")
           has_warnings = True
       
+      self._store_validation(key, (has_critical_errors, has_warnings, all_results))
       return has_critical_errors, has_warnings, all_results
       
     except Exception as e:
       error_msg = f"Configuration validation error: {str(e)}"
       return True, False, [f"❌ {error_msg}"]
   
-  def run_analysis(self, config: Dict[str, Any], file_path: str, is_directory: bool, message_queue: queue.Queue):
+  def run_analysis(self, config: Dict[str, Any], file_path: str, is_directory: bool, message_queue: deque):
     """Run the FluoroSpot analysis in a background thread."""
     
     self.cancel_requested = False
@@ -156,8 +195,8 @@ class GUIController:
     
     try:
       # Send initial progress
-      message_queue.put({'type': 'progress', 'value': 0})
-      message_queue.put({'type': 'status', 'content': 'Preparing analysis...', 'level': 'info'})
+      message_queue.append({'type': 'progress', 'value': 0})
+      message_queue.append({'type': 'status', 'content': 'Preparing analysis...', 'level': 'info'})
       
       # Create temporary configuration file
       temp_config_file = self.config_builder.create_temp_config_file(config)
@@ -165,8 +204,8 @@ class GUIController:
       # Build analysis configuration
       analysis_config = self.config_builder.build_analysis_config(config)
       
-      message_queue.put({'type': 'progress', 'value': 10})
-      message_queue.put({'type': 'status', 'content': 'Loading data...', 'level': 'info'})
+      message_queue.append({'type': 'progress', 'value': 10})
+      message_queue.append({'type': 'status', 'content': 'Loading data...', 'level': 'info'})
       
       # Load donor data
       path = Path(file_path)
@@ -176,42 +215,43 @@ class GUIController:
         donor_data = DataLoader.load_donor_data(all_raw_data=path)
       
       if self.cancel_requested:
-        message_queue.put({'type': 'status', 'content': 'Analysis cancelled', 'level': 'info'})
+        message_queue.append({'type': 'status', 'content': 'Analysis cancelled', 'level': 'info'})
         return
       
-      message_queue.put({'type': 'progress', 'value': 20})
-      message_queue.put({'type': 'status', 'content': f'Loaded data for {len(donor_data)} donor(s)', 'level': 'info'})
+      message_queue.append({'type': 'progress', 'value': 20})
+      message_queue.append({'type': 'status', 'content': f'Loaded data for {len(donor_data)} donor(s)', 'level': 'info'})
       
       # Create analyzer
       analyzer = FluoroSpotAnalyzer(analysis_config)
       
-      message_queue.put({'type': 'progress', 'value': 30})
-      message_queue.put({'type': 'status', 'content': 'Starting analysis...', 'level': 'info'})
+      message_queue.append({'type': 'progress', 'value': 30})
+      message_queue.append({'type': 'status', 'content': 'Starting analysis...', 'level': 'info'})
       
       # Run analysis with progress tracking
       results = self.run_analysis_with_progress(analyzer, donor_data, message_queue)
       
       if self.cancel_requested:
-        message_queue.put({'type': 'status', 'content': 'Analysis cancelled', 'level': 'info'})
+        message_queue.append({'type': 'status', 'content': 'Analysis cancelled', 'level': 'info'})
         return
       
       if results.empty:
-        message_queue.put({'type': 'error', 'content': 'Analysis completed but no results were generated. Please check your data and configuration.'})
+        message_queue.append({'type': 'error', 'content': 'Analysis completed but no results were generated. Please check your data and configuration.'})
         return
       
-      message_queue.put({'type': 'progress', 'value': 90})
-      message_queue.put({'type': 'status', 'content': 'Saving results...', 'level': 'info'})
+      message_queue.append({'type': 'progress', 'value': 90})
+      message_queue.append({'type': 'status', 'content': 'Saving results...', 'level': 'info'})
       
       # Save results
       output_path = self.config_builder.get_output_path(config)
-      results.to_excel(output_path, index=False, engine='openpyxl')
+      self._write_results(results, output_path, message_queue)
       
-      message_queue.put({'type': 'progress', 'value': 100})
-      message_queue.put({'type': 'complete', 'success': True, 'content': str(output_path)})
+      message_queue.append({'type': 'progress', 'value': 100})
+      message_queue.append({'type': 'complete', 'success': True, 'content': str(output_path)})
       
     except Exception as e:
-      error_msg = f"Analysis failed: {str(e)}\n\n{traceback.format_exc()}"
-      message_queue.put({'type': 'error', 'content': error_msg})
+      # The full traceback goes to the log file; the GUI only needs the summary
+      logger.exception("Analysis failed")
+      message_queue.append({'type': 'error', 'content': f"Analysis failed: {e}", 'logged': True})
       
     finally:
       # Clean up temporary config file
@@ -222,39 +262,94 @@ class GUIController:
     """Run analysis with progress updates."""
     
     total_donors = len(donor_data)
-    all_results = []
+    results_by_index = {}
     
-    for i, (donor_id, donor_df) in enumerate(donor_data):
-      if self.cancel_requested:
-        break
-        
-      # Update progress
-      progress = 30 + (i / total_donors) * 50  # 30-80% for donor processing
-      message_queue.put({'type': 'progress', 'value': progress})
-      message_queue.put({'type': 'status', 'content': f'Analyzing donor {i+1}/{total_donors}: {donor_id}', 'level': 'info'})
-      
-      # Analyze single donor
+    def record_result(i, donor_id, donor_rows):
+      """Keep one donor's result rows and report the outcome."""
+      if donor_rows:
+        results_by_index[i] = donor_rows
+        message_queue.append({'type': 'status', 'content': f'✅ Completed analysis for donor: {donor_id}', 'level': 'info'})
+      else:
+        message_queue.append({'type': 'status', 'content': f'⚠️ No results for donor: {donor_id}', 'level': 'warning'})
+    
+    def report_error(donor_id, error):
+      message_queue.append({'type': 'status', 'content': f'❌ Error analyzing donor {donor_id}: {str(error)}', 'level': 'error'})
+    
+    total_rows = sum(len(donor_df) for _, donor_df in donor_data)
+    if total_donors > 1 and total_rows >= PARALLEL_ANALYSIS_MIN_ROWS:
+      # Donors are independent and the statistics are CPU bound, so analyze
+      # them in parallel and report each one as it finishes
+      message_queue.append({'type': 'status', 'content': f'Analyzing {total_donors} donors in parallel...', 'level': 'info'})
+      # The analyzer only holds the config, so pickling it with each donor
+      # is negligible next to the donor's rows
+      executor = ProcessPoolExecutor(max_workers=min(total_donors, os.cpu_count() or 1))
       try:
-        donor_results = analyzer._analyze_single_donor(donor_id, donor_df)
-        if not donor_results.empty:
-          all_results.append(donor_results)
-          message_queue.put({'type': 'status', 'content': f'✅ Completed analysis for donor: {donor_id}', 'level': 'info'})
-        else:
-          message_queue.put({'type': 'status', 'content': f'⚠️ No results for donor: {donor_id}', 'level': 'warning'})
-      except Exception as e:
-        message_queue.put({'type': 'status', 'content': f'❌ Error analyzing donor {donor_id}: {str(e)}', 'level': 'error'})
-        continue
+        futures = {
+          executor.submit(analyzer._analyze_single_donor_rows, donor_id, donor_df): (i, donor_id)
+          for i, (donor_id, donor_df) in enumerate(donor_data)
+        }
+        for completed, future in enumerate(as_completed(futures), start=1):
+          if self.cancel_requested:
+            break
+          
+          # Update progress
+          progress = 30 + (completed / total_donors) * 50  # 30-80% for donor processing
+          message_queue.append({'type': 'progress', 'value': progress})
+          
+          i, donor_id = futures[future]
+          try:
+            record_result(i, donor_id, future.result())
+          except Exception as e:
+            report_error(donor_id, e)
+      finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    else:
+      for i, (donor_id, donor_df) in enumerate(donor_data):
+        if self.cancel_requested:
+          break
+        
+        # Update progress
+        progress = 30 + (i / total_donors) * 50  # 30-80% for donor processing
+        message_queue.append({'type': 'progress', 'value': progress})
+        message_queue.append({'type': 'status', 'content': f'Analyzing donor {i+1}/{total_donors}: {donor_id}', 'level': 'info'})
+        
+        # Analyze single donor
+        try:
+          record_result(i, donor_id, analyzer._analyze_single_donor_rows(donor_id, donor_df))
+        except Exception as e:
+          report_error(donor_id, e)
+    
+    # Build one results frame from every donor's rows, in the original donor
+    # order, instead of a frame per donor followed by a concat
+    all_rows = [row for i in sorted(results_by_index) for row in results_by_index[i]]
     
-    # Combine all results
     import pandas as pd
-    if all_results:
-      final_results = pd.concat(all_results, ignore_index=True)
-      message_queue.put({'type': 'progress', 'value': 85})
-      message_queue.put({'type': 'status', 'content': f'Analysis complete. Generated {len(final_results)} result rows.', 'level': 'info'})
+    if all_rows:
+      final_results = analyzer._build_results_frame(all_rows)
+      message_queue.append({'type': 'progress', 'value': 85})
+      message_queue.append({'type': 'status', 'content': f'Analysis complete. Generated {len(final_results)} result rows.', 'level': 'info'})
       return final_results
     else:
       return pd.DataFrame()
   
+  def _write_results(self, results, output_path, message_queue, chunk_rows: int = 5000):
+    """Write the results workbook in row chunks, reporting progress (90-100%).
+    
+    The analysis already runs off the UI thread, so the write only needs to
+    keep the progress bar moving. Each chunk is placed below the previous
+    one on the same sheet; to_excel fills a chunk column by column, so the
+    writer must keep the whole sheet in memory (not constant_memory).
+    """
+    import pandas as pd
+    total_rows = len(results)
+    with pd.ExcelWriter(output_path, engine=EXCEL_WRITER_ENGINE) as writer:
+      for start in range(0, total_rows, chunk_rows):
+        end = min(start + chunk_rows, total_rows)
+        results.iloc[start:end].to_excel(
+          writer, index=False, header=start == 0, startrow=0 if start == 0 else start + 1
+        )
+        message_queue.append({'type': 'progress', 'value': 90 + (end / total_rows) * 10})
+  
   def cancel_analysis(self):
     """Cancel the currently running analysis."""
     self.cancel_requested = True
@@ -266,9 +361,8 @@ class GUIController:
       path = Path(file_path)
       
       if is_directory:
-        # Find first Excel file in directory
-        excel_files = list(path.glob("*.xlsx")) + list(path.glob("*.xls"))
-        excel_files = [f for f in excel_files if not f.name.startswith('~')]
+        # Use the smallest Excel file in the directory as the sample
+        excel_files = self._list_excel_files(path)
         
         if not excel_files:
           return None
@@ -278,21 +372,109 @@ class GUIController:
         sample_file = path
       
       # Load sample data
-      import pandas as pd
-      df = pd.read_excel(sample_file, sheet_name=1, engine='openpyxl')
+      _, data_summary = self._get_sample(sample_file)
       
-      return self.data_validator.get_data_summary(df)
+      return data_summary
       
     except Exception as e:
       print(f"Error getting data summary: {str(e)}")
       return None
   
+  @staticmethod
+  def _scan_excel_files(directory) -> list[os.DirEntry]:
+    """Return the directory entries of the Excel files in a directory.
+    
+    Temporary lock files (~$name.xlsx) are skipped.
+    """
+    with os.scandir(directory) as entries:
+      return [
+        entry for entry in entries
+        if entry.is_file() and not entry.name.startswith('~')
+        and entry.name.lower().endswith(('.xlsx', '.xls'))
+      ]
+  
+  @classmethod
+  def _list_excel_files(cls, directory: Path) -> list[Path]:
+    """List the Excel files in a directory, smallest first, in a single scan."""
+    excel_files = [(entry.stat().st_size, entry.path) for entry in cls._scan_excel_files(directory)]
+    return [Path(file_path) for _, file_path in sorted(excel_files)]
+  
+  @classmethod
+  def _validation_key(cls, file_path: str, is_directory: bool) -> Optional[tuple]:
+    """Identify the current state of an input by path, size and mtime.
+    
+    A directory's state covers each of its Excel files. Returns None when
+    the input can't be read, so missing paths are always re-validated.
+    """
+    try:
+      if is_directory:
+        state = tuple(sorted(
+          (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+          for entry in cls._scan_excel_files(file_path)
+        ))
+      else:
+        stat = os.stat(file_path)
+        state = (stat.st_size, stat.st_mtime_ns)
+    except OSError:
+      return None
+    return (str(file_path), is_directory, state)
+  
+  @staticmethod
+  def _output_parent_state(config: Dict[str, Any]) -> Optional[tuple]:
+    """Identify the state of the output directory's parent on disk.
+    
+    ctime is included because permission changes don't touch mtime. Returns
+    None when the parent can't be read, which is itself a distinct state.
+    """
+    try:
+      stat = os.stat(Path(config['output_dir']).parent)
+    except (KeyError, TypeError, ValueError, OSError):
+      return None
+    return (stat.st_mode, stat.st_mtime_ns, stat.st_ctime_ns)
+  
+  def _cached_validation(self, key: tuple) -> tuple[bool, bool, list[str]]:
+    """Replay a stored validation outcome."""
+    has_critical_errors, has_warnings, results = self._last_validated[key]
+    return has_critical_errors, has_warnings, list(results)
+  
+  def _store_validation(self, key: Optional[tuple], outcome: tuple[bool, bool, list[str]]):
+    """Remember a validation outcome for an unchanged input."""
+    if key is None:
+      return
+    # Keep only outcomes for the input being validated now
+    self._last_validated = {k: v for k, v in self._last_validated.items() if k[:3] == key[:3]}
+    has_critical_errors, has_warnings, results = outcome
+    self._last_validated[key] = (has_critical_errors, has_warnings, list(results))
+  
+  def _get_sample(self, sample_file: Path) -> tuple[Any, Dict[str, Any]]:
+    """Return the sample DataFrame and its summary, parsing the file only once.
+    
+    Selecting a file triggers several validation/summary calls on the same
+    sample; they share one parse until the file is modified.
+    """
+    key = (str(sample_file), sample_file.stat().st_mtime)
+    if key not in self._sample_cache:
+      df, columns = self.data_validator.read_sheet(sample_file)
+      # Only the most recent sample is ever needed
+      self._sample_cache = {key: (df, self.data_validator.get_data_summary(df, columns))}
+    return self._sample_cache[key]
+  
   def suggest_configuration_from_data(self, file_path: str, is_directory: bool) -> Optional[Dict[str, Any]]:
     """Suggest configuration values based on the data content."""
     
     data_summary = self.get_data_summary(file_path, is_directory)
     
     if data_summary:
-      return self.config_validator.suggest_configuration_from_data(data_summary)
+      # The summary object is reused from the sample cache while the file is
+      # unchanged, so the suggestion derived from it can be reused too
+      if self._suggestion_cache is None or self._suggestion_cache[0] is not data_summary:
+        suggestion = self.config_validator.suggest_configuration_from_data(data_summary)
+        self._suggestion_cache = (data_summary, suggestion)
+      return self._suggestion_cache[1]
     
-    return None
\ No newline at end of file
+    return None
+  
+  def invalidate_sample_cache(self):
+    """Drop the cached sample data and suggestion, e.g. when a new input is selected."""
+    self._sample_cache = {}
+    self._suggestion_cache = None
\ No newline at end of file
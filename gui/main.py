@@ -11,20 +11,52 @@ from tkinter import ttk, messagebox, filedialog
 import sys
 from pathlib import Path
 import threading
-import queue
 import os
+import logging
+from collections import deque
 
 # Use absolute imports
 from gui.widgets.file_selector import FileSelector
 from gui.widgets.config_panel import ConfigPanel
-from gui.widgets.progress_dialog import ProgressDialog
 from gui.core.gui_controller import GUIController
 from gui.core.config_builder import ConfigBuilder
 
 
+# Status styling by a message's leading emoji ("⚠️" is "⚠" plus a variation
+# selector, so only the first character is looked up)
+STATUS_LEVELS = {"✅": "success", "⚠": "warning", "❌": "error"}
+
+
+def status_level(message):
+  """Return the status-panel level for a validation message."""
+  return STATUS_LEVELS.get(message[:1], "info")
+
+
+# Full tracebacks from failed analyses are written here rather than to the
+# status panel
+LOG_FILE = Path.home() / "FluoroSpot_Results" / "fluorospot_gui.log"
+
+
+class _LazyLogFileHandler(logging.FileHandler):
+  """File handler that only creates the log directory when a record is written."""
+  
+  def __init__(self, filename):
+    super().__init__(filename, delay=True)
+  
+  def _open(self):
+    Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+    return super()._open()
+
+
 class FluoroSpotGUI:
   """Main application window for FluoroSpot analysis."""
   
+  # Upper bound on queued messages handled per 100ms tick, so a flood of
+  # status updates can't starve the Tk event loop
+  MAX_MESSAGES_PER_TICK = 200
+  # Oldest status rows are dropped beyond this many
+  MAX_STATUS_ROWS = 1000
+  
   def __init__(self):
     self.root = tk.Tk()
     self.root.title("FluoroSpot Analysis Tool")
@@ -34,7 +66,6 @@ class FluoroSpotGUI:
     # Initialize components
     self.controller = GUIController()
     self.config_builder = ConfigBuilder()
-    self.progress_dialog = None
     
     # Validation state tracking
     self.file_has_critical_errors = False
@@ -42,8 +73,10 @@ class FluoroSpotGUI:
     self.config_has_critical_errors = False
     self.config_has_warnings = False
     
-    # Message queue for thread communication
-    self.message_queue = queue.Queue()
+    # Message queue for thread communication. There is one producer (the
+    # analysis thread) and one consumer (the Tk loop), and deque append and
+    # popleft are atomic, so queue.Queue's locking isn't needed
+    self.message_queue = deque()
     
     self.setup_ui()
     self.setup_menu()
@@ -144,24 +177,29 @@ class FluoroSpotGUI:
     status_frame.columnconfigure(0, weight=1)
     status_frame.rowconfigure(0, weight=1)
     
-    # Status text with scrollbar
+    # Status log with scrollbar
     text_frame = ttk.Frame(status_frame)
     text_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
     text_frame.columnconfigure(0, weight=1)
     text_frame.rowconfigure(0, weight=1)
     
-    self.status_text = tk.Text(
+    # A Treeview appends rows in constant time however long the log gets,
+    # where a Text widget re-lays out its growing contents
+    self.status_list = ttk.Treeview(
       text_frame,
+      show='tree',
       height=6,
-      wrap=tk.WORD,
-      state=tk.DISABLED,
-      bg=self.root.cget('bg')
+      selectmode='none'
     )
+    self.status_list.tag_configure("success", foreground="green")
+    self.status_list.tag_configure("error", foreground="red")
+    self.status_list.tag_configure("warning", foreground="orange")
+    self.status_list.tag_configure("info", foreground="black")
     
-    scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.status_text.yview)
-    self.status_text.configure(yscrollcommand=scrollbar.set)
+    scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.status_list.yview)
+    self.status_list.configure(yscrollcommand=scrollbar.set)
     
-    self.status_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+    self.status_list.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
     scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
     
     # Progress bar
@@ -205,21 +243,17 @@ class FluoroSpotGUI:
   # Event handlers
   def on_file_selected(self, file_path, is_directory):
     """Handle file selection."""
-    self.add_status_message(f"Selected {'directory' if is_directory else 'file'}: {file_path}")
+    # A new selection makes any cached sample data stale
+    self.controller.invalidate_sample_cache()
+    
+    # Validation below blocks the main loop, so show the selection first
+    self.add_status_message(f"Selected {'directory' if is_directory else 'file'}: {file_path}", force_update=True)
     
     # Validate the selected file/directory with detailed messages
     has_critical_errors, has_warnings, results = self.controller.validate_input_path(file_path, is_directory)
     
     # Display all validation results
-    for result in results:
-      if result.startswith("✅"):
-        self.add_status_message(result, "success")
-      elif result.startswith("⚠️"):
-        self.add_status_message(result, "warning")
-      elif result.startswith("❌"):
-        self.add_status_message(result, "error")
-      else:
-        self.add_status_message(result, "info")
+    self.append_status_messages([(result, status_level(result)) for result in results])
     
     # Store validation state for later use
     self.file_has_critical_errors = has_critical_errors
@@ -232,7 +266,7 @@ class FluoroSpotGUI:
     else:
       self.add_status_message("✅ Input file validation passed.", "success")
   
-  def on_config_changed(self, config_data):
+  def on_config_changed(self):
     """Handle configuration changes."""
     # Real-time validation could be added here
     pass
@@ -251,17 +285,7 @@ class FluoroSpotGUI:
       has_critical_errors, has_warnings, results = self.controller.validate_configuration(config_data, file_path, is_directory)
       
       # Display all validation results
-      for result in results:
-        if result.startswith("✅"):
-          self.add_status_message(result, "success")
-        elif result.startswith("⚠️"):
-          self.add_status_message(result, "warning")
-        elif result.startswith("❌"):
-          self.add_status_message(result, "error")
-        elif result.startswith("📁"):
-          self.add_status_message(result, "info")
-        else:
-          self.add_status_message(result, "info")
+      self.append_status_messages([(result, status_level(result)) for result in results])
       
       # Store validation state for later use
       self.config_has_critical_errors = has_critical_errors
@@ -319,9 +343,7 @@ class FluoroSpotGUI:
       self.file_selector.reset()
       self.config_panel.reset()
       self.progress_var.set(0)
-      self.status_text.config(state=tk.NORMAL)
-      self.status_text.delete(1.0, tk.END)
-      self.status_text.config(state=tk.DISABLED)
+      self.status_list.delete(*self.status_list.get_children())
       self.add_status_message("Form reset to default values.")
       self.run_btn.config(state='disabled')
   
@@ -366,37 +388,38 @@ For support, please contact the development team."""
     messagebox.showinfo("About", about_text)
   
   # Utility methods
-  def add_status_message(self, message, level="info"):
-    """Add a status message to the status panel with appropriate styling."""
-    self.status_text.config(state=tk.NORMAL)
+  def add_status_message(self, message, level="info", force_update=False):
+    """Add a status message to the status panel with appropriate styling.
+    
+    Tk redraws on its own at the next idle point; pass force_update=True
+    only when the message must show before blocking work on the main thread.
+    """
+    self.append_status_messages([(message, level)])
+    
+    if force_update:
+      self.root.update_idletasks()
+  
+  def append_status_messages(self, messages):
+    """Append (message, level) pairs to the status panel."""
+    if not messages:
+      return
     
     # Add timestamp
     from datetime import datetime
     timestamp = datetime.now().strftime("%H:%M:%S")
-    full_message = f"[{timestamp}] {message}\n"
     
-    # Configure tag colors if not already configured
-    if not hasattr(self, '_tags_configured'):
-      self.status_text.tag_configure("success", foreground="green")
-      self.status_text.tag_configure("error", foreground="red")
-      self.status_text.tag_configure("warning", foreground="orange")
-      self.status_text.tag_configure("info", foreground="black")
-      self._tags_configured = True
+    # Treeview rows are single-line, so multi-line messages get one row per line
+    for message, level in messages:
+      tags = (level,) if level in ["success", "error", "warning", "info"] else ()
+      for line in str(message).splitlines() or [""]:
+        last_item = self.status_list.insert('', tk.END, text=f"[{timestamp}] {line}", tags=tags)
     
-    # Insert message with appropriate tag
-    start_idx = self.status_text.index(tk.END)
-    self.status_text.insert(tk.END, full_message)
-    end_idx = self.status_text.index(tk.END)
+    # Keep the log bounded by dropping the oldest rows
+    items = self.status_list.get_children()
+    if len(items) > self.MAX_STATUS_ROWS:
+      self.status_list.delete(*items[:len(items) - self.MAX_STATUS_ROWS])
     
-    # Apply tag to the message
-    if level in ["success", "error", "warning", "info"]:
-      self.status_text.tag_add(level, start_idx, end_idx)
-    
-    self.status_text.see(tk.END)
-    self.status_text.config(state=tk.DISABLED)
-    
-    # Update the UI
-    self.root.update_idletasks()
+    self.status_list.see(last_item)
   
   def set_ui_state(self, enabled):
     """Enable or disable UI elements during analysis."""
@@ -409,24 +432,32 @@ For support, please contact the development team."""
   
   def process_messages(self):
     """Process messages from the analysis thread."""
+    # Status lines are drained in bounded batches and inserted together;
+    # they are flushed before completion/error handling so ordering is kept
+    pending_status = []
     try:
-      while True:
-        message = self.message_queue.get_nowait()
+      for _ in range(self.MAX_MESSAGES_PER_TICK):
+        if not self.message_queue:
+          break
+        message = self.message_queue.popleft()
         msg_type = message.get('type', 'info')
         content = message.get('content', '')
         
         if msg_type == 'progress':
           self.progress_var.set(message.get('value', 0))
         elif msg_type == 'status':
-          self.add_status_message(content, message.get('level', 'info'))
+          pending_status.append((content, message.get('level', 'info')))
         elif msg_type == 'complete':
+          self.append_status_messages(pending_status)
+          pending_status = []
           self.analysis_complete(message.get('success', False), content)
         elif msg_type == 'error':
-          self.analysis_error(content)
+          self.append_status_messages(pending_status)
+          pending_status = []
+          self.analysis_error(content, message.get('logged', False))
           
-    except queue.Empty:
-      pass
     finally:
+      self.append_status_messages(pending_status)
       # Schedule next check
       self.root.after(100, self.process_messages)
   
@@ -456,11 +487,15 @@ For support, please contact the development team."""
     else:
       self.add_status_message("❌ Analysis failed. Please check the error messages above.", "error")
   
-  def analysis_error(self, error_message):
-    """Handle analysis error."""
+  def analysis_error(self, error_message, logged=False):
+    """Handle analysis error.
+    
+    `logged` errors had their full traceback written to LOG_FILE.
+    """
     self.set_ui_state(True)
     self.add_status_message(f"❌ Analysis error: {error_message}", "error")
-    messagebox.showerror("Analysis Error", f"An error occurred during analysis:\n\n{error_message}")
+    details = f"\n\nFull details were written to:\n{LOG_FILE}" if logged else ""
+    messagebox.showerror("Analysis Error", f"An error occurred during analysis:\n\n{error_message}{details}")
   
   def run(self):
     """Start the GUI application."""
@@ -469,6 +504,12 @@ For support, please contact the development team."""
 
 def main():
   """Main entry point for the application."""
+  # The log file (and its directory) is only created once something is logged
+  logging.basicConfig(
+    handlers=[_LazyLogFileHandler(LOG_FILE)], level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+  )
+  
   try:
     # Check Python version
     if sys.version_info < (3, 7):
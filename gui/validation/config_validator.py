@@ -1,39 +1,60 @@
 """Configuration validation for FluoroSpot analysis settings."""
 
+import os
 import re
+import stat
+from itertools import islice
 from typing import Dict, Any, List, Tuple
 from pathlib import Path
 
 
+# An LED's total population, e.g. "LED490 Total"; group 1 is the LED name
+LED_TOTAL_PATTERN = re.compile(r'^(LED\d{3}) Total$')
+
+
 class ConfigValidator:
   """Validator for FluoroSpot analysis configuration."""
   
   LED_PATTERN = re.compile(r'^LED\d{3}$')
   FILENAME_PATTERN = re.compile(r'^[^<>:"/\\|?*]+$')  # Valid filename characters
   
+  # Integer settings checked by validate_basic_settings, as
+  # (key, label, checks, ok message). Each check is (predicate, message,
+  # is_error) and the first failing check is reported.
+  INTEGER_SETTINGS = (
+    ('cells_per_well', 'cell count', (
+      (lambda value: value <= 0, "❌ Cell count must be positive", True),
+      (lambda value: value < 1000, "⚠️ Cell count is very low ({})", False),
+    ), "✅ Cells plated: {:,}"),
+    ('sfc_cutoff', 'SFC cutoff', (
+      (lambda value: value < 0, "❌ SFC cutoff cannot be negative", True),
+    ), "✅ SFC cutoff: {}"),
+  )
+  
+  # Top-level settings every analysis needs
+  REQUIRED_KEYS = ('cells_per_well', 'sfc_cutoff', 'control_stim', 'cytokines', 'plates', 'output_dir', 'results_filename')
+  
   def __init__(self):
     self.validation_results = []
   
   def validate_configuration(self, config: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """Validate the complete configuration."""
     self.validation_results = []
-    valid = True
-    
-    # Validate basic settings
-    if not self.validate_basic_settings(config):
-      valid = False
     
-    # Validate mappings
-    if not self.validate_mappings(config):
-      valid = False
-    
-    # Validate experimental conditions
-    if not self.validate_experimental_conditions(config):
-      valid = False
+    # Nothing to check section by section when no setting is present
+    if not any(key in config for key in self.REQUIRED_KEYS):
+      self.validation_results.append("❌ Configuration is empty")
+      return False, self.validation_results
     
-    # Validate output settings
-    if not self.validate_output_settings(config):
-      valid = False
+    valid = True
+    for validate_section in (
+      self.validate_basic_settings,
+      self.validate_mappings,
+      self.validate_experimental_conditions,
+      self.validate_output_settings,
+    ):
+      if not validate_section(config):
+        valid = False
     
     return valid, self.validation_results
   
@@ -41,39 +62,25 @@ class ConfigValidator:
     """Validate basic configuration settings."""
     valid = True
     
-    # Validate cell count
-    if 'cells_per_well' not in config:
-      self.validation_results.append("❌ Missing cell count")
-      valid = False
-    else:
-      try:
-        cells_per_well = int(config['cells_per_well'])
-        if cells_per_well <= 0:
-          self.validation_results.append("❌ Cell count must be positive")
-          valid = False
-        elif cells_per_well < 1000:
-          self.validation_results.append(f"⚠️ Cell count is very low ({cells_per_well})")
-        else:
-          self.validation_results.append(f"✅ Cells plated: {cells_per_well:,}")
-      except (ValueError, TypeError):
-        self.validation_results.append("❌ Cell count must be a valid integer")
+    # Validate the integer settings
+    for key, label, checks, ok_message in self.INTEGER_SETTINGS:
+      if key not in config:
+        self.validation_results.append(f"❌ Missing {label}")
         valid = False
-    
-    # Validate SFC cutoff
-    if 'sfc_cutoff' not in config:
-      self.validation_results.append("❌ Missing SFC cutoff")
-      valid = False
-    else:
+        continue
       try:
-        sfc_cutoff = int(config['sfc_cutoff'])
-        if sfc_cutoff < 0:
-          self.validation_results.append("❌ SFC cutoff cannot be negative")
-          valid = False
-        else:
-          self.validation_results.append(f"✅ SFC cutoff: {sfc_cutoff}")
+        value = int(config[key])
       except (ValueError, TypeError):
-        self.validation_results.append("❌ SFC cutoff must be a valid integer")
+        self.validation_results.append(f"❌ {label[:1].upper()}{label[1:]} must be a valid integer")
         valid = False
+        continue
+      for failed, message, is_error in checks:
+        if failed(value):
+          self.validation_results.append(message.format(value))
+          valid = valid and not is_error
+          break
+      else:
+        self.validation_results.append(ok_message.format(value))
     
     # Validate control stimulus
     if 'control_stim' not in config:
@@ -267,16 +274,20 @@ class ConfigValidator:
     else:
       output_dir = Path(config['output_dir'])
       try:
-        # Check if parent directory exists and is writable
+        # Check if parent directory exists and is writable, with a single
+        # stat call; each one can be slow on network drives
         parent_dir = output_dir.parent
-        if not parent_dir.exists():
+        try:
+          parent_mode = parent_dir.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError):
+          parent_mode = None
+        if parent_mode is None:
           self.validation_results.append(f"❌ Parent directory does not exist: {parent_dir}")
           valid = False
-        elif not parent_dir.is_dir():
+        elif not stat.S_ISDIR(parent_mode):
           self.validation_results.append(f"❌ Parent path is not a directory: {parent_dir}")
           valid = False
         else:
-          import os
           if not os.access(str(parent_dir), os.W_OK):
             self.validation_results.append(f"❌ No write permission to directory: {parent_dir}")
             valid = False
@@ -318,10 +329,10 @@ class ConfigValidator:
       if control_stim in data_stimuli:
         results.append(f"✅ Control stimulus '{control_stim}' found in data")
       else:
-        # Look for partial matches
-        partial_matches = [s for s in data_stimuli if control_stim in str(s)]
+        # Look for partial matches; only the first three are reported
+        partial_matches = list(islice((s for s in data_stimuli if control_stim in str(s)), 3))
         if partial_matches:
-          results.append(f"⚠️ Control stimulus '{control_stim}' not found exactly, similar: {', '.join(map(str, partial_matches[:3]))}")
+          results.append(f"⚠️ Control stimulus '{control_stim}' not found exactly, similar: {', '.join(map(str, partial_matches))}")
         else:
           results.append(f"❌ Control stimulus '{control_stim}' not found in data")
           valid = False
@@ -345,7 +356,7 @@ class ConfigValidator:
     # Check LED mappings
     if 'cytokines' in config and 'led_populations' in data_summary:
       config_leds = set(config['cytokines'].values())
-      data_leds = set(pop.replace(' Total', '') for pop in data_summary['led_populations'] if ' Total' in pop)
+      data_leds = {m.group(1) for m in map(LED_TOTAL_PATTERN.match, map(str, data_summary['led_populations'])) if m}
       
       missing_leds = config_leds - data_leds
       if missing_leds:
@@ -375,7 +386,7 @@ class ConfigValidator:
     # Suggest cytokine mappings from LED populations
     if 'led_populations' in data_summary:
       led_populations = data_summary['led_populations']
-      leds = [pop.replace(' Total', '') for pop in led_populations if ' Total' in pop]
+      leds = [m.group(1) for m in map(LED_TOTAL_PATTERN.match, map(str, led_populations)) if m]
       
       # Common LED to cytokine mappings
       common_mappings = {
@@ -1,9 +1,41 @@
 """Data validation for Excel files and FluoroSpot data."""
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Any
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from fluorospot_analysis import EXCEL_ENGINE
+from gui.validation.config_validator import LED_TOTAL_PATTERN
+
+
+class _DataFrameStats:
+  """Per-column unique values and SFU statistics of one DataFrame.
+  
+  Each is computed on first use, so the checks and the summary share them.
+  """
+  
+  def __init__(self, df: pd.DataFrame):
+    self.df = df
+    self._uniques = {}
+    self._sfu = None
+  
+  def unique(self, column: str) -> np.ndarray:
+    """Non-null unique values of a column."""
+    if column not in self._uniques:
+      self._uniques[column] = self.df[column].dropna().unique()
+    return self._uniques[column]
+  
+  @property
+  def sfu(self) -> Dict[str, Any]:
+    """SFU column statistics, see DataValidator._sfu_stats."""
+    if self._sfu is None:
+      self._sfu = DataValidator._sfu_stats(self.df['Spot Forming Units (SFU)'])
+    return self._sfu
 
 
 class DataValidator:
@@ -17,10 +49,52 @@ class DataValidator:
     'Analyte Secreting Population'
   ]
   
+  # Columns read by get_data_summary and the configuration checks; sample
+  # reads can skip every other column
+  SUMMARY_COLUMNS = REQUIRED_COLUMNS
+  
   LED_PATTERN = re.compile(r'LED\d{3} Total')
   
+  # How many workbooks' sheet metadata is kept, most recently used first
+  WB_META_CACHE_SIZE = 32
+  
   def __init__(self):
     self.validation_results = []
+    # Sheet names of workbooks already opened, keyed by (path, mtime_ns, size),
+    # so a later full validation knows which sheet to read without reopening
+    self._wb_meta_cache: OrderedDict[Tuple[str, int, int], Dict[str, Any]] = OrderedDict()
+    # Directory validation checks files from several threads
+    self._wb_meta_lock = threading.Lock()
+    # Stats of the DataFrame checked most recently
+    self._df_stats: Optional[_DataFrameStats] = None
+  
+  def _stats(self, df: pd.DataFrame) -> _DataFrameStats:
+    """Return the shared stats for df, reusing them while df is unchanged."""
+    if self._df_stats is None or self._df_stats.df is not df:
+      self._df_stats = _DataFrameStats(df)
+    return self._df_stats
+  
+  def _cached_meta(self, key: Tuple[str, int, int]) -> Optional[Dict[str, Any]]:
+    """Return a workbook's cached metadata, marking it recently used."""
+    with self._wb_meta_lock:
+      meta = self._wb_meta_cache.get(key)
+      if meta is not None:
+        self._wb_meta_cache.move_to_end(key)
+      return meta
+  
+  def _store_meta(self, key: Tuple[str, int, int], meta: Dict[str, Any]):
+    """Cache a workbook's metadata, evicting the least recently used entry."""
+    with self._wb_meta_lock:
+      self._wb_meta_cache[key] = meta
+      self._wb_meta_cache.move_to_end(key)
+      if len(self._wb_meta_cache) > self.WB_META_CACHE_SIZE:
+        self._wb_meta_cache.popitem(last=False)
+  
+  @staticmethod
+  def _workbook_key(file_path: Path) -> Tuple[str, int, int]:
+    """Key a workbook by path, modification time and size."""
+    stat = file_path.stat()
+    return (str(file_path), stat.st_mtime_ns, stat.st_size)
   
   def validate_file(self, file_path: Path) -> Tuple[bool, List[str]]:
     """Validate a single Excel file."""
@@ -35,26 +109,74 @@ class DataValidator:
       if file_path.suffix.lower() not in ['.xlsx', '.xls']:
         self.validation_results.append(f"⚠️ File is not an Excel file: {file_path}")
       
+      # Workbooks already seen with a single sheet go straight to sheet 0
+      meta = self._cached_meta(self._workbook_key(file_path))
+      
       # Try to read the Excel file
       try:
-        df = pd.read_excel(file_path, sheet_name=1, engine='openpyxl')
+        if meta is not None and len(meta['sheets']) < 2:
+          raise IndexError("Worksheet index 1 is invalid, only 1 worksheet found")
+        df, columns = self.read_sheet(file_path, 1)
         self.validation_results.append(f"✅ Successfully loaded Excel file (sheet 1)")
       except Exception as e:
         try:
           # Try sheet 0 if sheet 1 fails
-          df = pd.read_excel(file_path, sheet_name=0, engine='openpyxl')
+          df, columns = self.read_sheet(file_path, 0)
           self.validation_results.append(f"⚠️ Using sheet 0 instead of sheet 1")
         except Exception as e2:
           self.validation_results.append(f"❌ Cannot read Excel file: {str(e)}")
           return False, self.validation_results
       
       # Validate DataFrame structure
-      return self.validate_dataframe(df, str(file_path))
+      return self.validate_dataframe(df, str(file_path), columns)
       
     except Exception as e:
       self.validation_results.append(f"❌ Validation error: {str(e)}")
       return False, self.validation_results
   
+  def read_sheet(self, file_path: Path, sheet_name: int = 1) -> Tuple[pd.DataFrame, List[str]]:
+    """Read only the columns validation and summaries inspect from one sheet.
+    
+    Returns the DataFrame and the sheet's full header. All rows are read:
+    the summary lists every donor, plate and stimulus on the sheet.
+    """
+    if EXCEL_ENGINE == 'openpyxl' and file_path.suffix.lower() == '.xlsx':
+      # Without calamine, stream the cells straight out of a read-only
+      # workbook in one pass; pandas' per-cell conversion would otherwise
+      # cost more than parsing the sheet
+      import openpyxl
+      wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+      try:
+        rows = wb.worksheets[sheet_name].iter_rows(values_only=True)
+        columns = list(next(rows, ()))
+        indices = [i for i, column in enumerate(columns) if column in self.SUMMARY_COLUMNS]
+        if not indices:
+          # None of the expected columns exist; keep them all so the
+          # missing-column report still sees the sheet's rows
+          indices = list(range(len(columns)))
+        data = [[row[i] if i < len(row) else None for i in indices] for row in rows]
+        # Formatted but empty rows at the end of a sheet come back as all
+        # None; drop them like pandas does
+        while data and all(value is None for value in data[-1]):
+          data.pop()
+      finally:
+        wb.close()
+      return pd.DataFrame(data, columns=[columns[i] for i in indices]), columns
+    
+    # A callable usecols sees every header cell, so it both records the full
+    # header and cannot fail when a column is missing or renamed
+    columns = []
+    def keep_column(column):
+      columns.append(column)
+      return column in self.SUMMARY_COLUMNS
+    df = pd.read_excel(file_path, sheet_name=sheet_name, engine=EXCEL_ENGINE, usecols=keep_column)
+    if columns and len(df.columns) == 0:
+      df = pd.read_excel(file_path, sheet_name=sheet_name, engine=EXCEL_ENGINE)
+    # Trailing rows with values only in skipped columns are empty here
+    last_row = df.last_valid_index()
+    df = df.iloc[:0] if last_row is None else df.loc[:last_row]
+    return df, columns
+  
   def validate_directory(self, directory: Path) -> Tuple[bool, List[str]]:
     """Validate a directory containing Excel files."""
     self.validation_results = []
@@ -79,10 +201,14 @@ class DataValidator:
     
     self.validation_results.append(f"✅ Found {len(excel_files)} Excel file(s)")
     
-    # Do lightweight validation of each file (just basic checks, no full data loading)
+    # Do lightweight validation of each file (just basic checks, no full data loading).
+    # Opening a workbook is mostly file I/O and zlib decompression, which
+    # release the GIL, so files are checked on a few threads
+    with ThreadPoolExecutor(max_workers=min(8, len(excel_files))) as executor:
+      file_checks = list(executor.map(self.validate_file_lightweight, excel_files))
+    
     all_valid = True
-    for excel_file in excel_files:
-      file_valid, file_results = self.validate_file_lightweight(excel_file)
+    for excel_file, (file_valid, file_results) in zip(excel_files, file_checks):
       if not file_valid:
         all_valid = False
       
@@ -116,38 +242,64 @@ class DataValidator:
       else:
         results.append(f"✅ Valid Excel file ({file_size / 1024:.0f} KB)")
       
-      # Try to open file to check if it's corrupted (just check structure, don't load data)
-      try:
-        import openpyxl
-        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-        sheet_count = len(wb.worksheets)
-        results.append(f"✅ File readable with {sheet_count} sheet(s)")
-        wb.close()
-        return True, results
-      except Exception as e:
-        results.append(f"❌ Cannot open Excel file: {str(e)}")
-        return False, results
+      # A workbook already opened unchanged is known to be readable
+      key = self._workbook_key(file_path)
+      meta = self._cached_meta(key)
+      if meta is None:
+        # Try to open file to check if it's corrupted (just check structure
+        # and the header row of the data sheet, don't load data)
+        try:
+          import openpyxl
+          wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+          try:
+            # The data sheet is sheet 1, or sheet 0 in single-sheet workbooks
+            ws = wb.worksheets[1] if len(wb.worksheets) > 1 else wb.worksheets[0]
+            header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            meta = {'sheets': wb.sheetnames, 'size': file_size, 'columns': list(header)}
+          finally:
+            wb.close()
+          self._store_meta(key, meta)
+        except Exception as e:
+          results.append(f"❌ Cannot open Excel file: {str(e)}")
+          return False, results
+      
+      results.append(f"✅ File readable with {len(meta['sheets'])} sheet(s)")
+      columns_valid, column_results = self._check_required_columns(meta['columns'])
+      results.extend(column_results)
+      return columns_valid, results
         
     except Exception as e:
       results.append(f"❌ Validation error: {str(e)}")
       return False, results
   
-  def validate_dataframe(self, df: pd.DataFrame, source_name: str = "") -> Tuple[bool, List[str]]:
-    """Validate the structure and content of a DataFrame."""
-    valid = True
+  def validate_dataframe(self, df: pd.DataFrame, source_name: str = "", columns: Optional[List[str]] = None) -> Tuple[bool, List[str]]:
+    """Validate the structure and content of a DataFrame.
     
+    `columns` is the sheet's full header, for when `df` holds only some of them.
+    """
     # Check if DataFrame is empty
     if df.empty:
       self.validation_results.append(f"❌ DataFrame is empty")
       return False, self.validation_results
     
-    self.validation_results.append(f"✅ DataFrame has {len(df)} rows and {len(df.columns)} columns")
+    column_count = len(columns) if columns is not None else len(df.columns)
+    self.validation_results.append(f"✅ DataFrame has {len(df)} rows and {column_count} columns")
     
     # Check for required columns
-    missing_columns = []
-    for col in self.REQUIRED_COLUMNS:
-      if col not in df.columns:
-        missing_columns.append(col)
+    valid, column_results = self._check_required_columns(df.columns)
+    self.validation_results.extend(column_results)
+    
+    # Check data types and content
+    if valid:
+      valid = self.validate_column_content(df) and valid
+    
+    return valid, self.validation_results
+  
+  def _check_required_columns(self, columns) -> Tuple[bool, List[str]]:
+    """Report which required columns a sheet header is missing."""
+    results = []
+    valid = True
+    missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in columns]
     
     if missing_columns:
       # Check if any critical columns are missing
@@ -156,28 +308,25 @@ class DataValidator:
       missing_non_critical = [col for col in missing_columns if col not in critical_columns]
       
       if missing_critical:
-        self.validation_results.append(f"❌ Missing critical required columns: {', '.join(missing_critical)}")
+        results.append(f"❌ Missing critical required columns: {', '.join(missing_critical)}")
         valid = False
       
       if missing_non_critical:
-        self.validation_results.append(f"⚠️ Missing optional columns: {', '.join(missing_non_critical)}")
+        results.append(f"⚠️ Missing optional columns: {', '.join(missing_non_critical)}")
         # Don't mark as invalid for optional columns
     else:
-      self.validation_results.append(f"✅ All required columns present")
+      results.append(f"✅ All required columns present")
     
-    # Check data types and content
-    if valid:
-      valid = self.validate_column_content(df) and valid
-    
-    return valid, self.validation_results
+    return valid, results
   
   def validate_column_content(self, df: pd.DataFrame) -> bool:
     """Validate the content of specific columns."""
+    stats = self._stats(df)
     valid = True
     
     # Check Layout-Donor column
     if 'Layout-Donor' in df.columns:
-      unique_donors = df['Layout-Donor'].dropna().unique()
+      unique_donors = stats.unique('Layout-Donor')
       if len(unique_donors) == 0:
         self.validation_results.append(f"❌ No donor IDs found")
         valid = False
@@ -186,7 +335,7 @@ class DataValidator:
     
     # Check Plate column
     if 'Plate' in df.columns:
-      unique_plates = df['Plate'].dropna().unique()
+      unique_plates = stats.unique('Plate')
       if len(unique_plates) == 0:
         self.validation_results.append(f"❌ No plate IDs found")
         valid = False
@@ -195,7 +344,7 @@ class DataValidator:
     
     # Check Layout-Stimuli column
     if 'Layout-Stimuli' in df.columns:
-      unique_stimuli = df['Layout-Stimuli'].dropna().unique()
+      unique_stimuli = stats.unique('Layout-Stimuli')
       if len(unique_stimuli) == 0:
         self.validation_results.append(f"❌ No stimuli found")
         valid = False
@@ -210,24 +359,22 @@ class DataValidator:
     
     # Check Spot Forming Units (SFU) column
     if 'Spot Forming Units (SFU)' in df.columns:
-      sfu_col = df['Spot Forming Units (SFU)']
-      numeric_values = pd.to_numeric(sfu_col, errors='coerce')
-      non_numeric_count = numeric_values.isna().sum() - sfu_col.isna().sum()
+      sfu_stats = stats.sfu
       
-      if non_numeric_count > 0:
-        self.validation_results.append(f"⚠️ Found {non_numeric_count} non-numeric SFU values")
+      if sfu_stats['non_numeric'] > 0:
+        self.validation_results.append(f"⚠️ Found {sfu_stats['non_numeric']} non-numeric SFU values")
       
-      valid_sfu_values = numeric_values.dropna()
-      if len(valid_sfu_values) > 0:
-        self.validation_results.append(f"✅ SFU values range: {valid_sfu_values.min():.1f} - {valid_sfu_values.max():.1f}")
+      if sfu_stats['count'] > 0:
+        self.validation_results.append(f"✅ SFU values range: {sfu_stats['min']:.1f} - {sfu_stats['max']:.1f}")
       else:
         self.validation_results.append(f"❌ No valid SFU values found")
         valid = False
     
     # Check Analyte Secreting Population column (LED format)
     if 'Analyte Secreting Population' in df.columns:
-      unique_populations = df['Analyte Secreting Population'].dropna().unique()
-      led_populations = [pop for pop in unique_populations if self.LED_PATTERN.match(str(pop))]
+      unique_populations = stats.unique('Analyte Secreting Population')
+      populations = pd.Series(unique_populations, dtype='string')
+      led_populations = populations[populations.str.match(self.LED_PATTERN)].tolist()
       
       if not led_populations:
         self.validation_results.append(f"⚠️ No LED populations found (expected format: 'LED### Total')")
@@ -237,19 +384,39 @@ class DataValidator:
     
     return valid
   
+  @staticmethod
+  def _sfu_stats(sfu_col: pd.Series) -> Dict[str, Any]:
+    """Summarize an SFU column with a single numeric coercion.
+    
+    `non_numeric` counts cells that are present but not numbers; min, max
+    and mean are NaN when no value is numeric.
+    """
+    values = pd.to_numeric(sfu_col, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    numeric = ~np.isnan(values)
+    count = int(numeric.sum())
+    valid = values[numeric]
+    return {
+      'min': float(valid.min()) if count else np.nan,
+      'max': float(valid.max()) if count else np.nan,
+      'mean': float(valid.mean()) if count else np.nan,
+      'count': count,
+      'non_numeric': int(len(values) - count - sfu_col.isna().sum()),
+    }
+  
   def validate_configuration_compatibility(self, df: pd.DataFrame, config: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """Validate that the configuration is compatible with the data."""
+    stats = self._stats(df)
     results = []
     valid = True
     
     # Check if control stimulus exists in data
     if 'control_stim' in config and 'Layout-Stimuli' in df.columns:
       control_stim = config['control_stim']
-      stimuli = df['Layout-Stimuli'].dropna().unique()
+      stimuli = stats.unique('Layout-Stimuli')
       
-      # Check for exact match or partial match
+      # Check for exact match, and only scan for partial matches without one
       exact_match = control_stim in stimuli
-      partial_matches = [s for s in stimuli if control_stim in str(s)]
+      partial_matches = [] if exact_match else [s for s in stimuli if control_stim in str(s)]
       
       if exact_match:
         results.append(f"✅ Control stimulus '{control_stim}' found in data")
@@ -262,7 +429,7 @@ class DataValidator:
     # Check if plate IDs match
     if 'plates' in config and 'Plate' in df.columns:
       config_plates = set(config['plates'].keys())
-      data_plates = set(df['Plate'].dropna().unique())
+      data_plates = set(stats.unique('Plate'))
       
       missing_plates = config_plates - data_plates
       extra_plates = data_plates - config_plates
@@ -283,8 +450,8 @@ class DataValidator:
     # Check LED mappings
     if 'cytokines' in config and 'Analyte Secreting Population' in df.columns:
       config_leds = set(config['cytokines'].values())
-      data_populations = df['Analyte Secreting Population'].dropna().unique()
-      data_leds = set(pop.replace(' Total', '') for pop in data_populations if ' Total' in str(pop))
+      data_populations = stats.unique('Analyte Secreting Population')
+      data_leds = set(pd.Series(data_populations, dtype='string').str.extract(LED_TOTAL_PATTERN)[0].dropna())
       
       missing_leds = config_leds - data_leds
       if missing_leds:
@@ -298,17 +465,27 @@ class DataValidator:
     if 'experimental_conditions' in config and config['experimental_conditions']:
       exp_conditions = config['experimental_conditions']
       
+      # Group stimuli by plate in one pass instead of masking the frame per plate
+      has_plates = 'Plate' in df.columns
+      has_stimuli = 'Layout-Stimuli' in df.columns
+      if has_plates:
+        data_plates = set(stats.unique('Plate'))
+        stimuli_by_plate = (
+          {plate: set(stimuli) for plate, stimuli in df.dropna(subset=['Layout-Stimuli']).groupby('Plate')['Layout-Stimuli'].unique().items()}
+          if has_stimuli else {}
+        )
+      else:
+        all_stimuli = set(stats.unique('Layout-Stimuli')) if has_stimuli else set()
+      
       for plate_id, plate_conditions in exp_conditions.items():
         # Check if plate exists in data
-        if 'Plate' in df.columns:
-          data_plates = df['Plate'].dropna().unique()
+        if has_plates:
           if plate_id not in data_plates:
             results.append(f"⚠️ Experimental condition plate '{plate_id}' not found in data")
             continue
         
         # Check controls and stimuli for this plate
-        plate_data = df[df['Plate'] == plate_id] if 'Plate' in df.columns else df
-        plate_stimuli = plate_data['Layout-Stimuli'].dropna().unique() if 'Layout-Stimuli' in plate_data.columns else []
+        plate_stimuli = stimuli_by_plate.get(plate_id, set()) if has_plates else all_stimuli
         
         for group_name, group_config in plate_conditions.items():
           control = group_config.get('control')
@@ -325,34 +502,33 @@ class DataValidator:
     
     return valid, results
   
-  def get_data_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
-    """Get a summary of the data for display purposes."""
+  def get_data_summary(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Get a summary of the data for display purposes.
+    
+    `columns` is the sheet's full header, for when `df` holds only some of them.
+    """
+    stats = self._stats(df)
     summary = {
       'total_rows': len(df),
-      'total_columns': len(df.columns),
+      'total_columns': len(columns) if columns is not None else len(df.columns),
     }
     
     if 'Layout-Donor' in df.columns:
-      summary['donors'] = df['Layout-Donor'].dropna().unique().tolist()
+      summary['donors'] = stats.unique('Layout-Donor').tolist()
     
     if 'Plate' in df.columns:
-      summary['plates'] = df['Plate'].dropna().unique().tolist()
+      summary['plates'] = stats.unique('Plate').tolist()
     
     if 'Layout-Stimuli' in df.columns:
-      summary['stimuli'] = df['Layout-Stimuli'].dropna().unique().tolist()
+      summary['stimuli'] = stats.unique('Layout-Stimuli').tolist()
     
     if 'Analyte Secreting Population' in df.columns:
-      populations = df['Analyte Secreting Population'].dropna().unique()
+      populations = stats.unique('Analyte Secreting Population')
       summary['led_populations'] = [pop for pop in populations if 'LED' in str(pop)]
     
     if 'Spot Forming Units (SFU)' in df.columns:
-      sfu_values = pd.to_numeric(df['Spot Forming Units (SFU)'], errors='coerce').dropna()
-      if len(sfu_values) > 0:
-        summary['sfu_stats'] = {
-          'min': float(sfu_values.min()),
-          'max': float(sfu_values.max()),
-          'mean': float(sfu_values.mean()),
-          'count': int(len(sfu_values))
-        }
+      sfu_stats = stats.sfu
+      if sfu_stats['count'] > 0:
+        summary['sfu_stats'] = {key: sfu_stats[key] for key in ('min', 'max', 'mean', 'count')}
     
     return summary
\ No newline at end of file
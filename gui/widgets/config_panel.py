@@ -5,20 +5,61 @@ from tkinter import ttk, filedialog
 from typing import Dict, Any, Callable, Optional
 from pathlib import Path
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from gui.widgets.dynamic_lists import CytokineListWidget, PlateListWidget, ExperimentalConditionsWidget
 
 
+# Default output settings, resolved once at import
+_DEFAULT_OUTPUT_DIR = str(Path.home() / "FluoroSpot_Results")
+_DEFAULT_RESULTS_FILENAME = "fluorospot-results.xlsx"
+
+
 class ConfigPanel(ttk.Frame):
   """Main configuration panel containing all analysis settings."""
   
+  # Field edits are validated once typing pauses for this long, rather than
+  # on every keystroke
+  VALIDATION_DELAY_MS = 150
+  
+  # How long (seconds) a directory's exists/writable check is reused
+  FS_CHECK_TTL = 2.0
+  
   def __init__(self, parent, callback: Optional[Callable] = None):
     super().__init__(parent)
     self.callback = callback
     
+    # Pending debounced validation: the scheduled after() job and the
+    # sections ('basic', 'output') it should validate
+    self._validate_job = None
+    self._pending_validations = set()
+    # Field values and outcome of the last basic-settings validation
+    self._last_basic_key = None
+    self._last_basic_valid = False
+    # Parent directory path -> (checked at, exists, writable)
+    self._fs_cache: Dict[str, tuple] = {}
+    # Directory checks for typed paths run here, off the Tk thread; only the
+    # latest request's future is kept
+    self._fs_pool = ThreadPoolExecutor(max_workers=1)
+    self._fs_future = None
+    # (icon, message, color) last shown by each status label
+    self._shown_status = {}
+    # Set while fields are filled programmatically, to ignore their traces
+    self._suspend_validation = False
+    # Tab name -> (placeholder frame, builder) for tabs whose contents are
+    # built when first shown or used, and the names already built
+    self._lazy_tabs: Dict[str, tuple] = {}
+    self._built_tabs = set()
+    
     self.setup_ui()
     self.load_defaults()
   
+  def destroy(self):
+    """Stop the directory-check worker along with the panel."""
+    self._fs_pool.shutdown(wait=False, cancel_futures=True)
+    super().destroy()
+  
   def setup_ui(self):
     """Create the configuration interface."""
     # Create notebook for tabbed interface
@@ -29,12 +70,61 @@ class ConfigPanel(ttk.Frame):
     self.columnconfigure(0, weight=1)
     self.rowconfigure(0, weight=1)
     
-    # Create tabs
+    # Create tabs. The mapping and experimental tabs hold the bulk of the
+    # widget tree, so only their frames are added now
     self.create_basic_settings_tab()
-    self.create_cytokines_tab()
-    self.create_plates_tab()
-    self.create_experimental_tab()
+    self._add_lazy_tab('cytokines', "Cytokines", self.create_cytokines_tab)
+    self._add_lazy_tab('plates', "Plates", self.create_plates_tab)
+    self._add_lazy_tab('experimental', "Experimental Conditions", self.create_experimental_tab)
     self.create_output_tab()
+    self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+    
+    # Entries and buttons toggled together by set_enabled
+    self._entry_widgets = [
+      self.cells_per_well_entry,
+      self.sfc_cutoff_entry,
+      self.control_stim_entry,
+      self.output_dir_entry,
+      self.results_filename_entry,
+      self.browse_output_btn,
+    ]
+  
+  def _add_lazy_tab(self, name: str, title: str, builder: Callable):
+    """Add an empty tab whose contents are built on first use."""
+    frame = ttk.Frame(self.notebook, padding="10")
+    self.notebook.add(frame, text=title)
+    self._lazy_tabs[name] = (frame, builder)
+  
+  def _build_tab(self, name: str):
+    """Build a lazily created tab's contents, once."""
+    if name in self._built_tabs:
+      return
+    self._built_tabs.add(name)
+    frame, builder = self._lazy_tabs[name]
+    builder(frame)
+  
+  def _on_tab_changed(self, event=None):
+    """Build the selected tab's contents when it is first shown."""
+    selected = self.notebook.select()
+    for name, (frame, _) in self._lazy_tabs.items():
+      if str(frame) == selected:
+        self._build_tab(name)
+        break
+  
+  @property
+  def cytokine_widget(self) -> CytokineListWidget:
+    self._build_tab('cytokines')
+    return self._cytokine_widget
+  
+  @property
+  def plate_widget(self) -> PlateListWidget:
+    self._build_tab('plates')
+    return self._plate_widget
+  
+  @property
+  def experimental_widget(self) -> ExperimentalConditionsWidget:
+    self._build_tab('experimental')
+    return self._experimental_widget
   
   def create_basic_settings_tab(self):
     """Create the basic settings tab."""
@@ -48,8 +138,14 @@ class ConfigPanel(ttk.Frame):
     ttk.Label(basic_frame, text="Cells Plated per Well:").grid(
       row=0, column=0, sticky=tk.W, padx=(0, 10), pady=(0, 10)
     )
-    self.cells_per_well_var = tk.StringVar(value="200000")
-    self.cells_per_well_entry = ttk.Entry(basic_frame, textvariable=self.cells_per_well_var, width=15)
+    # Integer fields keep their value in an IntVar; keystrokes other than
+    # digits are rejected as they are typed
+    digits_only = (self.register(str.isdigit), '%S')
+    self.cells_per_well_var = tk.IntVar(value=200000)
+    self.cells_per_well_entry = ttk.Spinbox(
+      basic_frame, textvariable=self.cells_per_well_var, width=15, from_=1, to=10_000_000,
+      increment=1000, validate='key', validatecommand=digits_only
+    )
     self.cells_per_well_entry.grid(row=0, column=1, sticky=tk.W, pady=(0, 10))
     
     ttk.Label(basic_frame, text="(Total number of cells plated per well)", 
@@ -61,8 +157,11 @@ class ConfigPanel(ttk.Frame):
     ttk.Label(basic_frame, text="SFC Cutoff:").grid(
       row=1, column=0, sticky=tk.W, padx=(0, 10), pady=(0, 10)
     )
-    self.sfc_cutoff_var = tk.StringVar(value="20")
-    self.sfc_cutoff_entry = ttk.Entry(basic_frame, textvariable=self.sfc_cutoff_var, width=15)
+    self.sfc_cutoff_var = tk.IntVar(value=20)
+    self.sfc_cutoff_entry = ttk.Spinbox(
+      basic_frame, textvariable=self.sfc_cutoff_var, width=15, from_=0, to=10_000_000,
+      validate='key', validatecommand=digits_only
+    )
     self.sfc_cutoff_entry.grid(row=1, column=1, sticky=tk.W, pady=(0, 10))
     
     ttk.Label(basic_frame, text="(Threshold for positivity criteria)", 
@@ -87,9 +186,9 @@ class ConfigPanel(ttk.Frame):
     self.create_validation_indicators(basic_frame)
     
     # Bind validation events
-    self.cells_per_well_var.trace('w', lambda *args: self.validate_basic_settings())
-    self.sfc_cutoff_var.trace('w', lambda *args: self.validate_basic_settings())
-    self.control_stim_var.trace('w', lambda *args: self.validate_basic_settings())
+    self.cells_per_well_var.trace('w', lambda *args: self._schedule_validation('basic'))
+    self.sfc_cutoff_var.trace('w', lambda *args: self._schedule_validation('basic'))
+    self.control_stim_var.trace('w', lambda *args: self._schedule_validation('basic'))
   
   def create_validation_indicators(self, parent):
     """Create validation status indicators."""
@@ -118,44 +217,35 @@ class ConfigPanel(ttk.Frame):
     self.control_stim_msg = ttk.Label(validation_frame, text="", font=('TkDefaultFont', 8))
     self.control_stim_msg.grid(row=2, column=1, sticky=tk.W)
   
-  def create_cytokines_tab(self):
+  def create_cytokines_tab(self, cytokines_frame: ttk.Frame):
     """Create the cytokines mapping tab."""
-    cytokines_frame = ttk.Frame(self.notebook, padding="10")
-    self.notebook.add(cytokines_frame, text="Cytokines")
-    
     # Configure grid
     cytokines_frame.columnconfigure(0, weight=1)
     cytokines_frame.rowconfigure(0, weight=1)
     
     # Cytokine mappings
-    self.cytokine_widget = CytokineListWidget(cytokines_frame, self.on_config_changed)
-    self.cytokine_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+    self._cytokine_widget = CytokineListWidget(cytokines_frame, self.on_config_changed)
+    self._cytokine_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
   
-  def create_plates_tab(self):
+  def create_plates_tab(self, plates_frame: ttk.Frame):
     """Create the plates mapping tab."""
-    plates_frame = ttk.Frame(self.notebook, padding="10")
-    self.notebook.add(plates_frame, text="Plates")
-    
     # Configure grid
     plates_frame.columnconfigure(0, weight=1)
     plates_frame.rowconfigure(0, weight=1)
     
     # Plate mappings
-    self.plate_widget = PlateListWidget(plates_frame, self.on_config_changed)
-    self.plate_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+    self._plate_widget = PlateListWidget(plates_frame, self.on_config_changed)
+    self._plate_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
   
-  def create_experimental_tab(self):
+  def create_experimental_tab(self, exp_frame: ttk.Frame):
     """Create the experimental conditions tab."""
-    exp_frame = ttk.Frame(self.notebook, padding="10")
-    self.notebook.add(exp_frame, text="Experimental Conditions")
-    
     # Configure grid
     exp_frame.columnconfigure(0, weight=1)
     exp_frame.rowconfigure(0, weight=1)
     
     # Experimental conditions widget
-    self.experimental_widget = ExperimentalConditionsWidget(exp_frame, self.on_config_changed)
-    self.experimental_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+    self._experimental_widget = ExperimentalConditionsWidget(exp_frame, self.on_config_changed)
+    self._experimental_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
   
   def create_output_tab(self):
     """Create the output settings tab."""
@@ -170,7 +260,7 @@ class ConfigPanel(ttk.Frame):
       row=0, column=0, sticky=tk.W, padx=(0, 10), pady=(0, 10)
     )
     
-    self.output_dir_var = tk.StringVar(value=str(Path.home() / "FluoroSpot_Results"))
+    self.output_dir_var = tk.StringVar(value=_DEFAULT_OUTPUT_DIR)
     self.output_dir_entry = ttk.Entry(output_frame, textvariable=self.output_dir_var, width=40)
     self.output_dir_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10), pady=(0, 10))
     
@@ -186,7 +276,7 @@ class ConfigPanel(ttk.Frame):
       row=1, column=0, sticky=tk.W, padx=(0, 10), pady=(0, 10)
     )
     
-    self.results_filename_var = tk.StringVar(value="fluorospot-results.xlsx")
+    self.results_filename_var = tk.StringVar(value=_DEFAULT_RESULTS_FILENAME)
     self.results_filename_entry = ttk.Entry(output_frame, textvariable=self.results_filename_var, width=30)
     self.results_filename_entry.grid(row=1, column=1, sticky=tk.W, pady=(0, 10))
     
@@ -203,8 +293,8 @@ class ConfigPanel(ttk.Frame):
     self.output_msg.grid(row=2, column=1, sticky=tk.W, pady=(10, 0))
     
     # Bind validation
-    self.output_dir_var.trace('w', lambda *args: self.validate_output_settings())
-    self.results_filename_var.trace('w', lambda *args: self.validate_output_settings())
+    self.output_dir_var.trace('w', lambda *args: self._schedule_validation('output'))
+    self.results_filename_var.trace('w', lambda *args: self._schedule_validation('output'))
   
   def browse_output_directory(self):
     """Browse for output directory."""
@@ -213,22 +303,85 @@ class ConfigPanel(ttk.Frame):
       initialdir=self.output_dir_var.get()
     )
     if directory:
+      # The dialog may have created or changed folders
+      self._fs_cache.clear()
       self.output_dir_var.set(directory)
   
   def load_defaults(self):
     """Load default configuration values."""
     # Defaults are already set in the widget creation
-    # Run initial validation
-    self.validate_basic_settings()
+    # Run initial validation. The defaults aren't a change to report
+    callback, self.callback = self.callback, None
+    try:
+      self.validate_basic_settings()
+      self.validate_output_settings()
+    finally:
+      self.callback = callback
+  
+  def _schedule_validation(self, section: str):
+    """Validate a section after a pause in edits, coalescing keystrokes."""
+    if self._suspend_validation:
+      return
+    self._pending_validations.add(section)
+    if self._validate_job is not None:
+      self.after_cancel(self._validate_job)
+    self._validate_job = self.after(self.VALIDATION_DELAY_MS, self._run_pending_validations)
+  
+  def _run_pending_validations(self):
+    """Run the validations collected by _schedule_validation."""
+    self._validate_job = None
+    sections, self._pending_validations = self._pending_validations, set()
+    if 'basic' in sections:
+      self.validate_basic_settings()
+    if 'output' in sections:
+      self._validate_output_async()
+  
+  def _validate_output_async(self):
+    """Validate output settings once the parent directory has been checked.
+    
+    An uncached directory is checked on the worker thread, so a slow
+    network drive doesn't freeze typing; the result is picked up by polling
+    from the Tk thread.
+    """
+    parent = Path(self.output_dir_var.get()).parent
+    cached = self._fs_cache.get(str(parent))
+    if cached is not None and time.monotonic() - cached[0] < self.FS_CHECK_TTL:
+      self.validate_output_settings()
+      return
+    
+    if self._fs_future is not None:
+      self._fs_future.cancel()
+    self._fs_future = self._fs_pool.submit(self._probe_directory, parent)
+    self.after(50, self._poll_directory_check, self._fs_future, str(parent))
+  
+  def _poll_directory_check(self, future, key: str):
+    """Apply a finished directory check, or poll again."""
+    if future is not self._fs_future:
+      return  # Superseded by a newer path
+    if not future.done():
+      self.after(50, self._poll_directory_check, future, key)
+      return
+    
+    self._fs_future = None
+    if future.exception() is None:
+      exists, writable = future.result()
+      self._fs_cache[key] = (time.monotonic(), exists, writable)
+    # A failed check is repeated synchronously, which reports the bad path
     self.validate_output_settings()
   
   def validate_basic_settings(self):
     """Validate basic settings and update indicators."""
+    # Traces also fire for writes that don't change the text, e.g. from
+    # set_configuration; those need no new validation
+    key = (self.cells_per_well_entry.get(), self.sfc_cutoff_entry.get(), self.control_stim_var.get())
+    if key == self._last_basic_key:
+      return self._last_basic_valid
+    
     valid = True
     
     # Validate Cells Per Well Count
     try:
-      cells_per_well = int(self.cells_per_well_var.get())
+      cells_per_well = self._get_int(self.cells_per_well_var)
       if cells_per_well <= 0:
         raise ValueError("Must be positive")
       elif cells_per_well < 1000:
@@ -244,7 +397,7 @@ class ConfigPanel(ttk.Frame):
     
     # Validate SFC Cutoff
     try:
-      sfc_cutoff = int(self.sfc_cutoff_var.get())
+      sfc_cutoff = self._get_int(self.sfc_cutoff_var)
       if sfc_cutoff < 0:
         raise ValueError("Cannot be negative")
       else:
@@ -265,9 +418,19 @@ class ConfigPanel(ttk.Frame):
       self.set_validation_status(self.control_stim_status, self.control_stim_msg, 
                    "✅", f"Control stimulus: '{control_stim}'", "green")
     
+    self._last_basic_key = key
+    self._last_basic_valid = valid
     self.on_config_changed()
     return valid
   
+  @staticmethod
+  def _get_int(var: tk.IntVar) -> int:
+    """Read an integer field; an empty or unparsable value raises ValueError."""
+    try:
+      return var.get()
+    except tk.TclError:
+      raise ValueError("Not an integer") from None
+  
   def validate_output_settings(self):
     """Validate output settings."""
     valid = True
@@ -276,11 +439,12 @@ class ConfigPanel(ttk.Frame):
     output_dir = Path(self.output_dir_var.get())
     try:
       # Check if parent directory exists (we can create the final directory)
-      if not output_dir.parent.exists():
+      parent_exists, parent_writable = self._check_directory(output_dir.parent)
+      if not parent_exists:
         self.set_validation_status(self.output_status, self.output_msg, 
                      "❌", "Parent directory does not exist", "red")
         valid = False
-      elif not os.access(str(output_dir.parent), os.W_OK):
+      elif not parent_writable:
         self.set_validation_status(self.output_status, self.output_msg, 
                      "❌", "No write permission to parent directory", "red")
         valid = False
@@ -299,31 +463,65 @@ class ConfigPanel(ttk.Frame):
                    "❌", "Results filename cannot be empty", "red")
       valid = False
     elif not filename.endswith('.xlsx'):
-      # Auto-add .xlsx extension
+      # Auto-add .xlsx extension. The corrected name passes this check, so
+      # the write's own trace needn't schedule another validation pass
       corrected_filename = filename + '.xlsx'
-      self.results_filename_var.set(corrected_filename)
+      suspended, self._suspend_validation = self._suspend_validation, True
+      try:
+        self.results_filename_var.set(corrected_filename)
+      finally:
+        self._suspend_validation = suspended
     
     return valid
   
+  def _check_directory(self, directory: Path) -> tuple:
+    """Return (exists, writable) for a directory, reusing recent results.
+    
+    Each check is a syscall that can be slow on network drives, and the
+    output path is revalidated as it is typed.
+    """
+    key = str(directory)
+    now = time.monotonic()
+    cached = self._fs_cache.get(key)
+    if cached is not None and now - cached[0] < self.FS_CHECK_TTL:
+      return cached[1], cached[2]
+    
+    exists, writable = self._probe_directory(directory)
+    self._fs_cache[key] = (now, exists, writable)
+    return exists, writable
+  
+  @staticmethod
+  def _probe_directory(directory: Path) -> tuple:
+    """Check whether a directory exists and is writable."""
+    exists = directory.exists()
+    return exists, exists and os.access(str(directory), os.W_OK)
+  
   def set_validation_status(self, status_label, msg_label, icon, message, color):
     """Set validation status for a field."""
+    # Revalidating stable input usually yields the same status; skip the
+    # configure calls then
+    status = (icon, message, color)
+    if self._shown_status.get(status_label) == status:
+      return
     status_label.configure(text=icon)
     msg_label.configure(text=message, foreground=color)
+    self._shown_status[status_label] = status
   
   def on_config_changed(self, values=None):
-    """Handle configuration changes."""
+    """Handle configuration changes.
+    
+    The callback is only notified; it calls get_configuration() if it needs
+    the values. Building them here would build every deferred tab on the
+    first change.
+    """
     if self.callback:
-      try:
-        config = self.get_configuration()
-        self.callback(config)
-      except:
-        pass  # Ignore errors during intermediate states
+      self.callback()
   
   def get_configuration(self) -> Dict[str, Any]:
     """Get the current configuration as a dictionary."""
     config = {
-      'cells_per_well': int(self.cells_per_well_var.get()),
-      'sfc_cutoff': int(self.sfc_cutoff_var.get()),
+      'cells_per_well': self._get_int(self.cells_per_well_var),
+      'sfc_cutoff': self._get_int(self.sfc_cutoff_var),
       'control_stim': self.control_stim_var.get().strip(),
       'cytokines': self.cytokine_widget.get_cytokine_dict(),
       'plates': self.plate_widget.get_plate_dict(),
@@ -340,31 +538,37 @@ class ConfigPanel(ttk.Frame):
   
   def set_configuration(self, config: Dict[str, Any]):
     """Set the configuration from a dictionary."""
-    # Basic settings
-    if 'cells_per_well' in config:
-      self.cells_per_well_var.set(str(config['cells_per_well']))
-    if 'sfc_cutoff' in config:
-      self.sfc_cutoff_var.set(str(config['sfc_cutoff']))
-    if 'control_stim' in config:
-      self.control_stim_var.set(config['control_stim'])
-    
-    # Mappings
-    if 'cytokines' in config:
-      self.cytokine_widget.set_cytokine_dict(config['cytokines'])
-    if 'plates' in config:
-      self.plate_widget.set_plate_dict(config['plates'])
-    
-    # Experimental conditions
-    if 'experimental_conditions' in config:
-      self.experimental_widget.set_configuration(config['experimental_conditions'])
-    else:
-      self.experimental_widget.reset()
-    
-    # Output settings
-    if 'output_dir' in config:
-      self.output_dir_var.set(config['output_dir'])
-    if 'results_filename' in config:
-      self.results_filename_var.set(config['results_filename'])
+    # Field traces stay quiet while values are applied; everything is
+    # validated once below
+    self._suspend_validation = True
+    try:
+      # Basic settings
+      if 'cells_per_well' in config:
+        self.cells_per_well_var.set(config['cells_per_well'])
+      if 'sfc_cutoff' in config:
+        self.sfc_cutoff_var.set(config['sfc_cutoff'])
+      if 'control_stim' in config:
+        self.control_stim_var.set(config['control_stim'])
+      
+      # Mappings
+      if 'cytokines' in config:
+        self.cytokine_widget.set_cytokine_dict(config['cytokines'])
+      if 'plates' in config:
+        self.plate_widget.set_plate_dict(config['plates'])
+      
+      # Experimental conditions
+      if 'experimental_conditions' in config:
+        self.experimental_widget.set_configuration(config['experimental_conditions'])
+      else:
+        self.experimental_widget.reset()
+      
+      # Output settings
+      if 'output_dir' in config:
+        self.output_dir_var.set(config['output_dir'])
+      if 'results_filename' in config:
+        self.results_filename_var.set(config['results_filename'])
+    finally:
+      self._suspend_validation = False
     
     # Revalidate
     self.validate_basic_settings()
@@ -388,21 +592,27 @@ class ConfigPanel(ttk.Frame):
   
   def reset(self):
     """Reset all configuration to default values."""
-    # Reset basic settings
-    self.cells_per_well_var.set("200000")
-    self.sfc_cutoff_var.set("20")
-    self.control_stim_var.set("DMSO")
-    
-    # Reset mappings
-    self.cytokine_widget.reset()
-    self.plate_widget.reset()
-    
-    # Reset experimental conditions
-    self.experimental_widget.reset()
-    
-    # Reset output settings
-    self.output_dir_var.set(str(Path.home() / "FluoroSpot_Results"))
-    self.results_filename_var.set("fluorospot-results.xlsx")
+    # Field traces stay quiet while defaults are applied; everything is
+    # validated once below
+    self._suspend_validation = True
+    try:
+      # Reset basic settings
+      self.cells_per_well_var.set(200000)
+      self.sfc_cutoff_var.set(20)
+      self.control_stim_var.set("DMSO")
+      
+      # Reset mappings
+      self.cytokine_widget.reset()
+      self.plate_widget.reset()
+      
+      # Reset experimental conditions
+      self.experimental_widget.reset()
+      
+      # Reset output settings
+      self.output_dir_var.set(_DEFAULT_OUTPUT_DIR)
+      self.results_filename_var.set(_DEFAULT_RESULTS_FILENAME)
+    finally:
+      self._suspend_validation = False
     
     # Revalidate
     self.validate_basic_settings()
@@ -410,21 +620,14 @@ class ConfigPanel(ttk.Frame):
   
   def set_enabled(self, enabled: bool):
     """Enable or disable all configuration controls."""
-    state = 'normal' if enabled else 'disabled'
-    
-    # Basic settings
-    self.cells_per_well_entry.configure(state=state)
-    self.sfc_cutoff_entry.configure(state=state)
-    self.control_stim_entry.configure(state=state)
+    # ttk state flags skip the option parsing that configure() goes through
+    state = ['!disabled'] if enabled else ['disabled']
+    for widget in self._entry_widgets:
+      widget.state(state)
     
     # Mappings
     self.cytokine_widget.set_enabled(enabled)
     self.plate_widget.set_enabled(enabled)
     
     # Experimental conditions
-    self.experimental_widget.set_enabled(enabled)
-    
-    # Output settings
-    self.output_dir_entry.configure(state=state)
-    self.results_filename_entry.configure(state=state)
-    self.browse_output_btn.configure(state=state)
\ No newline at end of file
+    self.experimental_widget.set_enabled(enabled)
\ No newline at end of file
@@ -2,23 +2,67 @@
 
 import tkinter as tk
 from tkinter import ttk
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Callable, Optional
 
 
+def _configure_styles(widget):
+  """Define the label styles shared by the list widgets.
+  
+  Labels refer to these by name instead of each passing its own font and
+  color options.
+  """
+  style = ttk.Style(widget)
+  style.configure('ListHeader.TLabel', font=('TkDefaultFont', 9, 'bold'))
+  style.configure('Warn.TLabel', font=('TkDefaultFont', 8), foreground='orange')
+  style.configure('Hint.TLabel', font=('TkDefaultFont', 8), foreground='gray')
+
+
 class DynamicListWidget(ttk.Frame):
-  """Base class for dynamic list widgets with add/remove buttons."""
+  """Base class for dynamic list widgets with add/remove buttons.
+  
+  Row values are kept in a plain list. Only enough entry rows to fill the
+  visible area are created, and they are rebound to other data rows as the
+  list scrolls, so long lists don't cost a widget tree per row.
+  """
+  
+  # Pooled rows beyond those that fit in the viewport, covering the
+  # partially visible rows at either edge
+  POOL_MARGIN = 2
+  
+  # Typing is reported to the callback once it pauses for this long
+  CHANGE_DELAY_MS = 150
   
   def __init__(self, parent, title: str, columns: List[str], callback: Optional[Callable] = None):
     super().__init__(parent)
     self.title = title
     self.columns = columns
     self.callback = callback
-    self.entries = []
+    # One list of cell values per row; the widgets only display a window of it
+    self._data: List[List[str]] = []
+    self._row_pool: List[Dict[str, Any]] = []
+    self._row_height = 1
+    # Set while pooled rows are rebound, so their variable writes aren't
+    # taken for edits
+    self._rendering = False
+    self._enabled = True
+    # Set while an idle-time canvas update is queued, and the scroll region
+    # last applied
+    self._repaint_pending = False
+    self._scrollregion = None
+    # Pending debounced change notification, and the non-empty rows as last
+    # returned by get_values (None after any edit)
+    self._change_job = None
+    self._values_cache: Optional[List[List[str]]] = None
+    # Wheel ticks waiting to be scrolled at the next idle point
+    self._wheel_steps = 0
     
     self.setup_ui()
   
   def setup_ui(self):
     """Create the UI for the dynamic list."""
+    _configure_styles(self)
+    
     # Main frame
     main_frame = ttk.LabelFrame(self, text=self.title, padding="5")
     main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -34,7 +78,7 @@ class DynamicListWidget(ttk.Frame):
     header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
     
     for i, column in enumerate(self.columns):
-      ttk.Label(header_frame, text=column, font=('TkDefaultFont', 9, 'bold')).grid(
+      ttk.Label(header_frame, text=column, style='ListHeader.TLabel').grid(
         row=0, column=i, padx=(0, 10), sticky=tk.W
       )
     
@@ -55,19 +99,24 @@ class DynamicListWidget(ttk.Frame):
     
     # Use dynamic height with reasonable min/max bounds
     self.canvas = tk.Canvas(canvas_frame, height=80, highlightthickness=0)
-    scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
-    
-    self.scrollable_frame = ttk.Frame(self.canvas)
-    self.scrollable_frame.bind(
-      "<Configure>",
-      lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-    )
+    self.scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
     
-    self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-    self.canvas.configure(yscrollcommand=scrollbar.set)
+    # Pooled rows are canvas window items moved to their data row's offset;
+    # the scroll region covers every data row so the scrollbar reflects the
+    # whole list. Every view change (scrolling, resizing, a new scroll region) is
+    # reported here, which is when the visible rows are rebound
+    self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
+    self.canvas.bind("<Configure>", self._on_canvas_configure)
     
     self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-    scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+    self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+    
+    # Measure one row to lay out the list, and scroll a row at a time
+    sample_row = self._create_pool_row()
+    sample_row['frame'].update_idletasks()
+    self._row_height = sample_row['frame'].winfo_reqheight() + 2
+    self.canvas.configure(yscrollincrement=self._row_height)
+    self._resize_pool(int(self.canvas['height']))
     
     # Bind mousewheel to canvas
     self.canvas.bind("<MouseWheel>", self._on_mousewheel)
@@ -78,12 +127,110 @@ class DynamicListWidget(ttk.Frame):
     self.canvas.bind("<Enter>", self._bind_mousewheel)
     self.canvas.bind("<Leave>", self._unbind_mousewheel)
   
+  def _create_pool_row(self) -> Dict[str, Any]:
+    """Create one reusable entry row; it shows no data row until rendered."""
+    row_frame = ttk.Frame(self.canvas)
+    row_frame.columnconfigure(len(self.columns), weight=1)  # Make the last column expandable
+    row = {'frame': row_frame, 'vars': [], 'entries': [], 'index': None}
+    row['iid'] = self.canvas.create_window(
+      0, 0, window=row_frame, anchor="nw", state="hidden", tags=("row",)
+    )
+    
+    for i, column in enumerate(self.columns):
+      var = tk.StringVar()
+      entry = ttk.Entry(row_frame, width=15, textvariable=var)
+      entry.grid(row=0, column=i, padx=(0, 10), sticky=(tk.W, tk.E))
+      
+      # Write edits back to the data row currently shown, and bind change event
+      var.trace_add('write', lambda *args, col=i: self._store_cell(row, col))
+      entry.bind('<KeyRelease>', self._on_key_release)
+      row['vars'].append(var)
+      row['entries'].append(entry)
+    
+    # Remove button
+    remove_btn = ttk.Button(
+      row_frame, 
+      text="✕", 
+      width=3,
+      command=lambda: self.remove_entry(row['index'])
+    )
+    remove_btn.grid(row=0, column=len(self.columns), padx=(10, 0))
+    row['remove_btn'] = remove_btn
+    
+    self._set_row_enabled(row, self._enabled)
+    self._row_pool.append(row)
+    return row
+  
+  def _resize_pool(self, height: int):
+    """Grow the row pool to cover a viewport of the given height."""
+    needed = -(-height // self._row_height) + self.POOL_MARGIN
+    while len(self._row_pool) < needed:
+      self._create_pool_row()
+  
+  def _store_cell(self, row: Dict[str, Any], col: int):
+    """Copy an edited cell into the data row its pooled row shows."""
+    if self._rendering or row['index'] is None:
+      return
+    self._data[row['index']][col] = row['vars'][col].get()
+    self._values_cache = None
+  
+  def _render_window(self):
+    """Bind the pooled rows to the data rows in view."""
+    first = max(0, int(self.canvas.canvasy(0) // self._row_height))
+    self._rendering = True
+    try:
+      for i, row in enumerate(self._row_pool):
+        index = first + i
+        if index >= len(self._data):
+          if row['index'] is not None:
+            row['index'] = None
+            self.canvas.itemconfigure(row['iid'], state="hidden")
+          continue
+        
+        for var, value in zip(row['vars'], self._data[index]):
+          if var.get() != value:
+            var.set(value)
+        if row['index'] != index:
+          if row['index'] is None:
+            self.canvas.itemconfigure(row['iid'], state="normal")
+          row['index'] = index
+          self.canvas.coords(row['iid'], 0, index * self._row_height + 1)
+    finally:
+      self._rendering = False
+  
+  def _on_canvas_scroll(self, first, last):
+    """Update the scrollbar and the rows shown after the view moved."""
+    self.scrollbar.set(first, last)
+    self._render_window()
+  
+  def _on_canvas_configure(self, event):
+    """Fit the rows to the canvas width and the pool to its height."""
+    self.canvas.itemconfigure("row", width=event.width)
+    self._resize_pool(event.height)
+    self._render_window()
+  
   def _on_mousewheel(self, event):
-    """Handle mouse wheel scrolling."""
+    """Handle mouse wheel scrolling.
+    
+    Ticks arriving before the next idle point are summed and scrolled in
+    one step, so the visible rows are rebound once rather than per tick.
+    """
     if event.num == 4 or event.delta > 0:
-      self.canvas.yview_scroll(-1, "units")
+      step = -1
     elif event.num == 5 or event.delta < 0:
-      self.canvas.yview_scroll(1, "units")
+      step = 1
+    else:
+      return
+    
+    if not self._wheel_steps:
+      self.after_idle(self._flush_mousewheel)
+    self._wheel_steps += step
+  
+  def _flush_mousewheel(self):
+    """Scroll by the wheel ticks collected since the last idle point."""
+    steps, self._wheel_steps = self._wheel_steps, 0
+    if steps:
+      self.canvas.yview_scroll(steps, "units")
 
   def _bind_mousewheel(self, event):
     """Bind mousewheel events when mouse enters canvas."""
@@ -97,72 +244,56 @@ class DynamicListWidget(ttk.Frame):
     self.canvas.unbind_all("<Button-4>")
     self.canvas.unbind_all("<Button-5>")
   
+  def _make_row(self, values: Optional[List[str]] = None) -> List[str]:
+    """Build a data row with one string per column."""
+    row = [str(value) for value in (values or [])[:len(self.columns)]]
+    return row + [""] * (len(self.columns) - len(row))
+  
   def add_entry(self, values: Optional[List[str]] = None):
     """Add a new entry row."""
-    row_frame = ttk.Frame(self.scrollable_frame)
-    row_frame.grid(row=len(self.entries), column=0, sticky=(tk.W, tk.E), pady=1)
-    row_frame.columnconfigure(len(self.columns), weight=1)  # Make the last column expandable
-    
-    entry_widgets = []
-    
-    for i, column in enumerate(self.columns):
-      entry = ttk.Entry(row_frame, width=15)
-      entry.grid(row=0, column=i, padx=(0, 10), sticky=(tk.W, tk.E))
-      
-      # Set default value if provided
-      if values and i < len(values):
-        entry.insert(0, values[i])
-      
-      # Bind change event
-      entry.bind('<KeyRelease>', lambda e: self.on_change())
-      entry_widgets.append(entry)
-    
-    # Remove button
-    remove_btn = ttk.Button(
-      row_frame, 
-      text="✕", 
-      width=3,
-      command=lambda idx=len(self.entries): self.remove_entry(idx)
-    )
-    remove_btn.grid(row=0, column=len(self.columns), padx=(10, 0))
-    
-    self.entries.append({
-      'frame': row_frame,
-      'entries': entry_widgets,
-      'remove_btn': remove_btn
-    })
-    
-    self.update_remove_buttons()
-    self.update_canvas()
+    self._data.append(self._make_row(values))
+    self._values_cache = None
+    self._schedule_repaint()
   
-  def remove_entry(self, index: int):
+  def remove_entry(self, index: Optional[int]):
     """Remove an entry at the specified index."""
-    if 0 <= index < len(self.entries):
-      # Destroy the widgets
-      self.entries[index]['frame'].destroy()
-      
-      # Remove from list
-      self.entries.pop(index)
-      
-      # Re-grid remaining entries and update remove button commands
-      for i, entry in enumerate(self.entries):
-        entry['frame'].grid(row=i, column=0, sticky=(tk.W, tk.E), pady=1)
-        entry['remove_btn'].configure(command=lambda idx=i: self.remove_entry(idx))
-      
-      self.update_remove_buttons()
-      self.update_canvas()
+    if index is not None and 0 <= index < len(self._data):
+      self._data.pop(index)
+      self._values_cache = None
+      self._schedule_repaint()
       self.on_change()
   
-  def update_remove_buttons(self):
-    """Update remove button states."""
-    # Always enable remove buttons for dynamic lists
-    for entry in self.entries:
-      entry['remove_btn'].configure(state='normal')
+  def _schedule_repaint(self):
+    """Update the canvas once, after the current batch of changes."""
+    if not self._repaint_pending:
+      self._repaint_pending = True
+      self.after_idle(self._do_repaint)
+  
+  def _do_repaint(self):
+    """Run the queued canvas update."""
+    self._repaint_pending = False
+    self.update_canvas()
   
   def update_canvas(self):
-    """Update the canvas scroll region."""
-    self.canvas.update_idletasks()
-    self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    """Size the list to its data rows and redraw the visible ones."""
+    # The region follows from the row count, with no layout pass to measure.
+    # Edits that keep the row count leave it, and the scrollbar, as they are
+    region = (0, 0, self.canvas.winfo_width(), len(self._data) * self._row_height + 2)
+    if region != self._scrollregion:
+      self._scrollregion = region
+      self.canvas.configure(scrollregion=region)
+    self._render_window()
+  
+  def _on_key_release(self, event=None):
+    """Report typing once it pauses, rather than on every keystroke."""
+    if self._change_job is not None:
+      self.after_cancel(self._change_job)
+    self._change_job = self.after(self.CHANGE_DELAY_MS, self._flush_change)
+  
+  def _flush_change(self):
+    """Run the change notification queued by _on_key_release."""
+    self._change_job = None
+    self.on_change()
   
   def on_change(self):
     """Called when any entry value changes."""
@@ -174,59 +305,62 @@ class DynamicListWidget(ttk.Frame):
   
   def ensure_empty_entry(self):
     """Ensure there's always one empty entry at the end for adding new items."""
-    # Check if the last entry is empty
-    if self.entries:
-      last_entry = self.entries[-1]
-      last_values = [entry.get().strip() for entry in last_entry['entries']]
-      
-      # If the last entry is not empty, add a new empty one
-      if any(val for val in last_values):
-        self.add_entry()
-    else:
-      # If no entries exist, add one empty entry
+    # If no entries exist, or the last one is not empty, add a new empty one
+    if not self._data or any(val.strip() for val in self._data[-1]):
       self.add_entry()
   
   def get_values(self) -> List[List[str]]:
     """Get all entry values."""
-    values = []
-    for entry_data in self.entries:
-      row_values = [entry.get().strip() for entry in entry_data['entries']]
-      # Only include non-empty rows
-      if any(val for val in row_values):
-        values.append(row_values)
-    return values
+    if self._values_cache is None:
+      values = []
+      for row in self._data:
+        row_values = [val.strip() for val in row]
+        # Only include non-empty rows
+        if any(val for val in row_values):
+          values.append(row_values)
+      self._values_cache = values
+    return list(self._values_cache)
   
   def set_values(self, values: List[List[str]]):
     """Set the values for the list."""
-    # Clear existing entries
-    self.clear()
-    
-    # Add new entries
-    for value_row in values:
-      self.add_entry(value_row)
+    rows = [self._make_row(value_row) for value_row in values]
     
     # Ensure at least one empty entry
-    if not self.entries:
-      self.add_entry()
+    if not rows:
+      rows.append(self._make_row())
+    
+    # Reapplying the current values, e.g. when a saved configuration is
+    # loaded back, leaves the list as it is
+    if rows == self._data:
+      return
+    self._data = rows
+    self._values_cache = None
+    self._schedule_repaint()
   
   def clear(self):
     """Clear all entries."""
-    for entry_data in self.entries:
-      entry_data['frame'].destroy()
-    self.entries = []
+    self._data = []
+    self._values_cache = None
+    self._schedule_repaint()
   
   def reset(self):
     """Reset to default state with one empty entry."""
-    self.clear()
-    self.add_entry()
+    self._data = [self._make_row()]
+    self._values_cache = None
+    self._schedule_repaint()
+  
+  def _set_row_enabled(self, row: Dict[str, Any], enabled: bool):
+    """Enable or disable one pooled row."""
+    state = 'normal' if enabled else 'disabled'
+    for entry in row['entries']:
+      entry.configure(state=state)
+    row['remove_btn'].configure(state=state)
   
   def set_enabled(self, enabled: bool):
     """Enable or disable all entries."""
-    state = 'normal' if enabled else 'disabled'
-    for entry_data in self.entries:
-      for entry in entry_data['entries']:
-        entry.configure(state=state)
-      entry_data['remove_btn'].configure(state=state)
+    self._enabled = enabled
+    for row in self._row_pool:
+      self._set_row_enabled(row, enabled)
 
 
 class CytokineListWidget(DynamicListWidget):
@@ -246,11 +380,8 @@ class CytokineListWidget(DynamicListWidget):
       ["IL-17", "LED640"]
     ]
     
-    for default in defaults:
-      self.add_entry(default)
-    
-    # Add one empty entry for adding new cytokines
-    self.add_entry()
+    # Load them in one batch, with one empty entry for adding new cytokines
+    self.set_values(defaults + [[]])
   
   def get_cytokine_dict(self) -> Dict[str, str]:
     """Get cytokine mappings as a dictionary."""
@@ -272,11 +403,8 @@ class PlateListWidget(DynamicListWidget):
   def __init__(self, parent, callback: Optional[Callable] = None):
     super().__init__(parent, "Plate Mappings", ["Plate ID", "Species"], callback)
     
-    # Add default entry
-    self.add_entry(["plate_1", "S. pneumoniae"])
-    
-    # Add one empty entry for adding new plates
-    self.add_entry()
+    # Add default entry, and one empty entry for adding new plates
+    self.set_values([["plate_1", "S. pneumoniae"], []])
   
   def get_plate_dict(self) -> Dict[str, str]:
     """Get plate mappings as a dictionary."""
@@ -292,18 +420,47 @@ class PlateListWidget(DynamicListWidget):
     self.set_values(values)
 
 
+@dataclass(slots=True)
+class GroupRecord:
+  """Widgets and values of one experimental group."""
+  frame: ttk.LabelFrame
+  name_var: tk.StringVar
+  control_var: tk.StringVar
+  stimuli_frame: ttk.Frame
+  add_stimulus_btn: ttk.Button
+  remove_btn: ttk.Button
+  stimuli_vars: List[tk.StringVar] = field(default_factory=list)
+  # Stimulus text mirrored from the entries, read without Tk calls
+  stimuli_values: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PlateRecord:
+  """Widgets and groups of one plate."""
+  frame: ttk.LabelFrame
+  id_var: tk.StringVar
+  groups_frame: ttk.Frame
+  add_btn: ttk.Button
+  remove_btn: ttk.Button
+  groups: Dict[str, GroupRecord] = field(default_factory=dict)
+
+
 class ExperimentalConditionsWidget(ttk.Frame):
   """Complex widget for managing experimental conditions."""
   
   def __init__(self, parent, callback: Optional[Callable] = None):
     super().__init__(parent)
     self.callback = callback
-    self.conditions = {}  # plate_id -> {group_name: {control: str, stimuli: List[str]}}
+    self.conditions: Dict[str, PlateRecord] = {}  # plate_id -> plate widgets and groups
+    # Set while an idle-time canvas update is queued
+    self._repaint_pending = False
     
     self.setup_ui()
   
   def setup_ui(self):
     """Create the experimental conditions UI."""
+    _configure_styles(self)
+    
     main_frame = ttk.LabelFrame(self, text="Experimental Conditions (Optional)", padding="5")
     main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
     
@@ -327,8 +484,7 @@ class ExperimentalConditionsWidget(ttk.Frame):
     warning_label = ttk.Label(
       main_frame,
       text="⚠️ Use this only for plates with multiple control/stimuli groups. Names must EXACTLY match the data.",
-      foreground="orange",
-      font=('TkDefaultFont', 8)
+      style='Warn.TLabel'
     )
     warning_label.grid(row=1, column=0, sticky=tk.W, pady=(0, 10))
     
@@ -343,14 +499,18 @@ class ExperimentalConditionsWidget(ttk.Frame):
   
   def toggle_enabled(self):
     """Toggle the experimental conditions section."""
-    enabled = self.enabled_var.get()
-    
-    # Clear existing widgets
-    for widget in self.conditions_frame.winfo_children():
-      widget.destroy()
-    
-    if enabled:
-      self.create_conditions_interface()
+    # The interface is built once and only hidden while the section is off,
+    # rather than destroyed and rebuilt on every toggle
+    if self.enabled_var.get():
+      if not hasattr(self, 'canvas'):
+        self.create_conditions_interface()
+      
+      # Add default plate if none exist
+      if not self.conditions:
+        self.add_plate()
+      self.conditions_frame.grid()
+    else:
+      self.conditions_frame.grid_remove()
     
     if self.callback:
       self.callback()
@@ -361,8 +521,7 @@ class ExperimentalConditionsWidget(ttk.Frame):
     instructions = ttk.Label(
       self.conditions_frame,
       text="Add plates and their experimental groups. Each group needs one control and one or more stimuli.",
-      font=('TkDefaultFont', 8),
-      foreground="gray"
+      style='Hint.TLabel'
     )
     instructions.grid(row=0, column=0, sticky=tk.W, pady=(0, 10))
     
@@ -394,12 +553,8 @@ class ExperimentalConditionsWidget(ttk.Frame):
       command=self.add_plate
     )
     add_plate_btn.grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
-    
-    # Add default plate if none exist
-    if not self.conditions:
-      self.add_plate()
   
-  def add_plate(self, plate_id: str = "plate_1"):
+  def add_plate(self, plate_id: str = "plate_1", add_default_group: bool = True):
     """Add a new plate configuration."""
     plate_frame = ttk.LabelFrame(self.scrollable_frame, text=f"Plate: {plate_id}", padding="5")
     plate_frame.grid(row=len(self.conditions), column=0, sticky=(tk.W, tk.E), pady=5, padx=5)
@@ -437,39 +592,39 @@ class ExperimentalConditionsWidget(ttk.Frame):
     add_group_btn.grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
     
     # Initialize plate data
-    self.conditions[plate_id] = {
-      'frame': plate_frame,
-      'id_var': plate_id_var,
-      'groups_frame': groups_frame,
-      'groups': {},
-      'add_btn': add_group_btn,
-      'remove_btn': remove_plate_btn
-    }
+    self.conditions[plate_id] = PlateRecord(
+      frame=plate_frame,
+      id_var=plate_id_var,
+      groups_frame=groups_frame,
+      add_btn=add_group_btn,
+      remove_btn=remove_plate_btn
+    )
     
     # Bind plate ID changes
     plate_id_var.trace('w', lambda *args: self.on_plate_id_changed(plate_id, plate_id_var.get()))
     
     # Add default group
-    self.add_group(plate_id, groups_frame)
+    if add_default_group:
+      self.add_group(plate_id, groups_frame)
     
-    self.update_canvas()
+    self._schedule_repaint()
   
   def remove_plate(self, plate_id: str):
     """Remove a plate configuration."""
     if plate_id in self.conditions:
-      self.conditions[plate_id]['frame'].destroy()
+      self.conditions[plate_id].frame.destroy()
       del self.conditions[plate_id]
       self.reindex_plates()
-      self.update_canvas()
+      self._schedule_repaint()
       if self.callback:
         self.callback()
   
-  def add_group(self, plate_id: str, groups_frame: ttk.Frame):
-    """Add a new experimental group to a plate."""
+  def add_group(self, plate_id: str, groups_frame: ttk.Frame) -> Optional[GroupRecord]:
+    """Add a new experimental group to a plate and return its data."""
     if plate_id not in self.conditions:
       return
     
-    groups = self.conditions[plate_id]['groups']
+    groups = self.conditions[plate_id].groups
     group_name = f"group_{len(groups) + 1}"
     
     group_frame = ttk.LabelFrame(groups_frame, text=f"Group: {group_name}", padding="5")
@@ -495,30 +650,9 @@ class ExperimentalConditionsWidget(ttk.Frame):
     stimuli_frame.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(0, 10), pady=(5, 0))
     stimuli_frame.columnconfigure(0, weight=1)
     
-    stimuli_vars = []
-    
-    # Create the button first
+    # Create the button first; its command needs the group data below
     add_stimulus_btn = ttk.Button(stimuli_frame, text="+ Add Stimulus")
     
-    def add_stimulus():
-      stimulus_var = tk.StringVar()
-      stimulus_entry = ttk.Entry(stimuli_frame, textvariable=stimulus_var, width=20)
-      stimulus_entry.grid(row=len(stimuli_vars), column=0, sticky=(tk.W, tk.E), pady=1)
-      stimuli_vars.append(stimulus_var)
-      # Move the add button to the new position
-      add_stimulus_btn.grid(row=len(stimuli_vars), column=0, sticky=tk.W, pady=(5, 0))
-      return stimulus_var
-    
-    # Configure the button command after the function is defined
-    add_stimulus_btn.configure(command=add_stimulus)
-    
-    # Add default stimuli
-    add_stimulus().set("stimulus_1")
-    add_stimulus().set("stimulus_2")
-    
-    # Position the button initially
-    add_stimulus_btn.grid(row=len(stimuli_vars), column=0, sticky=tk.W, pady=(5, 0))
-    
     # Remove group button
     remove_group_btn = ttk.Button(
       group_frame,
@@ -528,40 +662,45 @@ class ExperimentalConditionsWidget(ttk.Frame):
     remove_group_btn.grid(row=0, column=2, padx=(10, 0))
     
     # Store group data
-    groups[group_name] = {
-      'frame': group_frame,
-      'name_var': group_name_var,
-      'control_var': control_var,
-      'stimuli_vars': stimuli_vars,
-      'stimuli_frame': stimuli_frame,
-      'add_stimulus_btn': add_stimulus_btn,
-      'remove_btn': remove_group_btn
-    }
+    groups[group_name] = group_data = GroupRecord(
+      frame=group_frame,
+      name_var=group_name_var,
+      control_var=control_var,
+      stimuli_frame=stimuli_frame,
+      add_stimulus_btn=add_stimulus_btn,
+      remove_btn=remove_group_btn
+    )
+    add_stimulus_btn.configure(command=lambda: self.add_stimulus_to_group(group_data))
     
-    self.update_canvas()
+    # Add default stimuli
+    self.add_stimulus_to_group(group_data).set("stimulus_1")
+    self.add_stimulus_to_group(group_data).set("stimulus_2")
+    
+    self._schedule_repaint()
+    return group_data
   
   def remove_group(self, plate_id: str, group_name: str):
     """Remove an experimental group."""
-    if plate_id in self.conditions and group_name in self.conditions[plate_id]['groups']:
-      group_data = self.conditions[plate_id]['groups'][group_name]
-      group_data['frame'].destroy()
-      del self.conditions[plate_id]['groups'][group_name]
+    if plate_id in self.conditions and group_name in self.conditions[plate_id].groups:
+      group_data = self.conditions[plate_id].groups[group_name]
+      group_data.frame.destroy()
+      del self.conditions[plate_id].groups[group_name]
       self.reindex_groups(plate_id)
-      self.update_canvas()
+      self._schedule_repaint()
       if self.callback:
         self.callback()
   
   def reindex_plates(self):
     """Reindex plate positions."""
     for i, (plate_id, plate_data) in enumerate(self.conditions.items()):
-      plate_data['frame'].grid(row=i, column=0, sticky=(tk.W, tk.E), pady=5, padx=5)
+      plate_data.frame.grid(row=i, column=0, sticky=(tk.W, tk.E), pady=5, padx=5)
   
   def reindex_groups(self, plate_id: str):
     """Reindex group positions for a plate."""
     if plate_id in self.conditions:
-      groups = self.conditions[plate_id]['groups']
+      groups = self.conditions[plate_id].groups
       for i, (group_name, group_data) in enumerate(groups.items()):
-        group_data['frame'].grid(row=i, column=0, sticky=(tk.W, tk.E), pady=2)
+        group_data.frame.grid(row=i, column=0, sticky=(tk.W, tk.E), pady=2)
   
   def on_plate_id_changed(self, old_id: str, new_id: str):
     """Handle plate ID changes."""
@@ -569,15 +708,31 @@ class ExperimentalConditionsWidget(ttk.Frame):
       # Update internal references
       self.conditions[new_id] = self.conditions.pop(old_id)
       # Update label
-      self.conditions[new_id]['frame'].configure(text=f"Plate: {new_id}")
+      self.conditions[new_id].frame.configure(text=f"Plate: {new_id}")
       
       if self.callback:
         self.callback()
   
+  def _schedule_repaint(self):
+    """Update the canvas once, after the current batch of changes.
+    
+    Loading a configuration adds plates and groups in a loop; each would
+    otherwise force its own layout pass.
+    """
+    if not self._repaint_pending:
+      self._repaint_pending = True
+      self.after_idle(self._do_repaint)
+  
+  def _do_repaint(self):
+    """Run the queued canvas update."""
+    self._repaint_pending = False
+    self.update_canvas()
+  
   def update_canvas(self):
     """Update the canvas scroll region."""
+    # No forced layout flush: once the plates' geometry settles, the
+    # scrollable frame's <Configure> binding updates the region again
     if hasattr(self, 'canvas'):
-      self.canvas.update_idletasks()
       self.canvas.configure(scrollregion=self.canvas.bbox("all"))
   
   def get_configuration(self) -> Dict[str, Any]:
@@ -587,14 +742,14 @@ class ExperimentalConditionsWidget(ttk.Frame):
     
     result = {}
     for plate_id, plate_data in self.conditions.items():
-      current_plate_id = plate_data['id_var'].get()
+      current_plate_id = plate_data.id_var.get()
       if current_plate_id:
         plate_config = {}
-        for group_name, group_data in plate_data['groups'].items():
-          current_group_name = group_data['name_var'].get()
+        for group_name, group_data in plate_data.groups.items():
+          current_group_name = group_data.name_var.get()
           if current_group_name:
-            control = group_data['control_var'].get()
-            stimuli = [var.get() for var in group_data['stimuli_vars'] if var.get()]
+            control = group_data.control_var.get()
+            stimuli = [value for value in group_data.stimuli_values if value]
             
             if control and stimuli:
               plate_config[current_group_name] = {
@@ -609,61 +764,73 @@ class ExperimentalConditionsWidget(ttk.Frame):
   
   def set_configuration(self, config: Dict[str, Any]):
     """Set the experimental conditions configuration."""
+    # Clear existing conditions
+    self._clear_plates()
+    
     if not config:
       self.enabled_var.set(False)
       self.toggle_enabled()
       return
     
-    self.enabled_var.set(True)
-    self.toggle_enabled()
-    
-    # Clear existing conditions
-    self.conditions.clear()
+    if not hasattr(self, 'canvas'):
+      self.create_conditions_interface()
     
     # Add plates from config
     for plate_id, plate_config in config.items():
-      self.add_plate(plate_id)
-      
-      # Clear default group
-      plate_data = self.conditions[plate_id]
-      for group_name in list(plate_data['groups'].keys()):
-        self.remove_group(plate_id, group_name)
+      # Groups come from the config, so the default group isn't created
+      self.add_plate(plate_id, add_default_group=False)
+      groups_frame = self.conditions[plate_id].groups_frame
       
       # Add groups from config
       for group_name, group_config in plate_config.items():
-        groups_frame = plate_data['groups_frame']
-        self.add_group(plate_id, groups_frame)
+        group_data = self.add_group(plate_id, groups_frame)
         
         # Set group data
-        group_data = list(plate_data['groups'].values())[-1]
-        group_data['name_var'].set(group_name)
-        group_data['control_var'].set(group_config['control'])
+        group_data.name_var.set(group_name)
+        group_data.control_var.set(group_config['control'])
         
         # Set stimuli
         stimuli = group_config['stimuli']
         for i, stimulus in enumerate(stimuli):
-          if i < len(group_data['stimuli_vars']):
-            group_data['stimuli_vars'][i].set(stimulus)
+          if i < len(group_data.stimuli_vars):
+            group_data.stimuli_vars[i].set(stimulus)
           else:
             # Add more stimulus entries if needed
             new_var = self.add_stimulus_to_group(group_data)
             new_var.set(stimulus)
+    
+    self.enabled_var.set(True)
+    self.toggle_enabled()
+  
+  def _clear_plates(self):
+    """Remove every plate from the interface."""
+    for plate_data in self.conditions.values():
+      plate_data.frame.destroy()
+    self.conditions.clear()
+    self._schedule_repaint()
   
-  def add_stimulus_to_group(self, group_data):
+  def add_stimulus_to_group(self, group_data: GroupRecord) -> tk.StringVar:
     """Add a stimulus entry to an existing group."""
     stimulus_var = tk.StringVar()
-    stimuli_frame = group_data['stimuli_frame']
+    stimuli_frame = group_data.stimuli_frame
     stimulus_entry = ttk.Entry(stimuli_frame, textvariable=stimulus_var, width=20)
-    stimulus_entry.grid(row=len(group_data['stimuli_vars']), column=0, sticky=(tk.W, tk.E), pady=1)
-    group_data['stimuli_vars'].append(stimulus_var)
+    stimulus_entry.grid(row=len(group_data.stimuli_vars), column=0, sticky=(tk.W, tk.E), pady=1)
+    
+    # Keep the entry's text in the group's value list as it is edited
+    values = group_data.stimuli_values
+    index = len(values)
+    values.append("")
+    stimulus_var.trace_add('write', lambda *args: values.__setitem__(index, stimulus_var.get()))
+    group_data.stimuli_vars.append(stimulus_var)
     
     # Move the add button
-    group_data['add_stimulus_btn'].grid(row=len(group_data['stimuli_vars']), column=0, sticky=tk.W, pady=(5, 0))
+    group_data.add_stimulus_btn.grid(row=len(group_data.stimuli_vars), column=0, sticky=tk.W, pady=(5, 0))
     
     return stimulus_var
   
   def reset(self):
     """Reset to default state."""
+    self._clear_plates()
     self.enabled_var.set(False)
     self.toggle_enabled()
   
@@ -672,17 +839,19 @@ class ExperimentalConditionsWidget(ttk.Frame):
     state = 'normal' if enabled else 'disabled'
     self.enable_cb.configure(state=state)
     
-    # Disable all child widgets if disabled
-    if not enabled:
-      for widget in self.conditions_frame.winfo_children():
-        self._disable_widget_recursive(widget)
+    # The conditions interface persists across toggles, so its widgets are
+    # switched back on as well as off
+    for widget in self.conditions_frame.winfo_children():
+      self._set_widget_state_recursive(widget, state)
   
-  def _disable_widget_recursive(self, widget):
-    """Recursively disable a widget and its children."""
-    try:
-      widget.configure(state='disabled')
-    except:
-      pass
+  def _set_widget_state_recursive(self, widget, state: str):
+    """Recursively set the state of a widget and its children."""
+    # Frames have no state of their own; skip them rather than fail on them
+    if not isinstance(widget, (ttk.Frame, ttk.LabelFrame)):
+      try:
+        widget.configure(state=state)
+      except tk.TclError:
+        pass
     
     for child in widget.winfo_children():
-      self._disable_widget_recursive(child)
\ No newline at end of file
+      self._set_widget_state_recursive(child, state)
\ No newline at end of file
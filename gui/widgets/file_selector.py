@@ -3,7 +3,29 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
+from functools import lru_cache
 import os
+import stat
+
+
+# File extensions accepted as Excel input
+_EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+
+
+@lru_cache(maxsize=32)
+def _count_excel_files(directory: str, mtime_ns: int) -> int:
+  """Count the Excel files in a directory.
+  
+  Results are keyed on the directory's modification time, which changes
+  whenever a file is added, removed or renamed in it.
+  """
+  # One pass over the entries; is_file() uses the type the listing
+  # already reports instead of a stat per entry
+  with os.scandir(directory) as entries:
+    return sum(
+      1 for entry in entries
+      if entry.name.lower().endswith(_EXCEL_EXTENSIONS) and entry.is_file()
+    )
 
 
 class FileSelector(ttk.Frame):
@@ -142,40 +164,45 @@ class FileSelector(ttk.Frame):
       return False
     
     try:
-      if not self.selected_path.exists():
+      # One stat serves the existence, type, mtime and size checks below
+      try:
+        path_stat = os.stat(self.selected_path)
+      except (FileNotFoundError, NotADirectoryError):
         self.set_status("❌", "Path does not exist", "red")
         return False
       
       if self.is_directory:
         # Validate directory contains Excel files
-        excel_files = list(self.selected_path.glob("*.xlsx")) + list(self.selected_path.glob("*.xls"))
-        if not excel_files:
+        excel_count = 0
+        if stat.S_ISDIR(path_stat.st_mode):
+          excel_count = _count_excel_files(str(self.selected_path), path_stat.st_mtime_ns)
+        if not excel_count:
           self.set_status("⚠️", f"No Excel files found in directory", "orange")
           return False
         else:
-          self.set_status("✅", f"Directory contains {len(excel_files)} Excel file(s)", "green")
+          self.set_status("✅", f"Directory contains {excel_count} Excel file(s)", "green")
           return True
       else:
         # Validate single file
-        if self.selected_path.suffix.lower() not in ['.xlsx', '.xls']:
+        if self.selected_path.suffix.lower() not in _EXCEL_EXTENSIONS:
           self.set_status("⚠️", "File is not an Excel file (.xlsx or .xls)", "orange")
           return False
         
         # Check file size
-        try:
-          file_size = self.selected_path.stat().st_size
-          if file_size == 0:
-            self.set_status("❌", "File is empty", "red")
-            return False
-          elif file_size > 100 * 1024 * 1024:  # 100MB limit
-            self.set_status("⚠️", f"Large file ({file_size / (1024*1024):.1f} MB) - may take time to process", "orange")
-            return True
-          else:
-            self.set_status("✅", f"Valid Excel file ({file_size / 1024:.0f} KB)", "green")
-            return True
-        except:
+        if not stat.S_ISREG(path_stat.st_mode):
           self.set_status("❌", "Cannot read file", "red")
           return False
+        
+        file_size = path_stat.st_size
+        if file_size == 0:
+          self.set_status("❌", "File is empty", "red")
+          return False
+        elif file_size > 100 * 1024 * 1024:  # 100MB limit
+          self.set_status("⚠️", f"Large file ({file_size / (1024*1024):.1f} MB) - may take time to process", "orange")
+          return True
+        else:
+          self.set_status("✅", f"Valid Excel file ({file_size / 1024:.0f} KB)", "green")
+          return True
     
     except Exception as e:
       self.set_status("❌", f"Validation error: {str(e)}", "red")
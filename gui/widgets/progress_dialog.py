@@ -2,12 +2,21 @@
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
+from datetime import datetime
+from typing import Optional, List
 
 
 class ProgressDialog:
   """Dialog for showing analysis progress."""
   
+  # Status messages are collected and written to the text area at most this
+  # often, rather than one Tk update per message
+  STATUS_FLUSH_MS = 50
+  
+  # Oldest status lines are dropped beyond this many, keeping inserts cheap
+  # during long analyses
+  MAX_STATUS_LINES = 500
+  
   def __init__(self, parent, title: str = "Analysis Progress"):
     self.parent = parent
     self.title = title
@@ -16,11 +25,17 @@ class ProgressDialog:
     self.status_text = None
     self.cancel_callback = None
     self.is_cancelled = False
+    # Whole percentage last drawn, so repeated updates within it are skipped
+    self._last_pct = -1
+    # Messages waiting for the next flush, and whether one is queued
+    self._pending_status: List[str] = []
+    self._flush_scheduled = False
   
   def show(self, cancel_callback: Optional[callable] = None):
     """Show the progress dialog."""
     self.cancel_callback = cancel_callback
     self.is_cancelled = False
+    self._last_pct = -1
     
     # Create dialog window
     self.dialog = tk.Toplevel(self.parent)
@@ -145,36 +160,52 @@ class ProgressDialog:
   def add_status_message(self, message: str):
     """Add a status message to the text area."""
     if self.status_text:
-      self.status_text.config(state=tk.NORMAL)
-      
-      # Add timestamp
-      from datetime import datetime
-      timestamp = datetime.now().strftime("%H:%M:%S")
-      full_message = f"[{timestamp}] {message}\n"
+      self._pending_status.append(message)
       
-      self.status_text.insert(tk.END, full_message)
-      self.status_text.see(tk.END)
-      self.status_text.config(state=tk.DISABLED)
-      
-      # Update the dialog
-      self.dialog.update_idletasks()
+      if not self._flush_scheduled:
+        self._flush_scheduled = True
+        self.dialog.after(self.STATUS_FLUSH_MS, self._flush_status)
+  
+  def _flush_status(self):
+    """Write the collected status messages in one insert."""
+    self._flush_scheduled = False
+    if not self.dialog:
+      self._pending_status.clear()
+      return
+    
+    # Messages flushed together arrive within one tick, so they share a timestamp
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    text = "".join(f"[{timestamp}] {message}\n" for message in self._pending_status)
+    self._pending_status.clear()
+    
+    self.status_text.config(state=tk.NORMAL)
+    self.status_text.insert(tk.END, text)
+    
+    # 'end-1c' sits on the empty line after the last newline
+    excess = int(self.status_text.index('end-1c').split('.')[0]) - 1 - self.MAX_STATUS_LINES
+    if excess > 0:
+      self.status_text.delete('1.0', f'{excess + 1}.0')
+    self.status_text.yview_moveto(1.0)
+    self.status_text.config(state=tk.DISABLED)
   
   def update_progress(self, value: float, status: str = ""):
     """Update the progress bar and optional status."""
     if self.progress_var:
-      self.progress_var.set(value)
-      self.progress_label.config(text=f"{value:.0f}%")
+      pct = round(value)
+      if pct != self._last_pct:
+        self._last_pct = pct
+        self.progress_var.set(value)
+        self.progress_label.config(text=f"{pct}%")
       
       if status:
         self.add_status_message(status)
-      
-      self.dialog.update_idletasks()
   
   def set_completed(self, success: bool, message: str = ""):
     """Mark the analysis as completed."""
     if success:
       self.progress_var.set(100)
       self.progress_label.config(text="100%")
+      self._last_pct = 100
       self.add_status_message("✅ Analysis completed successfully!")
       if message:
         self.add_status_message(message)
@@ -7,11 +7,18 @@ This script properly sets up the Python path and imports to launch the GUI appli
 import sys
 from pathlib import Path
 
-# Add the project root to the Python path
-project_root = Path(__file__).parent.resolve()
-sys.path.insert(0, str(project_root))
+# Add the project root to the Python path, unless it is already there (e.g.
+# when launched from the project directory)
+project_root = str(Path(__file__).parent.resolve())
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 # Now import and run the GUI
 if __name__ == "__main__":
+    # Needed so worker processes (used when reading donor files) start
+    # correctly from a frozen app bundle
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
     from gui.main import main
     main()
\ No newline at end of file
@@ -6,6 +6,7 @@ This file provides more control over the build process than command line options
 
 from PyInstaller.utils.hooks import collect_data_files
 import os
+import sys
 
 # Collect data files
 gui_resources = collect_data_files('fluorospot.gui.resources')
@@ -22,7 +23,6 @@ hiddenimports = [
   'tkinter.messagebox',
   'pandas',
   'numpy',
-  'scipy',
   'scipy.stats',
   'openpyxl',
   'yaml',
@@ -32,16 +32,9 @@ hiddenimports = [
   'dataclasses'
 ]
 
-# Excluded modules to reduce bundle size
-excludes = [
-  'matplotlib',
-  'PIL',
-  'IPython',
-  'jupyter',
-  'notebook',
-  'pytest',
-  'sphinx'
-]
+# Excluded modules to reduce bundle size, shared with the build scripts
+sys.path.insert(0, SPECPATH)
+from build_excludes import EXCLUDED_MODULES as excludes
 
 # Analysis configuration
 a = Analysis(
@@ -54,10 +47,18 @@ a = Analysis(
   hooksconfig={},
   runtime_hooks=[],
   excludes=excludes,
-  noarchive=False
+  noarchive=False,
+  optimize=2  # Byte-compile with -OO (no docstrings/asserts)
 )
 
-# Filter out unnecessary files
+# Filter out unnecessary files (bundled test suites and their data)
+def _is_test_path(dest):
+  parts = dest.replace('\\', '/').split('/')
+  return 'tests' in parts or 'test' in parts
+
+a.datas = [entry for entry in a.datas if not _is_test_path(entry[0])]
+a.binaries = [entry for entry in a.binaries if not _is_test_path(entry[0])]
+
 pyz = PYZ(a.pure, a.zipped_data, cipher=None)
 
 # Create executable
@@ -69,8 +70,8 @@ exe = EXE(
   name='FluoroSpot Analysis',
   debug=False,
   bootloader_ignore_signals=False,
-  strip=False,
-  upx=True,
+  strip=True,  # Drop debug symbols from collected binaries
+  upx=False,  # UPX breaks macOS binaries
   console=False,  # No console window
   disable_windowed_traceback=False,
   argv_emulation=False,
@@ -86,8 +87,8 @@ coll = COLLECT(
   a.binaries,
   a.zipfiles,
   a.datas,
-  strip=False,
-  upx=True,
+  strip=True,  # Drop debug symbols from collected binaries
+  upx=False,  # UPX breaks macOS binaries
   upx_exclude=[],
   name='FluoroSpot Analysis'
 )
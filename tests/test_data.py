@@ -17,49 +17,37 @@ def create_basic_test_data():
 
 def create_multi_cytokine_test_data():
   """Create test data with multiple cytokines."""
-  # IFNg data (LED490)
-  ifng_data = {
-    'Layout-Donor': ['TEST002'] * 8,
-    'Plate': ['test_plate_1'] * 8,
-    'Layout-Stimuli': ['DMSO', 'DMSO', 'DMSO', 'DMSO', 'PHA', 'PHA', 'PHA', 'PHA'],
-    'Spot Forming Units (SFU)': [10, 12, 8, 11, 50, 55, 48, 52],
-    'Analyte Secreting Population': ['LED490 Total'] * 8
-  }
-  
-  # IL-10 data (LED550)
-  il10_data = {
-    'Layout-Donor': ['TEST002'] * 8,
-    'Plate': ['test_plate_1'] * 8,
-    'Layout-Stimuli': ['DMSO', 'DMSO', 'DMSO', 'DMSO', 'PHA', 'PHA', 'PHA', 'PHA'],
-    'Spot Forming Units (SFU)': [15, 18, 12, 16, 75, 80, 70, 78],
-    'Analyte Secreting Population': ['LED550 Total'] * 8
-  }
-  
-  df1 = pd.DataFrame(ifng_data)
-  df2 = pd.DataFrame(il10_data)
-  
-  return pd.concat([df1, df2], ignore_index=True)
+  stimuli = ['DMSO', 'DMSO', 'DMSO', 'DMSO', 'PHA', 'PHA', 'PHA', 'PHA']
+  return pd.DataFrame({
+    'Layout-Donor': ['TEST002'] * 16,
+    'Plate': ['test_plate_1'] * 16,
+    'Layout-Stimuli': stimuli * 2,
+    'Spot Forming Units (SFU)': [
+      10, 12, 8, 11, 50, 55, 48, 52,  # IFNg (LED490)
+      15, 18, 12, 16, 75, 80, 70, 78  # IL-10 (LED550)
+    ],
+    'Analyte Secreting Population': ['LED490 Total'] * 8 + ['LED550 Total'] * 8
+  })
 
 
 def create_multi_donor_test_data():
   """Create test data with multiple donors."""
   donors = ['DONOR001', 'DONOR002', 'DONOR003']
-  all_data = []
-  
-  for i, donor in enumerate(donors):
-    donor_data = {
-      'Layout-Donor': [donor] * 8,
-      'Plate': ['test_plate_1'] * 8,
-      'Layout-Stimuli': ['DMSO', 'DMSO', 'DMSO', 'DMSO', 'PHA', 'PHA', 'PHA', 'PHA'],
-      'Spot Forming Units (SFU)': [
-        10 + i, 12 + i, 8 + i, 11 + i, 
-        45 + (i * 5), 50 + (i * 5), 48 + (i * 5), 52 + (i * 5)
-      ],
-      'Analyte Secreting Population': ['LED490 Total'] * 8
-    }
-    all_data.append(pd.DataFrame(donor_data))
+  # Build the columns for all donors, then the frame once
+  sfu = []
+  for i in range(len(donors)):
+    sfu.extend([
+      10 + i, 12 + i, 8 + i, 11 + i, 
+      45 + (i * 5), 50 + (i * 5), 48 + (i * 5), 52 + (i * 5)
+    ])
   
-  return pd.concat(all_data, ignore_index=True)
+  return pd.DataFrame({
+    'Layout-Donor': [donor for donor in donors for _ in range(8)],
+    'Plate': ['test_plate_1'] * 8 * len(donors),
+    'Layout-Stimuli': ['DMSO', 'DMSO', 'DMSO', 'DMSO', 'PHA', 'PHA', 'PHA', 'PHA'] * len(donors),
+    'Spot Forming Units (SFU)': sfu,
+    'Analyte Secreting Population': ['LED490 Total'] * 8 * len(donors)
+  })
 
 
 def create_experimental_conditions_test_data():
@@ -122,28 +110,16 @@ def create_numerical_stimuli_test_data():
 
 def create_multi_donor_single_plate_test_data():
   """Create test data with multiple donors in a single plate file."""
-  # Donor 1 data
-  donor1_data = {
-    'Layout-Donor': ['DONOR_A'] * 8,
-    'Plate': ['plate_1'] * 8,
-    'Layout-Stimuli': ['DMSO', 'DMSO', 'DMSO', 'DMSO', 'PHA', 'PHA', 'PHA', 'PHA'],
-    'Spot Forming Units (SFU)': [10, 12, 8, 11, 50, 55, 48, 52],
-    'Analyte Secreting Population': ['LED490 Total'] * 8
-  }
-  
-  # Donor 2 data
-  donor2_data = {
-    'Layout-Donor': ['DONOR_B'] * 8,
-    'Plate': ['plate_1'] * 8,
-    'Layout-Stimuli': ['DMSO', 'DMSO', 'DMSO', 'DMSO', 'PHA', 'PHA', 'PHA', 'PHA'],
-    'Spot Forming Units (SFU)': [15, 18, 12, 16, 75, 80, 70, 78],
-    'Analyte Secreting Population': ['LED490 Total'] * 8
-  }
-  
-  df1 = pd.DataFrame(donor1_data)
-  df2 = pd.DataFrame(donor2_data)
-  
-  return pd.concat([df1, df2], ignore_index=True)
+  return pd.DataFrame({
+    'Layout-Donor': ['DONOR_A'] * 8 + ['DONOR_B'] * 8,
+    'Plate': ['plate_1'] * 16,
+    'Layout-Stimuli': ['DMSO', 'DMSO', 'DMSO', 'DMSO', 'PHA', 'PHA', 'PHA', 'PHA'] * 2,
+    'Spot Forming Units (SFU)': [
+      10, 12, 8, 11, 50, 55, 48, 52,  # Donor 1
+      15, 18, 12, 16, 75, 80, 70, 78  # Donor 2
+    ],
+    'Analyte Secreting Population': ['LED490 Total'] * 16
+  })
 
 
 if __name__ == '__main__':
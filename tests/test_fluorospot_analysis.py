@@ -4,6 +4,7 @@ import pandas as pd
 from pathlib import Path
 from unittest.mock import patch, mock_open
 import yaml
+from dataclasses import replace
 
 import sys
 from pathlib import Path
@@ -13,10 +14,23 @@ from fluorospot_analysis import (
   AnalysisConfig,
   AnalysisResult,
   FluoroSpotAnalyzer,
-  DataLoader
+  DataLoader,
+  main
 )
 
 
+# Shared by the whole module; tests that change it work on a copy
+@pytest.fixture(scope='module')
+def sample_data():
+  return pd.DataFrame({
+    'Layout-Donor': ['D001'] * 6,
+    'Plate': ['plate_1'] * 6,
+    'Layout-Stimuli': ['DMSO', 'DMSO', 'DMSO', 'PHA', 'PHA', 'PHA'],
+    'Spot Forming Units (SFU)': [10, 12, 11, 45, 50, 48],
+    'Analyte Secreting Population': ['LED490 Total'] * 6
+  })
+
+
 class TestAnalysisConfig:
   def test_analysis_config_creation(self):
     config = AnalysisConfig(
@@ -95,6 +109,27 @@ class TestDataLoader:
     assert len(donor_data) == 1
     assert donor_data[0][0] == 'D001'
 
+  def test_read_donor_files(self, tmp_path):
+    donor_sets = [['D001'] * 2, ['D002', 'D003'], ['D004'] * 2]
+    for i, donors in enumerate(donor_sets):
+      df = pd.DataFrame({
+        'Layout-Donor': donors,
+        'Plate': ['plate_1'] * 2,
+        'Layout-Stimuli': ['DMSO', 'PHA'],
+        'Spot Forming Units (SFU)': [10, 50],
+        'Analyte Secreting Population': ['LED490 Total'] * 2
+      })
+      with pd.ExcelWriter(tmp_path / f'donor_{i}.xlsx', engine='openpyxl') as writer:
+        pd.DataFrame({'Summary': [1]}).to_excel(writer, sheet_name='Summary', index=False)
+        df.to_excel(writer, sheet_name='Data', index=False)
+    (tmp_path / '~$donor_0.xlsx').write_bytes(b'')  # Excel lock file, must be skipped
+
+    donor_data = DataLoader.load_donor_data(donor_dir=tmp_path)
+
+    assert sorted(donor_id for donor_id, _ in donor_data) == ['D001', 'D002', 'D003', 'D004']
+    for donor_id, donor_df in donor_data:
+      assert all(donor_df['Layout-Donor'] == donor_id)
+
   def test_load_donor_data_no_args_raises_error(self):
     with pytest.raises(ValueError, match="Either all_raw_data or donor_dir must be provided"):
       DataLoader.load_donor_data()
@@ -115,16 +150,6 @@ class TestFluoroSpotAnalyzer:
   def analyzer(self, config):
     return FluoroSpotAnalyzer(config)
 
-  @pytest.fixture
-  def sample_data(self):
-    return pd.DataFrame({
-      'Layout-Donor': ['D001'] * 6,
-      'Plate': ['plate_1'] * 6,
-      'Layout-Stimuli': ['DMSO', 'DMSO', 'DMSO', 'PHA', 'PHA', 'PHA'],
-      'Spot Forming Units (SFU)': [10, 12, 11, 45, 50, 48],
-      'Analyte Secreting Population': ['LED490 Total'] * 6
-    })
-
   def test_calculate_statistics_basic(self, analyzer):
     control_values = np.array([10, 12, 11])
     stim_values = np.array([45, 50, 48])
@@ -157,6 +182,49 @@ class TestFluoroSpotAnalyzer:
     assert not np.isnan(result.si)
     assert not np.isnan(result.sfc_value)
 
+  def test_calculate_statistics_poisson_tail(self, analyzer):
+    control_values = np.array([10, 12, 11])
+    stim_values = np.array([45, 50, 200])
+
+    result = analyzer._calculate_statistics(control_values, stim_values)
+
+    assert isinstance(result.poisson_p_values, list)
+    # Far in the tail 1 - cdf rounds to 0, the survival function doesn't
+    assert all(0 < p < 1e-6 for p in result.poisson_p_values)
+
+  @pytest.mark.parametrize('control_values, stim_values', [
+    ([10, 12, 11], [15, 18, 16]),
+    ([10, 30, 11], [15, 18, 90, 16]),
+    ([20], [25, 40, 31]),
+  ])
+  def test_calculate_statistics_matches_scipy(self, analyzer, control_values, stim_values):
+    from scipy import stats
+    control_values = np.array(control_values, dtype=float)
+    stim_values = np.array(stim_values, dtype=float)
+    equal_var = stats.levene(control_values, stim_values).pvalue > 0.05
+    expected = stats.ttest_ind(control_values, stim_values, equal_var=equal_var, alternative='less').pvalue
+
+    result = analyzer._calculate_statistics(control_values, stim_values)
+
+    assert result.t_test_p == pytest.approx(expected)
+
+  def test_calculate_statistics_batch_matches_single(self, analyzer):
+    pairs = [
+      (np.array([10, 12, 11]), np.array([15, 18, 16])),
+      (np.array([5, 5, 5]), np.array([9, 9, 9])),
+      (np.array([10, np.nan, 14]), np.array([30, 25, np.nan])),
+      (np.array([]), np.array([1, 2])),
+      (np.array([20]), np.array([25, 40, 31])),
+    ]
+
+    batch = analyzer._calculate_statistics_batch(pairs)
+
+    for (control_values, stim_values), result in zip(pairs, batch):
+      single = analyzer._calculate_statistics(control_values, stim_values)
+      assert result.t_test_p == pytest.approx(single.t_test_p)
+      assert result.si == pytest.approx(single.si)
+      assert result.poisson_p_values == pytest.approx(single.poisson_p_values)
+
   def test_analyze_single_donor_simple_mode(self, analyzer, sample_data):
     result_df = analyzer._analyze_single_donor('D001', sample_data)
     
@@ -178,6 +246,23 @@ class TestFluoroSpotAnalyzer:
     assert not result_df.empty
     assert 'D001' in result_df['Donor ID'].values
 
+  def test_analyze_donor_data_column_order_with_more_replicates(self, analyzer, sample_data):
+    # The second donor has four replicates per stimulus, the first only three
+    more_replicates = pd.DataFrame({
+      'Layout-Donor': ['D002'] * 8,
+      'Plate': ['plate_1'] * 8,
+      'Layout-Stimuli': ['DMSO'] * 4 + ['PHA'] * 4,
+      'Spot Forming Units (SFU)': [10, 12, 11, 9, 45, 50, 48, 52],
+      'Analyte Secreting Population': ['LED490 Total'] * 8
+    })
+
+    result_df = analyzer.analyze_donor_data([('D001', sample_data), ('D002', more_replicates)])
+
+    columns = list(result_df.columns)
+    assert columns[columns.index('Stimulus') + 1:columns.index('Average')] == [f'Replicate_{i}' for i in (1, 2, 3, 4)]
+    assert columns[columns.index('SFCs Normalized Per Million Cells') + 1:columns.index('Poisson Average')] == ['P1', 'P2', 'P3', 'P4']
+    assert columns[-1] == 'Positive Response'
+
   def test_create_result_row(self, analyzer, sample_data):
     stim_values = np.array([45, 50, 48])
     stats = AnalysisResult(0.01, 4.0, [0.001, 0.002, 0.003], 150.0)
@@ -191,6 +276,7 @@ class TestFluoroSpotAnalyzer:
     assert result_row['Cytokine'].iloc[0] == 'IFNg'
     assert result_row['Stimulus'].iloc[0] == 'PHA'
     assert result_row['SI'].iloc[0] == 4.0
+    assert [result_row[f'Replicate_{i}'].iloc[0] for i in (1, 2, 3)] == [45.0, 50.0, 48.0]
     assert 'Positive Response' in result_row.columns
 
   def test_positive_response_calculation(self, analyzer, sample_data):
@@ -212,14 +298,14 @@ class TestFluoroSpotAnalyzer:
 
   def test_analyze_plate_experimental_conditions(self, config, sample_data):
     # Test with experimental conditions
-    config.experimental_conditions = {
+    config = replace(config, experimental_conditions={
       'plate_1': {
         'test_condition': {
           'control': 'DMSO',
           'stimuli': ['PHA']
         }
       }
-    }
+    })
     analyzer = FluoroSpotAnalyzer(config)
     
     result_df = analyzer._analyze_plate('D001', 'IFNg', sample_data)
@@ -312,6 +398,30 @@ class TestIntegration:
     assert any('DMSO' in stimulus for stimulus in unique_stimuli)
     assert 'PHA' in unique_stimuli
 
+  def test_main_results_workbook_round_trip(self, tmp_path, sample_data):
+    pytest.importorskip('xlsxwriter')
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(yaml.safe_dump({
+      'cells_per_well': 200000,
+      'sfc_cutoff': 20,
+      'control_stim': 'DMSO',
+      'cytokines': {'IFNg': 'LED490'},
+      'plates': {'plate_1': 'S. pneumoniae'}
+    }))
+    donor_data = [('D001', sample_data), ('D002', sample_data.assign(**{'Layout-Donor': 'D002'}))]
+    argv = ['fluorospot_analysis.py', '-d', str(tmp_path), '-r', str(tmp_path / 'results'), '-c', str(config_path)]
+    
+    with patch.object(sys, 'argv', argv), \
+         patch.object(DataLoader, 'load_donor_data', return_value=donor_data):
+      main()
+    
+    expected = FluoroSpotAnalyzer(DataLoader.load_config(config_path)).analyze_donor_data(donor_data)
+    written = pd.read_excel(tmp_path / 'results' / 'fluorospot-results.xlsx')
+    # Every column must come back filled, not just the first one
+    assert list(written.columns) == list(expected.columns)
+    assert written.notna().sum().equals(expected.notna().sum())
+    pd.testing.assert_frame_equal(written, expected, check_dtype=False)
+
 
 if __name__ == '__main__':
   pytest.main([__file__])
\ No newline at end of file